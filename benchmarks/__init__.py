@@ -0,0 +1 @@
+# Benchmarks package - stdlib-only performance measurements (run with python -m benchmarks.<name>)
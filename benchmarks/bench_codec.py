@@ -0,0 +1,53 @@
+"""
+Note/TaskItem encode and decode throughput on a synthetic corpus.
+
+    python -m benchmarks.bench_codec [--notes 100000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import json
+import time
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+
+
+def _best_ms(func, repeat: int) -> float:
+    """Best-of-repeat wall time of func(), in ms (cyclic GC off, as in timeit)."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=3, help="tasks per note")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    notes = make_notes(args.notes, tasks_per_note=args.tasks, seed=args.seed)
+    payload = json.loads(json.dumps([n.to_dict() for n in notes]))
+
+    rows = [
+        ("to_dict", lambda: [n.to_dict() for n in notes]),
+        ("from_dict", lambda: [Note.from_dict(d) for d in payload]),
+        ("from_dict (validate)", lambda: [Note.from_dict(d, validate=True) for d in payload]),
+    ]
+    print(f"{args.notes} notes, {args.tasks} tasks each (best of {args.repeat})")
+    for name, func in rows:
+        ms = _best_ms(func, args.repeat)
+        print(f"{name:22s} {ms:8.1f} ms  {ms * 1000 / args.notes:6.2f} us/note")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Memory held by loaded notes, per note, on a synthetic corpus.
+Compared with a baseline model that has no __slots__ and shares no values (the note
+classes as they were before), loaded from the same notes.json data.
+
+    python -m benchmarks.bench_memory [--notes 100000] [--tasks 3]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+
+
+class _PlainTaskItem:
+    """Baseline: TaskItem with an instance __dict__."""
+
+    def __init__(self, text: str, checked: bool, task_id: str):
+        self.id = task_id
+        self.text = text
+        self.checked = checked
+
+
+class _PlainNote:
+    """Baseline: Note with an instance __dict__ and its own copy of every string."""
+
+    def __init__(self, data: dict):
+        self.id = data.get("id")
+        self.title = data.get("title", "New Note")
+        self.content = data.get("content", "")
+        self.color = data.get("color") or Note.COLORS[0]
+        self.tasks = [_PlainTaskItem(t.get("text", ""), t.get("checked", False), t.get("id"))
+                      for t in data.get("tasks", [])]
+        size = max(data.get("width") or Note.DEFAULT_WIDTH, data.get("height") or Note.DEFAULT_HEIGHT)
+        self.width = size
+        self.height = size
+        self.due_date = data.get("due_date")
+        self.completed = data.get("completed", False)
+        self.status = data.get("status") or (Note.STATUS_COMPLETED if self.completed else Note.STATUS_NEW)
+        self.deleted_at = data.get("deleted_at")
+
+
+def _instance_size(obj) -> int:
+    """Shallow size of an object plus its attribute dict, if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _measure(raw: str, build) -> tuple[int, list]:
+    """Bytes kept alive by build(note dict) over every note decoded from raw, and the notes."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = json.loads(raw)["notes"]
+    notes = [build(d) for d in data]
+    del data  # Only what the notes keep alive is counted
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, notes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=3, help="tasks per note")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Round-trip through JSON so every string is a fresh object, as after loading notes.json
+    raw = json.dumps({"notes": [n.to_dict() for n in make_notes(args.notes, tasks_per_note=args.tasks,
+                                                                  seed=args.seed)]})
+
+    base_total, base_notes = _measure(raw, _PlainNote)
+    base_note = base_notes[0]
+    base_task = _instance_size(base_note.tasks[0]) if base_note.tasks else 0
+    del base_notes
+    total, notes = _measure(raw, Note.from_dict)
+    note = notes[0]
+    task = _instance_size(note.tasks[0]) if note.tasks else 0
+
+    count = len(notes)
+    print(f"{count} notes, {args.tasks} tasks each")
+    print(f"{'':26}{'baseline':>10}{'current':>10}{'change':>8}")
+    for label, old, new, digits in (("total (MiB)", base_total / 2**20, total / 2**20, 1),
+                                    ("per note (bytes)", base_total / count, total / count, 0),
+                                    ("Note instance (bytes)", _instance_size(base_note), _instance_size(note), 0),
+                                    ("TaskItem instance (bytes)", base_task, task, 0)):
+        change = f"{(new - old) / old:+.0%}" if old else "-"
+        print(f"{label:26}{old:>10.{digits}f}{new:>10.{digits}f}{change:>8}")
+    print("per note includes tasks and text; baseline = no __slots__, no shared or interned strings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Columnar NoteStore vs loops over Note objects on a synthetic corpus.
+
+    python -m benchmarks.bench_note_store [--notes 100000] [--repeat 20]
+"""
+
+import argparse
+import time
+from collections import Counter
+from datetime import date
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+from services.note_store import NoteStore, due_ordinal
+
+
+def _time(func, repeat: int) -> tuple[float, object]:
+    """Return (mean ms per call, last result)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    notes = make_notes(args.notes, seed=args.seed)
+    start = time.perf_counter()
+    store = NoteStore()
+    store.rebuild(notes)
+    print(f"build: {(time.perf_counter() - start) * 1000:.0f} ms for {len(store)} notes")
+
+    q1, q2 = date(2026, 4, 1), date(2026, 6, 30)
+    cases = [
+        ("count by status",
+         lambda: store.count_by_status(),
+         lambda: Counter(n.status for n in notes)),
+        ("count by color",
+         lambda: store.count_by_color(),
+         lambda: Counter(n.color for n in notes)),
+        ("due days (one month)",
+         lambda: store.due_days(2026, 5),
+         lambda: {int(n.due_date[8:]) for n in notes if n.due_date and n.due_date.startswith("2026-05-")}),
+        ("due histogram (quarter)",
+         lambda: store.due_histogram(q1, date(2026, 7, 1)),
+         lambda: Counter(n.due_date for n in notes if n.due_date and "2026-04-01" <= n.due_date <= "2026-06-30")),
+        ("filter in progress + color + due range",
+         lambda: store.filter_ids(status=Note.STATUS_IN_PROGRESS, color=Note.COLORS[2], due_from=q1, due_to=q2),
+         lambda: [n.id for n in notes if n.status == Note.STATUS_IN_PROGRESS and n.color == Note.COLORS[2]
+                  and q1.toordinal() <= due_ordinal(n.due_date) <= q2.toordinal()]),
+    ]
+    for name, columnar, naive in cases:
+        store_ms, store_result = _time(columnar, args.repeat)
+        naive_ms, naive_result = _time(naive, args.repeat)
+        assert len(store_result) == len(naive_result), name
+        print(f"{name:40s} store {store_ms:8.2f} ms   objects {naive_ms:8.2f} ms   "
+              f"({naive_ms / store_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Trigram index vs naive substring scan on a synthetic corpus.
+
+    python -m benchmarks.bench_trigram [--notes 100000] [--queries 200]
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.corpus import TICKET_PREFIXES, make_notes
+from services.trigram_index import TrigramIndex
+
+
+def _time_queries(search, queries: list[str]) -> tuple[float, int]:
+    """Return (mean ms per query, total hits)."""
+    hits = 0
+    start = time.perf_counter()
+    for q in queries:
+        hits += len(search(q))
+    return (time.perf_counter() - start) * 1000 / len(queries), hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    notes = make_notes(args.notes, seed=args.seed)
+    rng = random.Random(args.seed + 1)
+
+    start = time.perf_counter()
+    index = TrigramIndex()
+    index.rebuild(notes)
+    print(f"build: {time.perf_counter() - start:.2f} s for {len(index)} notes")
+
+    # Naive baseline: folded text prepared up front, so only the scan itself is timed
+    texts = [(n.id, TrigramIndex.note_text(n)) for n in notes]
+
+    def naive(q: str) -> list[str]:
+        q = q.casefold()
+        return [note_id for note_id, text in texts if q in text]
+
+    fragments = [f"{rng.choice(TICKET_PREFIXES).lower()}-{rng.randrange(100000):05d}"[2:8]
+                 for _ in range(args.queries)]
+    words = [n.content.split()[rng.randrange(10)][:5] for n in rng.sample(notes, args.queries)]
+    typos = []
+    for phrase in (" ".join(n.title.split()[:2]) for n in rng.sample(notes, args.queries)):
+        i = rng.randrange(len(phrase))
+        typos.append(phrase[:i] + "#" + phrase[i + 1:])
+
+    for name, queries in (("ticket fragment", fragments), ("word fragment", words)):
+        naive_ms, naive_hits = _time_queries(naive, queries)
+        index_ms, index_hits = _time_queries(lambda q: index.search(q, limit=None), queries)
+        assert naive_hits == index_hits, (name, naive_hits, index_hits)
+        print(f"{name:16s} naive {naive_ms:8.2f} ms  trigram {index_ms:8.2f} ms  "
+              f"speedup {naive_ms / max(index_ms, 1e-9):6.1f}x  ({index_hits} hits)")
+    fuzzy_ms, fuzzy_hits = _time_queries(lambda q: index.fuzzy_search(q, max_errors=1, limit=50), typos)
+    print(f"{'fuzzy (1 typo)':16s} trigram {fuzzy_ms:8.2f} ms  ({fuzzy_hits} hits)")
+
+
+if __name__ == "__main__":
+    main()
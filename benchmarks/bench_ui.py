@@ -0,0 +1,213 @@
+"""
+Headless UI harness: drives MainWindow through typical interactions and records
+per-interaction latency and Tk widget counts.
+
+    xvfb-run python -m benchmarks.bench_ui [--notes 200] [--keystrokes 60] [--output ui.json]
+                                           [--check-leaks 10]
+
+Needs a display (Xvfb on Linux); --withdraw keeps the root window unmapped, which
+skips real drawing and geometry. Runs against a temporary APPDATA. --check-leaks N
+repopulates the grid N more times after the scenarios and exits with status 1 if
+widgets, Tcl variables/commands or Python objects kept growing.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+from benchmarks.corpus import make_notes
+
+
+def _stats(samples: list[float]) -> dict:
+    """Count, median, p95 (nearest rank) and max of latencies in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(samples),
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[math.ceil(len(ordered) * 0.95) - 1], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class UiHarness:
+    """Owns one MainWindow and measures scripted interactions against it."""
+
+    def __init__(self, window):
+        from services.memory_probe import MemoryProbe
+
+        self.window = window
+        self.root = window._root
+        self.probe = MemoryProbe(self.root)
+        self.results: dict[str, dict] = {}
+        self.widget_counts: dict[str, int] = {}
+
+    def settle(self, until=None, timeout: float = 120.0) -> None:
+        """Process events until idle (and until() is true, if given)."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            self.root.update()
+            if until is None or until():
+                break
+            if time.perf_counter() > deadline:
+                raise TimeoutError("UI did not settle")
+        self.root.update_idletasks()
+
+    def populated(self) -> bool:
+        w = self.window
+        return w._wall.active or (not w._pending_notes and not w._skeletons)
+
+    def count_widgets(self, label: str) -> None:
+        self.widget_counts[label] = self.probe.widget_count()
+
+    def measure(self, name: str, action, repeat: int = 1, until=None) -> None:
+        """Time action() plus the event processing it triggers, repeat times."""
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            action()
+            self.settle(until)
+            samples.append((time.perf_counter() - start) * 1000)
+        self.results[name] = _stats(samples)
+
+    def first_card(self):
+        return next(iter(self.window._note_cards.values()))
+
+    # Scenarios
+
+    def type_content(self, keystrokes: int) -> None:
+        card = self.first_card()
+        card._upgrade(focus_content=True)
+        self.settle()
+        self.count_widgets("after_upgrade")
+        self.measure("type_content_keystroke",
+                     lambda: card.content_edit.insert("end", "x"), repeat=keystrokes)
+        self.count_widgets("after_typing")
+
+    def type_title(self, keystrokes: int) -> None:
+        card = self.first_card()
+        card._upgrade()
+        self.measure("type_title_keystroke", lambda: card.title_edit.insert("end", "y"), repeat=keystrokes)
+
+    def resize(self, steps: int) -> None:
+        card = self.first_card()
+        card._upgrade()
+        self.settle()
+        card._on_resize_start(SimpleNamespace(x_root=0, y_root=0))
+        offsets = itertools.count(4, 4)  # Drag right/down a few pixels per motion event
+        self.measure("resize_drag_step", lambda: card._on_resize_drag(
+            SimpleNamespace(x_root=(d := next(offsets)), y_root=d)), repeat=steps)
+        self.measure("resize_commit", lambda: card._on_resize_end(None))
+
+    def add_delete(self, repeat: int) -> None:
+        vm = self.window.viewmodel
+        self.measure("add_note", self.window._on_add_note, repeat=repeat, until=self.populated)
+        self.count_widgets("after_add")
+        self.measure("delete_note", lambda: self.window._on_delete_note(vm.notes[-1]),
+                     repeat=repeat, until=self.populated)
+        self.count_widgets("after_delete")
+
+    def scroll(self, steps: int) -> None:
+        canvas = self.window._canvas
+        self.measure("scroll_page", lambda: canvas.yview_scroll(1, "pages"), repeat=steps)
+        canvas.yview_moveto(0)
+
+    def calendar(self, months: int) -> None:
+        cal = self.window._calendar
+        self.measure("calendar_next_month", cal._next_month, repeat=months)
+        self.measure("calendar_prev_month", cal._prev_month, repeat=months)
+        self.count_widgets("after_calendar")
+
+    def wall(self, steps: int) -> None:
+        self.measure("wall_toggle_on", self.window._on_toggle_wall)
+        self.count_widgets("wall")
+        self.scroll(steps)
+        self.results["wall_scroll_page"] = self.results.pop("scroll_page")
+        self.measure("wall_toggle_off", self.window._on_toggle_wall, until=self.populated)
+
+    def check_leaks(self, rounds: int) -> list[str]:
+        """Repopulate rounds times; return what grew between the first and the last round."""
+        def repopulate():
+            self.window._populate_notes()
+            self.settle(self.populated)
+
+        repopulate()  # Warm-up: caches and styles settle on the first rounds
+        before = self.probe.snapshot("before")
+        for _ in range(rounds):
+            repopulate()
+        after = self.probe.snapshot("after")
+        return self.probe.growth(before, after)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--notes", type=int, default=200)
+    parser.add_argument("--keystrokes", type=int, default=60)
+    parser.add_argument("--steps", type=int, default=20, help="resize/scroll/calendar steps")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--withdraw", action="store_true", help="keep the root window unmapped")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--check-leaks", type=int, metavar="N", default=0,
+                        help="repopulate N times and fail if memory keeps growing")
+    args = parser.parse_args()
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No DISPLAY: run under Xvfb, e.g. xvfb-run python -m benchmarks.bench_ui")
+
+    with tempfile.TemporaryDirectory(prefix="sticky-ui-bench-") as workdir:
+        os.environ["APPDATA"] = workdir
+        # Imported after APPDATA is set so storage stays in the temporary directory
+        from services.storage import StorageService
+        from viewmodels.main_viewmodel import MainViewModel
+        from views.main_window import MainWindow
+
+        StorageService().save_notes(make_notes(args.notes, seed=args.seed))
+        started_at = time.perf_counter()
+        viewmodel = MainViewModel()
+        window = MainWindow(viewmodel, started_at=started_at)
+        if args.withdraw:
+            window._root.withdraw()
+        harness = UiHarness(window)
+        try:
+            harness.settle(harness.populated)
+            harness.results["populate"] = _stats([(time.perf_counter() - started_at) * 1000])
+            harness.count_widgets("populated")
+            harness.type_content(args.keystrokes)
+            harness.type_title(args.keystrokes)
+            harness.resize(args.steps)
+            harness.add_delete(max(1, args.steps // 4))
+            harness.scroll(args.steps)
+            harness.calendar(args.steps)
+            harness.wall(args.steps)
+            leaks = harness.check_leaks(args.check_leaks) if args.check_leaks else []
+        finally:
+            window._root.destroy()
+
+    print(f"{args.notes} notes{' (withdrawn root)' if args.withdraw else ''}")
+    for name, s in harness.results.items():
+        print(f"  {name:24s} n={s['count']:<4d} median {s['median_ms']:9.2f} ms  "
+              f"p95 {s['p95_ms']:9.2f} ms  max {s['max_ms']:9.2f} ms")
+    print("  widgets: " + ", ".join(f"{k}={v}" for k, v in harness.widget_counts.items()))
+    if window.startup_timings:
+        print("  startup: " + ", ".join(f"{k}={v:.0f}" for k, v in window.startup_timings.items()))
+    if args.output:
+        report = {"notes": args.notes, "withdrawn": args.withdraw, "results": harness.results,
+                  "widget_counts": harness.widget_counts, "startup_timings": window.startup_timings}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    if leaks:
+        print(f"Growth after {args.check_leaks} repopulates:")
+        for line in leaks:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Synthetic note corpora for benchmarks. Deterministic for a given seed.
+"""
+
+import random
+import string
+
+from models.note import Note
+from models.task_item import TaskItem
+
+TICKET_PREFIXES = ["PROJ", "OPS", "BUG", "WEB", "DATA"]
+
+
+def make_vocabulary(size: int = 5000, seed: int = 0) -> list[str]:
+    """Random lowercase pseudo-words of 3-10 letters."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(size)]
+
+
+def make_notes(
+    count: int,
+    content_words: int = 40,
+    tasks_per_note: int = 3,
+    ticket_ratio: float = 0.3,
+    seed: int = 0,
+) -> list[Note]:
+    """Build count notes with random titles, content, tasks, colors, statuses and due dates.
+    About ticket_ratio of the notes mention a ticket number such as "PROJ-40213".
+    """
+    rng = random.Random(seed)
+    words = make_vocabulary(seed=seed)
+    statuses = [value for value, _ in Note.STATUS_CHOICES]
+    notes = []
+    for i in range(count):
+        content = rng.choices(words, k=content_words)
+        if rng.random() < ticket_ratio:
+            content.insert(rng.randrange(len(content) + 1),
+                           f"{rng.choice(TICKET_PREFIXES)}-{rng.randrange(100000):05d}")
+        tasks = [TaskItem(text=" ".join(rng.choices(words, k=4)), checked=rng.random() < 0.5,
+                          task_id=f"t{i}x{j}")
+                 for j in range(tasks_per_note)]
+        status = rng.choice(statuses)
+        due = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() < 0.4 else None
+        notes.append(Note(
+            title=" ".join(rng.choices(words, k=3)),
+            content=" ".join(content),
+            color=rng.choice(Note.COLORS),
+            note_id=f"n{i:07d}",
+            tasks=tasks,
+            due_date=due,
+            completed=status == Note.STATUS_COMPLETED,
+            status=status,
+        ))
+    return notes
@@ -0,0 +1,169 @@
+"""
+Storage, model and viewmodel benchmarks on synthetic corpora, with JSON results.
+
+    python -m benchmarks.suite [--sizes 1000 10000 100000] [--content-words 40] [--tasks 3]
+                               [--output results.json] [--compare baseline.json]
+
+Runs against a temporary APPDATA, so the real notes.json is never touched. With
+--compare, prints the change against an earlier --output file and exits with status 1
+if any benchmark got slower (or used more memory) than --threshold allows.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.corpus import make_notes
+
+
+def _timings(func, repeat: int, setup=None) -> dict:
+    """Run func repeat times (after optional per-run setup); return timing stats in ms."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "repeat": repeat,
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def _memory(func) -> dict:
+    """Peak traced memory while running func, and memory still held by its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - base, "retained_bytes": retained - base}
+
+
+def run_size(count: int, content_words: int, tasks: int, seed: int, workdir: Path) -> list[dict]:
+    """All benchmarks for one corpus size."""
+    # Imported here so the temporary APPDATA is in place before anything touches storage
+    from models.note import Note
+    from services import json_codec
+    from services.storage import StorageService
+    from viewmodels.main_viewmodel import MainViewModel
+
+    notes = make_notes(count, content_words=content_words, tasks_per_note=tasks, seed=seed)
+    payload = json_codec.loads(json_codec.dumps([n.to_dict() for n in notes]))
+    storage = StorageService()
+    storage.save_notes(notes)
+    repeat = max(3, min(50, 20_000 // count))
+    export_path = workdir / f"export-{count}.json"
+    results = []
+
+    def record(name: str, stats: dict) -> None:
+        results.append({"benchmark": name, "notes": count, **stats})
+        detail = (f"median {stats['median_ms']:10.2f} ms" if "median_ms" in stats
+                  else f"peak {stats['peak_bytes'] / 2**20:8.1f} MiB, "
+                       f"retained {stats['retained_bytes'] / 2**20:8.1f} MiB")
+        print(f"  {name:28s} {detail}", flush=True)
+
+    record("model.to_dict", _timings(lambda: [n.to_dict() for n in notes], repeat))
+    record("model.from_dict", _timings(lambda: [Note.from_dict(d) for d in payload], repeat))
+    record("storage.save_notes", _timings(lambda: storage.save_notes(notes), repeat))
+    record("storage.load_notes", _timings(storage.load_notes, repeat))
+
+    vm = None
+
+    def start_viewmodel():
+        nonlocal vm
+        vm = MainViewModel()
+
+    record("viewmodel.startup", _timings(start_viewmodel, repeat))
+    record("viewmodel.export_to_file", _timings(lambda: vm.export_to_file(str(export_path)), repeat))
+
+    added = []
+    record("viewmodel.add_note", _timings(lambda: added.append(vm.add_note()), repeat))
+    target = vm.notes[len(vm.notes) // 2]
+
+    def edit():
+        target.content += " edited"
+
+    record("viewmodel.update_note", _timings(lambda: vm.update_note(target, {"content"}), repeat, setup=edit))
+    record("viewmodel.delete_note", _timings(lambda: vm.delete_note(added.pop()), repeat))
+
+    record("memory.load_notes", _memory(storage.load_notes))
+    return results
+
+
+def compare(results: list[dict], baseline_path: Path, threshold: float) -> bool:
+    """Print each benchmark against the baseline file; return True if none regressed."""
+    baseline = {(r["benchmark"], r["notes"]): r for r in json.loads(baseline_path.read_text())["results"]}
+    ok = True
+    print(f"\nCompared with {baseline_path} (threshold {threshold:.0%}):")
+    for r in results:
+        old = baseline.get((r["benchmark"], r["notes"]))
+        if old is None:
+            continue
+        key = "median_ms" if "median_ms" in r else "peak_bytes"
+        ratio = r[key] / old[key] if old[key] else 1.0
+        regressed = ratio > 1 + threshold
+        ok = ok and not regressed
+        print(f"  {r['benchmark']:28s} {r['notes']:>7d}  {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--content-words", type=int, default=40, help="words of content per note")
+    parser.add_argument("--tasks", type=int, default=3, help="tasks per note")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="earlier --output file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="sticky-bench-") as workdir:
+        os.environ["APPDATA"] = workdir
+        from services import json_codec
+
+        results = []
+        for count in args.sizes:
+            print(f"{count} notes:", flush=True)
+            results.extend(run_size(count, args.content_words, args.tasks, args.seed, Path(workdir)))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "json_backend": json_codec.BACKEND,
+            "content_words": args.content_words,
+            "tasks": args.tasks,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.output}")
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
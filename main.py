@@ -3,21 +3,38 @@ Sticky Notes - A modern, lightweight desktop sticky notes application.
 Uses tkinter (built-in) - no pip install required.
 """
 
+import logging
 import sys
+import time
 import tkinter as tk
 from tkinter import font as tkfont
 
+from services import metrics, profiling
 from viewmodels.main_viewmodel import MainViewModel
 from views.main_window import MainWindow
 
 
-def main() -> None:
+def run_app(started_at: float) -> None:
     viewmodel = MainViewModel()
-    window = MainWindow(viewmodel)
+    window = MainWindow(viewmodel, started_at=started_at)
     default_font = tkfont.nametofont("TkDefaultFont")
     default_font.configure(family="Segoe UI", size=10)
     window.run()
 
+
+def main() -> None:
+    started_at = time.perf_counter()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    # STICKY_PROFILE=session profiles the whole run; =calls profiles viewmodel/storage entry points
+    if profiling.MODE == "session":
+        profiling.profiler.run("session", run_app, started_at)
+    else:
+        run_app(started_at)
+    if profiling.MODE == "calls":
+        profiling.profiler.dump_calls()
+    if metrics.ENABLED:
+        metrics.metrics.dump()
+
     sys.exit(0)
 
 
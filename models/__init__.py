@@ -1,5 +1,6 @@
 # Models package - Note and TaskItem data structures
+from .ids import IdAllocator, new_id, new_ids
 from .task_item import TaskItem
 from .note import Note
 
-__all__ = ["TaskItem", "Note"]
+__all__ = ["IdAllocator", "new_id", "new_ids", "TaskItem", "Note"]
@@ -0,0 +1,73 @@
+"""
+Id allocation - Short, time-sortable ids for notes and tasks.
+Ids are 12 lowercase base32hex characters (0-9, a-v), so sorting them as strings
+sorts them by creation time.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Container
+
+EPOCH_MS = 1577836800000  # 2020-01-01T00:00:00Z
+TIME_BITS = 42  # Milliseconds since EPOCH_MS (lasts until ~2159)
+SEQ_BITS = 18  # Sequence within a millisecond
+ID_LENGTH = (TIME_BITS + SEQ_BITS) // 5
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuv"  # base32hex: ASCII order matches value order
+_PAIRS = [a + b for a in _DIGITS for b in _DIGITS]  # 10-bit value -> two digits
+
+
+class IdAllocator:
+    """Allocates monotonic ids: a millisecond timestamp followed by a sequence number.
+
+    Each millisecond's sequence starts at a random point in the lower half of its range,
+    so ids made on different machines at the same moment are unlikely to meet; if the
+    sequence runs out the timestamp is advanced instead. Thread-safe.
+    """
+
+    def __init__(self, rng: random.Random | None = None):
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._last = 0  # Last value handed out (timestamp << SEQ_BITS | sequence)
+
+    def _reserve(self, count: int) -> int:
+        """Reserve count consecutive values and return the first."""
+        with self._lock:
+            now = (time.time_ns() // 1_000_000 - EPOCH_MS) << SEQ_BITS
+            if now > self._last:
+                first = now | self._rng.getrandbits(SEQ_BITS - 1)
+            else:
+                first = self._last + 1  # Same millisecond (or clock went back): continue
+            self._last = first + count - 1
+            return first
+
+    @staticmethod
+    def encode(value: int) -> str:
+        """Fixed-width, order-preserving text form of a 60-bit value."""
+        p = _PAIRS
+        return (p[value >> 50] + p[value >> 40 & 1023] + p[value >> 30 & 1023]
+                + p[value >> 20 & 1023] + p[value >> 10 & 1023] + p[value & 1023])
+
+    def new_id(self, taken: Container[str] | None = None) -> str:
+        """Return a new id, skipping any that are already in taken."""
+        while True:
+            note_id = self.encode(self._reserve(1))
+            if taken is None or note_id not in taken:
+                return note_id
+
+    def new_ids(self, count: int, taken: Container[str] | None = None) -> list[str]:
+        """Return count new ids in ascending order, skipping any already in taken."""
+        first = self._reserve(count)
+        encode = self.encode
+        ids = [encode(value) for value in range(first, first + count)]
+        if taken is not None:
+            ids = [note_id for note_id in ids if note_id not in taken]
+            while len(ids) < count:
+                ids.append(self.new_id(taken))  # Later values, so order is kept
+        return ids
+
+
+_allocator = IdAllocator()
+new_id = _allocator.new_id
+new_ids = _allocator.new_ids
@@ -2,12 +2,20 @@
 Note model - Represents a single sticky note with title, content, tasks, and color.
 """
 
+import sys
+
+from .ids import new_id
+from .schema import Field, compile_codec
 from .task_item import TaskItem
 
 
 class Note:
     """A sticky note containing title, content, color, and checklist items."""
 
+    # Slotted: no per-instance __dict__, which dominates memory on large boards
+    __slots__ = ("id", "title", "content", "color", "tasks", "width", "height",
+                 "due_date", "completed", "status", "deleted_at")
+
     # Task status options (display labels and internal values)
     STATUS_NEW = "new"
     STATUS_IN_PROGRESS = "in_progress"
@@ -38,9 +46,34 @@ class Note:
         "#F5F5F5",  # Light grey
     ]
 
+    # Palette colors and statuses map to these shared string objects, so loaded notes
+    # don't each hold their own copy (see _shared)
+    _SHARED_VALUES = {value: value for value in [*COLORS, *(s for s, _ in STATUS_CHOICES)]}
+
     DEFAULT_WIDTH = 280
     DEFAULT_HEIGHT = 280
 
+    # Stored fields, in dict order; to_dict/from_dict are generated from these.
+    # Notes are square: width and height both load as the larger of the two.
+    FIELDS = (
+        Field("id", types=(str, type(None)), decode="id or new_id()"),
+        Field("title", "New Note"),
+        Field("content", ""),
+        Field("color", COLORS[0], types=(str, type(None)), decode="cls._shared(color or cls.COLORS[0])"),
+        Field("tasks", [], types=(list,), items=TaskItem),
+        Field("width", DEFAULT_WIDTH, types=(int, float, type(None)),
+              decode="max(width or cls.DEFAULT_WIDTH, height or cls.DEFAULT_HEIGHT)", check="v is None or v > 0"),
+        Field("height", DEFAULT_HEIGHT, types=(int, float, type(None)),
+              decode="max(width or cls.DEFAULT_WIDTH, height or cls.DEFAULT_HEIGHT)", check="v is None or v > 0"),
+        Field("due_date", None, types=(str, type(None)), decode="intern(due_date) if due_date else due_date"),
+        Field("completed", False, types=(bool,)),
+        Field("status", None, types=(str, type(None)),
+              decode="cls._shared(status) if status is not None else "
+                     "(cls.STATUS_COMPLETED if completed else cls.STATUS_NEW)"),
+        Field("deleted_at", None, types=(int, float, type(None))),
+    )
+    _codec = compile_codec(FIELDS, {"new_id": new_id, "intern": sys.intern})
+
     def __init__(
         self,
         title: str = "New Note",
@@ -53,26 +86,34 @@ class Note:
         due_date: str | None = None,
         completed: bool = False,
         status: str | None = None,
+        deleted_at: float | None = None,
     ):
         self.id = note_id or self._generate_id()
         self.title = title
         self.content = content
-        self.color = color or self.COLORS[0]
+        self.color = self._shared(color or self.COLORS[0])
         self.tasks = tasks or []
         self.width = width if width is not None else self.DEFAULT_WIDTH
         self.height = height if height is not None else self.DEFAULT_HEIGHT
-        self.due_date = due_date  # ISO date "YYYY-MM-DD" or None
+        # ISO date "YYYY-MM-DD" or None; interned, since many notes share a due date
+        self.due_date = sys.intern(due_date) if due_date else due_date
         self.completed = completed
         # status: new | in_progress | completed | deferred (default New)
         if status is not None:
-            self.status = status
+            self.status = self._shared(status)
         else:
             self.status = self.STATUS_COMPLETED if completed else self.STATUS_NEW
+        # Deletion time (epoch seconds) while the note is in the trash, else None
+        self.deleted_at = deleted_at
+
+    @classmethod
+    def _shared(cls, value: str) -> str:
+        """The shared object for a palette color or status; other values unchanged."""
+        return cls._SHARED_VALUES.get(value, value)
 
     def _generate_id(self) -> str:
-        """Generate a unique ID for the note."""
-        import uuid
-        return str(uuid.uuid4())[:8]
+        """Generate a unique, time-sortable ID for the note."""
+        return new_id()
 
     def cycle_color(self) -> str:
         """Cycle to the next color and return it."""
@@ -82,40 +123,11 @@ class Note:
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "content": self.content,
-            "color": self.color,
-            "tasks": [t.to_dict() for t in self.tasks],
-            "width": self.width,
-            "height": self.height,
-            "due_date": self.due_date,
-            "completed": self.completed,
-            "status": self.status,
-        }
+        return self._codec.encode(self)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Note":
-        """Deserialize from dictionary."""
-        tasks_data = data.get("tasks", [])
-        tasks = [TaskItem.from_dict(t) for t in tasks_data]
-        w = data.get("width", cls.DEFAULT_WIDTH)
-        h = data.get("height", cls.DEFAULT_HEIGHT)
-        size = max(w or cls.DEFAULT_WIDTH, h or cls.DEFAULT_HEIGHT)
-        completed = data.get("completed", False)
-        status = data.get("status")
-        if status is None:
-            status = cls.STATUS_COMPLETED if completed else cls.STATUS_NEW
-        return cls(
-            title=data.get("title", "New Note"),
-            content=data.get("content", ""),
-            color=data.get("color", cls.COLORS[0]),
-            note_id=data.get("id"),
-            tasks=tasks,
-            width=size,
-            height=size,
-            due_date=data.get("due_date"),
-            completed=completed,
-            status=status,
-        )
+    def from_dict(cls, data: dict, validate: bool = False) -> "Note":
+        """Deserialize from dictionary. With validate, malformed data raises SchemaError."""
+        if validate:
+            return cls._codec.decode_checked(data, cls)
+        return cls._codec.decode(data, cls)
@@ -0,0 +1,137 @@
+"""
+Schema - Field declarations for the models and the encode/decode functions generated from them.
+Each model declares its stored fields once; to_dict/from_dict run straight-line code
+compiled from that declaration (no per-field loops or keyword constructors at runtime).
+"""
+
+from typing import Callable, NamedTuple
+
+# Version of the stored notes format, written as "schema_version" next to "notes".
+# Files without the field are version 0, which has the same layout as version 1.
+# Version 2 adds deleted_at to notes (deleted notes are kept as tombstones).
+SCHEMA_VERSION = 2
+
+
+class SchemaError(ValueError):
+    """Stored data does not match the schema (validation mode only)."""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+        self.message = message
+
+
+class Field(NamedTuple):
+    """One stored attribute. The dict key and the attribute name are the same.
+
+    decode: expression for the attribute value; may use any field's raw value by name,
+    `cls` and names from the codec namespace. Defaults to the raw value.
+    items: model class for a list of nested objects (encoded/decoded with its codec).
+    types: accepted raw types, checked in validation mode.
+    check: extra validation expression over the raw value `v` (validation mode only).
+    """
+
+    name: str
+    default: object = None
+    types: tuple[type, ...] = (str,)
+    decode: str | None = None
+    items: type | None = None
+    check: str | None = None
+
+
+class Codec(NamedTuple):
+    encode: Callable[[object], dict]
+    decode: Callable[[dict, type], object]
+    decode_checked: Callable[..., object]  # (data, cls, path=None); raises SchemaError
+
+
+def _type_names(types: tuple[type, ...]) -> str:
+    return " or ".join("null" if t is type(None) else t.__name__ for t in types)
+
+
+def _decoder_source(fields: tuple[Field, ...], checked: bool) -> str:
+    lines = [f"def decode(data, cls{', path=None' if checked else ''}):"]
+    if checked:
+        lines += ["    if path is None:",
+                  "        path = cls.__name__",
+                  "    if not isinstance(data, dict):",
+                  "        raise SchemaError(path, 'expected an object, got ' + type(data).__name__)"]
+    lines.append("    get = data.get")
+    for i, f in enumerate(fields):
+        lines.append(f"    {f.name} = get({f.name!r}, default_{i})")
+        if checked:
+            lines += [f"    if not isinstance({f.name}, types_{i}):",
+                      f"        raise SchemaError(path + '.{f.name}', "
+                      f"'expected {_type_names(f.types)}, got ' + type({f.name}).__name__)"]
+            if f.check:
+                lines += [f"    v = {f.name}",
+                          f"    if not ({f.check}):",
+                          f"        raise SchemaError(path + '.{f.name}', 'invalid value ' + repr(v))"]
+    lines.append("    obj = cls.__new__(cls)")
+    for i, f in enumerate(fields):
+        if f.items is not None:
+            if checked:
+                value = (f"[decode_checked_{i}(x, item_cls_{i}, path + '.{f.name}[' + str(n) + ']') "
+                         f"for n, x in enumerate({f.name})]")
+            else:
+                value = f"[decode_{i}(x, item_cls_{i}) for x in {f.name}]"
+        else:
+            value = f.decode or f.name
+        lines.append(f"    obj.{f.name} = {value}")
+    lines.append("    return obj")
+    return "\n".join(lines)
+
+
+def _encoder_source(fields: tuple[Field, ...]) -> str:
+    items = []
+    for i, f in enumerate(fields):
+        if f.items is not None:
+            items.append(f"{f.name!r}: [encode_{i}(x) for x in obj.{f.name}]")
+        else:
+            items.append(f"{f.name!r}: obj.{f.name}")
+    return "def encode(obj):\n    return {" + ", ".join(items) + "}"
+
+
+def compile_codec(fields: tuple[Field, ...], namespace: dict | None = None) -> Codec:
+    """Generate encode/decode functions for a model from its field declarations.
+    Nested `items` classes must already have a `_codec` attribute.
+    """
+    env = {"SchemaError": SchemaError, **(namespace or {})}
+    for i, f in enumerate(fields):
+        env[f"default_{i}"] = f.default
+        env[f"types_{i}"] = f.types
+        if f.items is not None:
+            env[f"item_cls_{i}"] = f.items
+            env[f"encode_{i}"] = f.items._codec.encode
+            env[f"decode_{i}"] = f.items._codec.decode
+            env[f"decode_checked_{i}"] = f.items._codec.decode_checked
+    functions = {}
+    for name, source in (("encode", _encoder_source(fields)),
+                         ("decode", _decoder_source(fields, checked=False)),
+                         ("decode_checked", _decoder_source(fields, checked=True))):
+        scope: dict = {}
+        exec(compile(source, f"<codec {name}>", "exec"), env, scope)
+        functions[name] = scope["encode" if name == "encode" else "decode"]
+    return Codec(**functions)
+
+
+def encode_list(objects: list) -> list[dict]:
+    """Encode model objects of one class (e.g. all notes) to dicts."""
+    if not objects:
+        return []
+    encode = objects[0]._codec.encode
+    return [encode(obj) for obj in objects]
+
+
+def decode_list(cls: type, items: list, validate: bool = False, path: str = "notes") -> list:
+    """Decode a list of dicts into cls instances.
+    With validate, malformed entries raise SchemaError naming the entry and field.
+    """
+    codec = cls._codec
+    if not validate:
+        decode = codec.decode
+        return [decode(item, cls) for item in items]
+    if not isinstance(items, list):
+        raise SchemaError(path, "expected a list, got " + type(items).__name__)
+    decode = codec.decode_checked
+    return [decode(item, cls, f"{path}[{i}]") for i, item in enumerate(items)]
@@ -2,33 +2,39 @@
 TaskItem model - Represents a single checklist item within a note.
 """
 
+from .ids import new_id
+from .schema import Field, compile_codec
+
 
 class TaskItem:
     """A checklist item with text and completion state."""
 
+    __slots__ = ("id", "text", "checked")
+
+    # Stored fields, in dict order; to_dict/from_dict are generated from these
+    FIELDS = (
+        Field("id", types=(str, type(None)), decode="id or new_id()"),
+        Field("text", ""),
+        Field("checked", False, types=(bool,)),
+    )
+    _codec = compile_codec(FIELDS, {"new_id": new_id})
+
     def __init__(self, text: str = "", checked: bool = False, task_id: str | None = None):
         self.id = task_id or self._generate_id()
         self.text = text
         self.checked = checked
 
     def _generate_id(self) -> str:
-        """Generate a unique ID for the task."""
-        import uuid
-        return str(uuid.uuid4())[:8]
+        """Generate a unique, time-sortable ID for the task."""
+        return new_id()
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
-        return {
-            "id": self.id,
-            "text": self.text,
-            "checked": self.checked,
-        }
+        return self._codec.encode(self)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "TaskItem":
-        """Deserialize from dictionary."""
-        return cls(
-            text=data.get("text", ""),
-            checked=data.get("checked", False),
-            task_id=data.get("id"),
-        )
+    def from_dict(cls, data: dict, validate: bool = False) -> "TaskItem":
+        """Deserialize from dictionary. With validate, malformed data raises SchemaError."""
+        if validate:
+            return cls._codec.decode_checked(data, cls)
+        return cls._codec.decode(data, cls)
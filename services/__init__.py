@@ -1,4 +1,9 @@
 # Services package - Storage and other services
 from .storage import StorageService
+from .search_index import SearchIndex
+from .trigram_index import TrigramIndex
+from .note_store import NoteStore
+from .version_store import VersionStore
+from .backup_store import BackupStore
 
-__all__ = ["StorageService"]
+__all__ = ["StorageService", "SearchIndex", "TrigramIndex", "NoteStore", "VersionStore", "BackupStore"]
@@ -0,0 +1,281 @@
+"""
+BackupStore - Rolling backup generations of the notes, stored content-addressed.
+
+Every note is stored once per distinct content, as an object keyed by its SHA-256, so
+a generation only writes notes that changed since any earlier one. Objects written by
+one generation are appended to one pack file (packs/<generation>.pack) rather than a
+file each. Pack files are never overwritten, since the index maps digests to offsets
+in them. The list of note digests is itself cut into pages at content-defined
+boundaries (after a digest whose first byte is below PAGE_CUT), so inserting or
+deleting a note only produces new pages around it. A generation is a small manifest
+of page digests.
+
+Retention keeps the newest generation of each of the last HOURLY hours, DAILY days and
+WEEKLY weeks; prune() deletes other generations and repacks packs that hold mostly
+objects no generation refers to any more.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from models.note import Note
+from models.schema import SCHEMA_VERSION
+from services import json_codec
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZE = 32
+_ENTRY = struct.Struct("<32sI")  # digest, compressed length; the data follows
+
+
+class BackupStore:
+    """Takes, lists, loads and prunes backup generations in one folder."""
+
+    INTERVAL_SECONDS = 3600  # Minimum age of the newest generation before another is due
+    HOURLY = 24
+    DAILY = 14
+    WEEKLY = 8
+    PAGE_CUT = 4  # Digests starting below this byte end a page (~64 notes per page)
+    MAX_PAGE = 1024
+
+    def __init__(self, folder: Path):
+        self.folder = Path(folder)
+        self._packs = self.folder / "packs"
+        self._generations = self.folder / "generations"
+        self._digests: dict[str, bytes] = {}  # note id -> digest of the note as last backed up
+        self._index: dict[bytes, tuple[str, int, int]] | None = None  # digest -> (pack, offset, length)
+
+    # Objects
+
+    def _objects(self) -> dict[bytes, tuple[str, int, int]]:
+        """Digest index of all packs (built by scanning entry headers on first use)."""
+        if self._index is None:
+            self._index = {}
+            if self._packs.is_dir():
+                for path in self._packs.glob("*.pack"):
+                    self._scan_pack(path)
+        return self._index
+
+    def _scan_pack(self, path: Path) -> None:
+        raw = path.read_bytes()
+        offset = 0
+        while offset + _ENTRY.size <= len(raw):
+            digest, length = _ENTRY.unpack_from(raw, offset)
+            offset += _ENTRY.size
+            if offset + length > len(raw):
+                break  # Torn write; the generation that wrote it was never listed
+            self._index[digest] = (path.name, offset, length)
+            offset += length
+
+    def _write_pack(self, name: str, objects: dict[bytes, bytes]) -> None:
+        """Write (digest -> raw data) objects as a new pack and index them."""
+        self._packs.mkdir(parents=True, exist_ok=True)
+        path = self._packs / f"{name}.pack"
+        if path.exists():
+            raise FileExistsError(path)  # Indexed objects point into it
+        chunks = []
+        entries = {}
+        offset = 0
+        for digest, data in objects.items():
+            packed = zlib.compress(data)
+            chunks.append(_ENTRY.pack(digest, len(packed)) + packed)
+            offset += _ENTRY.size
+            entries[digest] = (path.name, offset, len(packed))
+            offset += len(packed)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(b"".join(chunks))
+        os.replace(tmp, path)
+        self._objects().update(entries)
+
+    def _reader(self):
+        """get(digest) -> data, keeping pack files open until close()."""
+        files = {}
+        index = self._objects()
+
+        def get(digest: bytes) -> bytes:
+            pack, offset, length = index[digest]
+            f = files.get(pack)
+            if f is None:
+                f = files[pack] = open(self._packs / pack, "rb")
+            f.seek(offset)
+            return zlib.decompress(f.read(length))
+
+        def close() -> None:
+            for f in files.values():
+                f.close()
+
+        return get, close
+
+    # Generations
+
+    def generations(self) -> list[dict]:
+        """Manifests of all generations ({"id", "created", "count", "pages"}), newest first."""
+        if not self._generations.is_dir():
+            return []
+        manifests = []
+        for path in self._generations.glob("*.json"):
+            try:
+                manifest = json_codec.loads(path.read_bytes())
+            except (json_codec.JSONDecodeError, IOError):
+                continue
+            manifests.append({**manifest, "id": path.stem})
+        return sorted(manifests, key=lambda m: m["created"], reverse=True)
+
+    def due(self, now: float | None = None) -> bool:
+        """True if no generation was taken in the last INTERVAL_SECONDS."""
+        now = time.time() if now is None else now
+        newest = self.generations()[:1]
+        return not newest or now - newest[0]["created"] >= self.INTERVAL_SECONDS
+
+    def seed(self, notes: list[Note], source: str) -> bool:
+        """Reuse the newest generation's digests for notes if it was taken of exactly these
+        notes (source is the checksum of the notes file both came from). Saves encoding and
+        hashing every note on the first backup after a restart.
+        """
+        newest = self.generations()[:1]
+        if not newest or newest[0].get("source") != source or newest[0]["count"] != len(notes):
+            return False
+        get, close = self._reader()
+        try:
+            raw = b"".join(get(bytes.fromhex(page)) for page in newest[0]["pages"])
+        finally:
+            close()
+        self._digests = {note.id: raw[i * _DIGEST_SIZE:(i + 1) * _DIGEST_SIZE] for i, note in enumerate(notes)}
+        return True
+
+    def take(self, notes: list[Note], changed_ids: set[str] | None = None, now: float | None = None,
+             source: str | None = None) -> str:
+        """Write a generation of notes and return its id. Only notes in changed_ids (all
+        notes if None, or not seen by this store before) are encoded and hashed again.
+        source identifies the saved notes file the notes match (see seed()).
+        """
+        now = time.time() if now is None else now
+        index = self._objects()
+        new: dict[bytes, bytes] = {}
+
+        def put(data: bytes) -> bytes:
+            digest = hashlib.sha256(data).digest()
+            if digest not in index:
+                new[digest] = data
+            return digest
+
+        digests = []
+        known = self._digests
+        for note in notes:
+            digest = known.get(note.id)
+            if digest is None or changed_ids is None or note.id in changed_ids:
+                digest = known[note.id] = put(json_codec.dumps(note.to_dict()))
+            digests.append(digest)
+        pages = []
+        start = 0
+        for i, digest in enumerate(digests):
+            if digest[0] < self.PAGE_CUT or i + 1 - start >= self.MAX_PAGE:
+                pages.append(put(b"".join(digests[start:i + 1])))
+                start = i + 1
+        if start < len(digests):
+            pages.append(put(b"".join(digests[start:])))
+        generation_id = self._new_generation_id(now)
+        if new:
+            self._write_pack(generation_id, new)
+        manifest = {"created": now, "schema_version": SCHEMA_VERSION, "count": len(notes),
+                    "source": source, "pages": [p.hex() for p in pages]}
+        self._generations.mkdir(parents=True, exist_ok=True)
+        path = self._generations / f"{generation_id}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(json_codec.dumps(manifest))
+        os.replace(tmp, path)  # The manifest goes last: a generation is complete once listed
+        return generation_id
+
+    def _new_generation_id(self, now: float) -> str:
+        """Timestamp id, with a counter suffix if that second already has a generation or pack."""
+        base = generation_id = datetime.fromtimestamp(now).strftime("%Y%m%d-%H%M%S")
+        n = 1
+        while ((self._generations / f"{generation_id}.json").exists()
+               or (self._packs / f"{generation_id}.pack").exists()):
+            n += 1
+            generation_id = f"{base}-{n}"
+        return generation_id
+
+    def load(self, generation_id: str) -> list[Note]:
+        """Notes of a generation, in their original order."""
+        manifest = json_codec.loads((self._generations / f"{generation_id}.json").read_bytes())
+        get, close = self._reader()
+        notes = []
+        try:
+            for page in manifest["pages"]:
+                raw = get(bytes.fromhex(page))
+                for i in range(0, len(raw), _DIGEST_SIZE):
+                    notes.append(Note.from_dict(json_codec.loads(get(raw[i:i + _DIGEST_SIZE])), validate=True))
+        finally:
+            close()
+        return notes
+
+    # Retention
+
+    def _kept(self, manifests: list[dict]) -> set[str]:
+        """Ids kept by the hourly/daily/weekly policy (manifests newest first)."""
+        kept = set()
+        buckets = {"hour": set(), "day": set(), "week": set()}
+        limits = {"hour": self.HOURLY, "day": self.DAILY, "week": self.WEEKLY}
+        for manifest in manifests:
+            created = datetime.fromtimestamp(manifest["created"])
+            keys = {"hour": created.strftime("%Y%m%d%H"), "day": created.date(),
+                    "week": created.isocalendar()[:2]}
+            for kind, key in keys.items():
+                seen = buckets[kind]
+                if key not in seen and len(seen) < limits[kind]:
+                    seen.add(key)
+                    kept.add(manifest["id"])
+        return kept
+
+    def prune(self) -> int:
+        """Delete generations outside the retention policy, then drop packs with no live
+        objects and repack those that are mostly dead. Returns the number of generations deleted.
+        """
+        manifests = self.generations()
+        kept = self._kept(manifests)
+        dropped = [m for m in manifests if m["id"] not in kept]
+        if not dropped:
+            return 0
+        for manifest in dropped:
+            (self._generations / f"{manifest['id']}.json").unlink(missing_ok=True)
+        get, close = self._reader()
+        try:
+            live = set()
+            for manifest in manifests:
+                if manifest["id"] not in kept:
+                    continue
+                for page in manifest["pages"]:
+                    digest = bytes.fromhex(page)
+                    if digest not in live:
+                        live.add(digest)
+                        raw = get(digest)
+                        live.update(raw[i:i + _DIGEST_SIZE] for i in range(0, len(raw), _DIGEST_SIZE))
+            by_pack: dict[str, list[bytes]] = {}
+            dead_bytes: dict[str, int] = {}
+            for digest, (pack, _, length) in self._objects().items():
+                if digest in live:
+                    by_pack.setdefault(pack, []).append(digest)
+                else:
+                    dead_bytes[pack] = dead_bytes.get(pack, 0) + length
+            for pack, dead in dead_bytes.items():
+                live_digests = by_pack.get(pack, [])
+                if live_digests and dead < sum(self._index[d][2] for d in live_digests):
+                    continue  # Mostly live: keep as is
+                if live_digests:
+                    self._write_pack(f"repack-{time.time_ns()}", {d: get(d) for d in live_digests})
+                for digest, entry in list(self._index.items()):
+                    if entry[0] == pack:
+                        del self._index[digest]
+        finally:
+            close()
+        for pack in dead_bytes.keys() - {entry[0] for entry in self._index.values()}:
+            (self._packs / pack).unlink(missing_ok=True)
+        self._digests = {note_id: d for note_id, d in self._digests.items() if d in self._index}
+        return len(dropped)
@@ -0,0 +1,37 @@
+"""
+JSON Codec - Encodes/decodes notes files with orjson when it is installed, else stdlib json.
+Both backends produce the same text: UTF-8 without ASCII escaping, either compact or
+indented by two spaces.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is always available
+    orjson = None
+
+# Set STICKY_JSON=stdlib to ignore an installed accelerator (e.g. to compare output)
+BACKEND = "orjson" if orjson is not None and os.environ.get("STICKY_JSON") != "stdlib" else "json"
+
+# Decode errors from either backend (orjson's is a subclass of json.JSONDecodeError)
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes; pretty indents by two spaces (for exports)."""
+    if BACKEND == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def loads(raw: bytes | str):
+    """Decode JSON from bytes (UTF-8) or str."""
+    if BACKEND == "orjson":
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -0,0 +1,127 @@
+"""
+MemoryProbe - Snapshots of Tk and Python memory use, for spotting leaks across repopulates.
+
+A snapshot counts live Tk widgets, Tcl variables (tkinter's StringVar etc. are Tcl
+globals) and Tcl commands (Python callbacks registered with Tcl), Python objects by
+type and, while tracemalloc is tracing, the top allocation sites. growth() compares
+two snapshots, so a harness can fail when repeated repopulation keeps growing.
+
+STICKY_MEMORY=1 records a snapshot after every repopulate of the main window and
+starts tracemalloc at launch.
+"""
+
+import gc
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import Counter, deque
+from pathlib import Path
+
+from services import metrics
+
+logger = logging.getLogger(__name__)
+
+MEMORY_ENV = "STICKY_MEMORY"
+ENABLED = os.environ.get(MEMORY_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class MemoryProbe:
+    """Takes memory snapshots of one Tk root and keeps a short history of them."""
+
+    TOP_TYPES = 15
+    TOP_ALLOCATORS = 10
+    TRACE_FRAMES = 8
+    HISTORY = 50
+    OBJECT_SLACK = 200  # Object count growth per type ignored by growth() (caches, free lists)
+
+    def __init__(self, root, trace: bool = False):
+        self._root = root
+        self.history: deque[dict] = deque(maxlen=self.HISTORY)
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start(self.TRACE_FRAMES)
+
+    def widget_count(self) -> int:
+        """Number of Tk widgets under the root (including toplevels)."""
+        count, stack = 0, [self._root]
+        while stack:
+            widget = stack.pop()
+            children = widget.winfo_children()
+            count += len(children)
+            stack.extend(children)
+        return count
+
+    def tcl_counts(self) -> tuple[int, int]:
+        """(Tcl global variables, Tcl commands) in the root's interpreter."""
+        tk = self._root.tk
+        return len(tk.splitlist(tk.call("info", "globals"))), len(tk.splitlist(tk.call("info", "commands")))
+
+    @staticmethod
+    def object_counts() -> Counter:
+        """Live GC-tracked objects by type name (after a full collection)."""
+        gc.collect()
+        return Counter(type(o).__name__ for o in gc.get_objects())
+
+    def top_allocators(self) -> list[dict]:
+        """Largest allocation sites by line, if tracemalloc is tracing."""
+        if not tracemalloc.is_tracing():
+            return []
+        stats = tracemalloc.take_snapshot().statistics("lineno")[:self.TOP_ALLOCATORS]
+        return [{"where": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+                 "size_kb": round(s.size / 1024, 1), "count": s.count} for s in stats]
+
+    def snapshot(self, label: str = "") -> dict:
+        """Take a snapshot; it is also appended to history."""
+        tcl_vars, tcl_commands = self.tcl_counts()
+        snap = {
+            "label": label,
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "widgets": self.widget_count(),
+            "tcl_vars": tcl_vars,
+            "tcl_commands": tcl_commands,
+            "objects": self.object_counts(),
+            "traced_kb": round(tracemalloc.get_traced_memory()[0] / 1024, 1) if tracemalloc.is_tracing() else None,
+            "top_allocators": self.top_allocators(),
+        }
+        self.history.append(snap)
+        return snap
+
+    def record(self, label: str) -> dict:
+        """Snapshot and log it with the change since the previous snapshot."""
+        previous = self.history[-1] if self.history else None
+        snap = self.snapshot(label)
+
+        def delta(key: str) -> str:
+            return f" ({snap[key] - previous[key]:+d})" if previous else ""
+
+        logger.info("Memory after %s: %d widgets%s, %d Tcl vars%s, %d Tcl commands%s, %d objects%s",
+                    label, snap["widgets"], delta("widgets"), snap["tcl_vars"], delta("tcl_vars"),
+                    snap["tcl_commands"], delta("tcl_commands"), sum(snap["objects"].values()),
+                    f" ({sum(snap['objects'].values()) - sum(previous['objects'].values()):+d})"
+                    if previous else "")
+        return snap
+
+    @classmethod
+    def growth(cls, before: dict, after: dict, tolerance: int = 0) -> list[str]:
+        """What grew from before to after: Tk/Tcl counts beyond tolerance, object types beyond OBJECT_SLACK."""
+        problems = [f"{key}: {before[key]} -> {after[key]}"
+                    for key in ("widgets", "tcl_vars", "tcl_commands") if after[key] - before[key] > tolerance]
+        grown = after["objects"] - before["objects"]  # Counter subtraction keeps increases only
+        problems += [f"{name} objects: +{n}" for name, n in grown.most_common() if n > cls.OBJECT_SLACK]
+        return problems
+
+    @classmethod
+    def summary(cls, snap: dict) -> dict:
+        """JSON-friendly snapshot with only the most common object types."""
+        return {**snap, "objects": dict(snap["objects"].most_common(cls.TOP_TYPES))}
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Write the snapshot history as JSON (next to the metrics dumps by default)."""
+        if path is None:
+            folder = metrics.metrics.output_dir
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"memory-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        Path(path).write_text(json.dumps([self.summary(s) for s in self.history], indent=2), encoding="utf-8")
+        logger.info("Memory snapshots written to %s", path)
+        return Path(path)
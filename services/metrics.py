@@ -0,0 +1,144 @@
+"""
+Metrics - Opt-in latency histograms for hot paths (save/load, mutations, layout).
+
+STICKY_METRICS=1 makes @timed record every call into a per-name histogram; unset,
+@timed returns functions unwrapped. Histograms keep log-linear buckets (32 per
+power of two, so percentiles are within ~3%) in microseconds, like HdrHistogram,
+and can be viewed from the diagnostics menu or dumped to JSON.
+"""
+
+import functools
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENV = "STICKY_METRICS"
+ENABLED = os.environ.get(METRICS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS  # Buckets per power of two
+
+
+def _bucket(us: int) -> int:
+    """Bucket index of a value in microseconds; values below 64 us get exact buckets."""
+    shift = max(0, us.bit_length() - _SUB_BITS - 1)
+    return shift * _SUB_COUNT + (us >> shift)
+
+
+def _bucket_high(index: int) -> int:
+    """Largest value that falls in bucket index."""
+    shift = max(0, index // _SUB_COUNT - 1)
+    return ((index - shift * _SUB_COUNT + 1) << shift) - 1
+
+
+class Histogram:
+    """Latency histogram over microsecond values."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: list[int] = []
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, us: int) -> None:
+        index = _bucket(us)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or us < self.min:
+            self.min = us
+        if us > self.max:
+            self.max = us
+        self.count += 1
+        self.total += us
+
+    def percentile(self, q: float) -> int:
+        """Value (us) at or below which q percent of the recorded values fall."""
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_high(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Counts and p50/p95/p99 (ms) for display or JSON."""
+        ms = lambda us: round(us / 1000, 3)
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.total / self.count) if self.count else 0.0,
+            "min_ms": ms(self.min),
+            "p50_ms": ms(self.percentile(50)),
+            "p95_ms": ms(self.percentile(95)),
+            "p99_ms": ms(self.percentile(99)),
+            "max_ms": ms(self.max),
+        }
+
+
+class Metrics:
+    """Named histograms, created on first record."""
+
+    def __init__(self, output_dir: Path | None = None):
+        self._output_dir = output_dir
+        self.histograms: dict[str, Histogram] = {}
+
+    @property
+    def output_dir(self) -> Path:
+        """Folder JSON dumps go to (diagnostics/ next to notes.json by default)."""
+        if self._output_dir is None:
+            from services.storage import StorageService
+            self._output_dir = StorageService().get_local_notes_path().parent / "diagnostics"
+        return self._output_dir
+
+    def record(self, name: str, us: int) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.record(us)
+
+    def summary(self) -> dict[str, dict]:
+        return {name: h.summary() for name, h in sorted(self.histograms.items())}
+
+    def reset(self) -> None:
+        self.histograms.clear()
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Write the summaries as JSON (to a timestamped file in output_dir by default)."""
+        if path is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"metrics-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        report = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "histograms": self.summary()}
+        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Metrics written to %s", path)
+        return Path(path)
+
+
+metrics = Metrics()
+
+
+def timed(name: str):
+    """Record call latency under name when STICKY_METRICS is set; otherwise returns the function as-is."""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(name, (time.perf_counter_ns() - start) // 1000)
+        return wrapper
+    return decorate
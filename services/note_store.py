@@ -0,0 +1,256 @@
+"""
+Note Store - Columnar (struct-of-arrays) copy of note metadata for bulk counts and filters.
+Status, color, due date and size live in `array` columns, so aggregations run over
+compact machine values instead of touching every Note object.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date
+from itertools import compress
+
+from models.note import Note
+
+
+def due_ordinal(due_date: str | None) -> int:
+    """Proleptic ordinal of an ISO "YYYY-MM-DD" due date, or 0 if missing or invalid."""
+    if not due_date:
+        return 0
+    try:
+        y, m, d = (int(part) for part in due_date.split("-"))
+        return date(y, m, d).toordinal()
+    except ValueError:
+        return 0
+
+
+class StringTable:
+    """Maps strings to small integer codes (and back), growing as new values appear."""
+
+    def __init__(self, initial: Iterable[str] = ()):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        for value in initial:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int | None:
+        """Code of value, or None if it has never been stored."""
+        return self._codes.get(value)
+
+
+class NoteStore:
+    """One row per note; rows are kept dense (a removed row is filled by the last one).
+
+    Status and color are byte columns of string-table codes, so counts and equality masks
+    run in C (bytearray.count / translate). Due dates are also indexed by day, so calendar
+    and histogram queries cost O(days in range) rather than O(notes).
+    """
+
+    # Fields whose change requires refreshing a note's row
+    INDEXED_FIELDS = frozenset({"status", "completed", "color", "due_date", "width", "height"})
+    # Column code shared by string-table entries past the first 255 (checked on the Note)
+    OTHER = 255
+
+    def __init__(self):
+        self.statuses = StringTable([value for value, _ in Note.STATUS_CHOICES])
+        self.colors = StringTable(Note.COLORS)
+        self._ids: list[str] = []  # Row -> note id
+        self._rows: dict[str, int] = {}  # Note id -> row
+        self._notes: dict[str, Note] = {}
+        self._status = bytearray()
+        self._color = bytearray()
+        self._due = array("l")  # Due-date ordinal, 0 = none
+        self._completed = bytearray()
+        self._width = array("l")  # Sizes rounded to whole pixels (stored sizes may be floats)
+        self._height = array("l")
+        self._due_ids: dict[int, set[str]] = {}  # Due-date ordinal -> ids of notes due that day
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _columns(self) -> tuple:
+        return self._status, self._color, self._due, self._completed, self._width, self._height
+
+    def _row_values(self, note: Note) -> tuple[int, ...]:
+        return (min(self.statuses.code(note.status), self.OTHER),
+                min(self.colors.code(note.color), self.OTHER),
+                due_ordinal(note.due_date), int(note.completed), round(note.width), round(note.height))
+
+    def rebuild(self, notes: list[Note]) -> None:
+        """Load all notes from scratch."""
+        self._ids = [note.id for note in notes]
+        self._rows = {note_id: row for row, note_id in enumerate(self._ids)}
+        self._notes = {note.id: note for note in notes}
+        self._due_ids = {}
+        rows = [self._row_values(note) for note in notes]
+        for column, values in zip(self._columns(), zip(*rows) if rows else [()] * 6):
+            del column[:]
+            column.extend(values)
+        for note_id, ordinal in zip(self._ids, self._due):
+            if ordinal:
+                self._due_ids.setdefault(ordinal, set()).add(note_id)
+
+    def sync(self, notes: list[Note]) -> None:
+        """Reconcile with the current notes list, refreshing only notes not seen before."""
+        seen = set()
+        for note in notes:
+            seen.add(note.id)
+            if self._notes.get(note.id) is not note:
+                self.update_note(note)
+        for note_id in self._notes.keys() - seen:
+            self.remove_note(note_id)
+
+    def note_updated(self, note: Note, fields: frozenset[str] | None) -> None:
+        """Viewmodel change event: refresh the row when a stored field changed."""
+        if fields is None or fields & self.INDEXED_FIELDS:
+            self.update_note(note)
+
+    def update_note(self, note: Note) -> None:
+        """Add a note's row, or overwrite it with the note's current values."""
+        values = self._row_values(note)
+        row = self._rows.get(note.id)
+        if row is None:
+            self._rows[note.id] = len(self._ids)
+            self._ids.append(note.id)
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+        else:
+            self._unindex_due(note.id, self._due[row])
+            for column, value in zip(self._columns(), values):
+                column[row] = value
+        if values[2]:
+            self._due_ids.setdefault(values[2], set()).add(note.id)
+        self._notes[note.id] = note
+
+    def remove_note(self, note_id: str) -> None:
+        """Drop a note's row, moving the last row into its place."""
+        row = self._rows.pop(note_id, None)
+        if row is None:
+            return
+        del self._notes[note_id]
+        self._unindex_due(note_id, self._due[row])
+        last_id = self._ids.pop()
+        if row < len(self._ids):
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+        for column in self._columns():
+            last = column.pop()
+            if row < len(column):
+                column[row] = last
+
+    def _unindex_due(self, note_id: str, ordinal: int) -> None:
+        ids = self._due_ids.get(ordinal)
+        if ids is not None:
+            ids.discard(note_id)
+            if not ids:
+                del self._due_ids[ordinal]
+
+    # Aggregations
+
+    def _count_codes(self, column: bytearray, table: StringTable, attr: str) -> dict[str, int]:
+        counts = {value: column.count(code) for code, value in enumerate(table.values[:self.OTHER])}
+        if len(table.values) > self.OTHER:
+            overflow = compress(self._ids, column.translate(self._match_table(self.OTHER)))
+            counts.update(Counter(getattr(self._notes[note_id], attr) for note_id in overflow))
+        return counts
+
+    def count_by_status(self) -> dict[str, int]:
+        """Number of notes per status value (every known status is present)."""
+        return self._count_codes(self._status, self.statuses, "status")
+
+    def count_by_color(self) -> dict[str, int]:
+        """Number of notes per color (every palette color is present)."""
+        return self._count_codes(self._color, self.colors, "color")
+
+    def _due_ordinals(self, lo: int, hi: int):
+        """Ordinals in [lo, hi) on which something is due (walks whichever side is smaller)."""
+        if hi - lo <= len(self._due_ids):
+            return (o for o in range(lo, hi) if o in self._due_ids)
+        return (o for o in self._due_ids if lo <= o < hi)
+
+    def due_histogram(self, start: date, end: date) -> dict[date, int]:
+        """Number of notes due on each day in [start, end); days without notes are omitted."""
+        ordinals = sorted(self._due_ordinals(start.toordinal(), end.toordinal()))
+        return {date.fromordinal(o): len(self._due_ids[o]) for o in ordinals}
+
+    def due_days(self, year: int, month: int) -> set[int]:
+        """Days of the given month on which at least one note is due."""
+        first = date(year, month, 1).toordinal()
+        end = date(year + month // 12, month % 12 + 1, 1).toordinal()
+        return {o - first + 1 for o in self._due_ordinals(first, end)}
+
+    # Filters
+
+    @staticmethod
+    def _match_table(code: int) -> bytes:
+        """bytes.translate table mapping code to 1 and every other byte to 0."""
+        return bytes(code) + b"\x01" + bytes(255 - code)
+
+    def _masked_ids(self, mask: bytes):
+        """Ids of rows whose mask byte is 1, in row order."""
+        hits = mask.count(1)
+        if hits * 8 > len(mask):
+            return compress(self._ids, mask)
+        # Sparse: jump between hits with find() instead of testing every row
+        rows = []
+        i = mask.find(1)
+        while i != -1:
+            rows.append(i)
+            i = mask.find(1, i + 1)
+        return map(self._ids.__getitem__, rows)
+
+    def filter_ids(self, status: str | None = None, color: str | None = None,
+                   due_from: date | None = None, due_to: date | None = None) -> list[str]:
+        """Ids of notes matching every given criterion (due range is inclusive), in row order."""
+        mask = None
+        exact = []  # (attribute, value) pairs to check on the Note for overflow codes
+        for column, table, attr, value in ((self._status, self.statuses, "status", status),
+                                           (self._color, self.colors, "color", color)):
+            if value is None:
+                continue
+            code = table.lookup(value)
+            if code is None:
+                return []
+            if code >= self.OTHER:
+                code = self.OTHER
+                exact.append((attr, value))
+            column_mask = column.translate(self._match_table(code))
+            if mask is None:
+                mask = column_mask
+            else:
+                # AND the two 0/1 masks as big integers
+                mask = (int.from_bytes(mask, "little") & int.from_bytes(column_mask, "little")
+                        ).to_bytes(len(mask), "little")
+        ids = iter(self._ids) if mask is None else self._masked_ids(mask)
+        if due_from is not None or due_to is not None:
+            lo = due_from.toordinal() if due_from is not None else 1
+            hi = due_to.toordinal() + 1 if due_to is not None else date.max.toordinal() + 1
+            due = set().union(*(self._due_ids[o] for o in self._due_ordinals(lo, hi)))
+            ids = filter(due.__contains__, ids)
+        if exact:
+            notes = self._notes
+            ids = (i for i in ids if all(getattr(notes[i], attr) == value for attr, value in exact))
+        return list(ids)
+
+    def count(self, status: str | None = None, color: str | None = None,
+              due_from: date | None = None, due_to: date | None = None) -> int:
+        """Number of notes matching every given criterion."""
+        if due_from is None and due_to is None:
+            if status is None and color is None:
+                return len(self._ids)
+            if status is None or color is None:
+                column, table, value = ((self._status, self.statuses, status) if color is None
+                                        else (self._color, self.colors, color))
+                code = table.lookup(value)
+                if code is None:
+                    return 0
+                if code < self.OTHER:
+                    return column.count(code)
+        return len(self.filter_ids(status, color, due_from, due_to))
@@ -0,0 +1,142 @@
+"""
+Profiling - Opt-in cProfile capture, written as .pstats files to the data folder.
+
+STICKY_PROFILE selects what is captured from startup:
+    session  the whole run of main() (written on exit)
+    calls    every call of the viewmodel/storage entry points marked @profiled,
+             accumulated per entry point (written on exit)
+Unset, @profiled returns functions unwrapped. A time-bounded capture ("profile the
+next 10 seconds") can also be started from the running app at any time.
+"""
+
+import cProfile
+import functools
+import logging
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "STICKY_PROFILE"
+MODE = os.environ.get(PROFILE_ENV, "").strip().lower()  # "", "session" or "calls"
+
+
+class Profiler:
+    """Runs at most one cProfile capture at a time (cProfile captures cannot nest)."""
+
+    def __init__(self, output_dir: Path | None = None):
+        self._output_dir = output_dir
+        self._active: str | None = None  # Label of the running capture
+        self._call_profiles: dict[str, cProfile.Profile] = {}  # "calls" mode, per entry point
+
+    @property
+    def output_dir(self) -> Path:
+        """Folder the .pstats files go to (profiles/ next to notes.json by default)."""
+        if self._output_dir is None:
+            from services.storage import StorageService
+            self._output_dir = StorageService().get_local_notes_path().parent / "profiles"
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, path: Path) -> None:
+        self._output_dir = Path(path)
+
+    @property
+    def busy(self) -> bool:
+        """True while a capture is running."""
+        return self._active is not None
+
+    def _dump(self, profile: cProfile.Profile, label: str) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / f"{label}-{time.strftime('%Y%m%d-%H%M%S')}.pstats"
+        profile.dump_stats(path)
+        logger.info("Profile written to %s", path)
+        return path
+
+    def _start(self, label: str, profile: cProfile.Profile) -> bool:
+        if self._active is not None:
+            return False
+        try:
+            profile.enable()
+        except ValueError:  # Another profiler (e.g. a debugger's) owns the hook
+            return False
+        self._active = label
+        return True
+
+    def _stop(self, profile: cProfile.Profile) -> None:
+        profile.disable()
+        self._active = None
+
+    @contextmanager
+    def capture(self, label: str, profile: cProfile.Profile | None = None):
+        """Profile the enclosed block into profile (a new one if None).
+        Yields the profile, or None if another capture was already running.
+        """
+        profile = profile or cProfile.Profile()
+        if not self._start(label, profile):
+            yield None
+            return
+        try:
+            yield profile
+        finally:
+            self._stop(profile)
+
+    def run(self, label: str, func: Callable, *args) -> Any:
+        """Call func under a capture and write the result to a .pstats file."""
+        profile = None
+        try:
+            with self.capture(label) as profile:
+                return func(*args)
+        finally:
+            if profile is not None:
+                self._dump(profile, label)
+
+    def profile_call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """Call func, adding its profile to the accumulated one for name ("calls" mode)."""
+        profile = self._call_profiles.setdefault(name, cProfile.Profile())
+        with self.capture(name, profile):
+            return func(*args, **kwargs)
+
+    def dump_calls(self) -> list[Path]:
+        """Write the accumulated per-entry-point profiles and start over."""
+        paths = [self._dump(profile, f"calls-{name}") for name, profile in self._call_profiles.items()]
+        self._call_profiles.clear()
+        return paths
+
+    def profile_for(self, seconds: float, schedule: Callable[[int, Callable], Any],
+                    on_done: Callable[[Path], None] | None = None) -> bool:
+        """Profile everything for the next seconds, then write the file and call on_done(path).
+        schedule(ms, callback) arms the stop timer (e.g. a Tk widget's after).
+        Returns False if a capture is already running.
+        """
+        profile = cProfile.Profile()
+        if not self._start("window", profile):
+            return False
+
+        def finish() -> None:
+            self._stop(profile)
+            path = self._dump(profile, f"window-{seconds:g}s")
+            if on_done is not None:
+                on_done(path)
+
+        schedule(int(seconds * 1000), finish)
+        return True
+
+
+profiler = Profiler()
+
+
+def profiled(name: str):
+    """Mark an entry point for STICKY_PROFILE=calls; otherwise returns the function as-is."""
+    def decorate(func):
+        if MODE != "calls":
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return profiler.profile_call(name, func, *args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,216 @@
+"""
+Search Index - In-memory inverted index over note titles, content and task text.
+Tokens are case-folded words; the last query token also matches as a prefix.
+"""
+
+import bisect
+import heapq
+import re
+import zlib
+
+from models.note import Note
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens."""
+    return TOKEN_RE.findall(text.casefold())
+
+
+class SearchIndex:
+    """Inverted index (term -> {note id: weight}) kept up to date one note at a time."""
+
+    # Bump when tokenization or weighting changes so persisted indexes are rebuilt
+    INDEX_VERSION = 1
+    # Fields whose change requires re-indexing a note
+    INDEXED_FIELDS = frozenset({"title", "content", "tasks"})
+    TITLE_WEIGHT = 3
+    MIN_PREFIX_LENGTH = 2  # Shorter trailing tokens only match whole words
+    MAX_PREFIX_TERMS = 256  # Cap on vocabulary terms a prefix may expand to
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, int]] = {}
+        self._note_terms: dict[str, dict[str, int] | str] = {}
+        self._notes: dict[str, Note] = {}
+        self._terms: list[str] = []  # Sorted vocabulary for prefix lookup
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    @classmethod
+    def note_terms(cls, note: Note) -> dict[str, int]:
+        """Weighted term frequencies for a note (title terms count TITLE_WEIGHT times)."""
+        terms: dict[str, int] = {}
+        for term in tokenize(note.title):
+            terms[term] = terms.get(term, 0) + cls.TITLE_WEIGHT
+        for term in tokenize(note.content):
+            terms[term] = terms.get(term, 0) + 1
+        for task in note.tasks:
+            for term in tokenize(task.text):
+                terms[term] = terms.get(term, 0) + 1
+        return terms
+
+    def rebuild(self, notes: list[Note]) -> None:
+        """Index all notes from scratch."""
+        self._postings.clear()
+        self._note_terms.clear()
+        self._notes.clear()
+        for note in notes:
+            terms = self.note_terms(note)
+            self._notes[note.id] = note
+            self._note_terms[note.id] = terms
+            for term, weight in terms.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    self._postings[term] = {note.id: weight}
+                else:
+                    posting[note.id] = weight
+        self._terms = sorted(self._postings)
+
+    @staticmethod
+    def fingerprint(note: Note) -> int:
+        """Cheap checksum of a note's indexed text, used to detect stale persisted entries."""
+        parts = [note.title, note.content]
+        parts.extend(t.text for t in note.tasks)
+        return zlib.crc32("\x1f".join(parts).encode("utf-8"))
+
+    def snapshot(self) -> dict:
+        """Plain-container form of the index: the postings as-is, plus per-note
+        [fingerprint, space-joined terms] so entries can be verified and updated later.
+        """
+        return {
+            "postings": self._postings,
+            "notes": {note_id: [self.fingerprint(note), self._packed_terms(note_id)]
+                      for note_id, note in self._notes.items()},
+        }
+
+    def restore(self, snapshot: dict, notes: list[Note], verify: bool = True) -> int:
+        """Adopt a snapshot for the given notes without re-tokenizing them.
+        Notes missing from the snapshot (or, with verify, whose fingerprint differs) are
+        re-indexed and snapshot entries for notes that no longer exist are dropped.
+        Returns the number of notes that had to be re-indexed.
+        """
+        self._postings = snapshot.get("postings", {})
+        entries = snapshot.get("notes", {})
+        # Per-note terms stay packed until the note changes (see _unpack_terms)
+        self._note_terms = {note_id: entry[1] for note_id, entry in entries.items()}
+        self._notes.clear()
+        self._terms = sorted(self._postings)
+        stale = []
+        for note in notes:
+            entry = entries.get(note.id)
+            if entry is None or (verify and entry[0] != self.fingerprint(note)):
+                stale.append(note)
+            else:
+                self._notes[note.id] = note
+        for note_id in entries.keys() - self._notes.keys():
+            self._set_terms(note_id, {})
+            del self._note_terms[note_id]
+        for note in stale:
+            self.update_note(note)
+        return len(stale)
+
+    def _packed_terms(self, note_id: str) -> str:
+        terms = self._note_terms[note_id]
+        return terms if isinstance(terms, str) else " ".join(terms)
+
+    def _unpack_terms(self, note_id: str) -> dict[str, int]:
+        terms = self._note_terms.get(note_id, {})
+        if isinstance(terms, str):
+            terms = {term: self._postings[term][note_id] for term in terms.split()}
+            self._note_terms[note_id] = terms
+        return terms
+
+    def sync(self, notes: list[Note]) -> None:
+        """Reconcile with the current notes list, re-indexing only notes not seen before."""
+        seen = set()
+        for note in notes:
+            seen.add(note.id)
+            if self._notes.get(note.id) is not note:
+                self.update_note(note)
+        for note_id in self._notes.keys() - seen:
+            self.remove_note(note_id)
+
+    def note_updated(self, note: Note, fields: frozenset[str] | None) -> None:
+        """Viewmodel change event: re-index when an indexed field changed."""
+        if fields is None or fields & self.INDEXED_FIELDS:
+            self.update_note(note)
+
+    def update_note(self, note: Note) -> None:
+        """Add or re-index a single note, touching only the terms that changed."""
+        self._set_terms(note.id, self.note_terms(note))
+        self._notes[note.id] = note
+
+    def remove_note(self, note_id: str) -> None:
+        """Drop a note from the index."""
+        if note_id in self._notes:
+            self._set_terms(note_id, {})
+            del self._notes[note_id]
+            del self._note_terms[note_id]
+
+    def _set_terms(self, note_id: str, terms: dict[str, int]) -> None:
+        old = self._unpack_terms(note_id)
+        for term in old.keys() - terms.keys():
+            posting = self._postings[term]
+            del posting[note_id]
+            if not posting:
+                del self._postings[term]
+                i = bisect.bisect_left(self._terms, term)
+                del self._terms[i]
+        for term, weight in terms.items():
+            if old.get(term) == weight:
+                continue
+            posting = self._postings.get(term)
+            if posting is None:
+                self._postings[term] = {note_id: weight}
+                bisect.insort(self._terms, term)
+            else:
+                posting[note_id] = weight
+        self._note_terms[note_id] = terms
+
+    def _prefix_terms(self, prefix: str) -> list[str]:
+        i = bisect.bisect_left(self._terms, prefix)
+        terms = []
+        while i < len(self._terms) and len(terms) < self.MAX_PREFIX_TERMS:
+            term = self._terms[i]
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+            i += 1
+        return terms
+
+    def search(self, query: str, limit: int | None = 20) -> list[str]:
+        """Return ids of notes matching every query token, best matches first.
+        The last token matches as a prefix unless the query ends with whitespace.
+        limit=None returns all matches.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        prefix_last = not query[-1:].isspace()
+        scores: dict[str, int] | None = None
+        # Most selective tokens first so the candidate set shrinks quickly
+        for i, token in sorted(enumerate(tokens), key=lambda t: len(self._postings.get(t[1], ()))):
+            if i == len(tokens) - 1 and prefix_last and len(token) >= self.MIN_PREFIX_LENGTH:
+                matched: dict[str, int] = {}
+                for term in self._prefix_terms(token):
+                    for note_id, weight in self._postings[term].items():
+                        if scores is None or note_id in scores:
+                            matched[note_id] = matched.get(note_id, 0) + weight
+            else:
+                posting = self._postings.get(token, {})
+                if scores is None:
+                    matched = dict(posting)
+                elif len(scores) < len(posting):
+                    matched = {note_id: posting[note_id] for note_id in scores if note_id in posting}
+                else:
+                    matched = {note_id: w for note_id, w in posting.items() if note_id in scores}
+            if scores is not None:
+                matched = {note_id: w + scores[note_id] for note_id, w in matched.items()}
+            scores = matched
+            if not scores:
+                return []
+        if limit is None:
+            return sorted(scores, key=scores.__getitem__, reverse=True)
+        return heapq.nlargest(limit, scores, key=scores.__getitem__)
@@ -3,19 +3,64 @@ Storage Service - Handles JSON persistence for notes.
 Uses exe/script directory when running as executable for reliable save/load.
 """
 
-import json
+import gc
+import hashlib
+import marshal
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 from models.note import Note
+from models.schema import SCHEMA_VERSION, SchemaError, decode_list, encode_list
+from services import json_codec
+from services.metrics import timed
+from services.profiling import profiled
+
+
+@contextmanager
+def _gc_paused():
+    """Pause cyclic GC while decoding a notes file.
+    Decoding creates hundreds of thousands of acyclic containers, and each automatic
+    collection along the way would rescan all of them.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 
 class StorageService:
     """Manages loading and saving notes to a local JSON file."""
 
     FILENAME = "notes.json"
+    INDEX_FILENAME = "notes.index"
+    HISTORY_FILENAME = "notes.history"
+    BACKUP_FOLDER = "backups"
     APP_FOLDER = "StickyNotes"
+    # The default store is written compact (smaller, faster); exports are indented.
+    # Set True to keep notes.json itself human-readable.
+    PRETTY_STORE = False
+
+    def __init__(self):
+        self._checksum: str | None = None
+        self._checksum_stale = False  # notes.json was saved since _checksum was taken
+
+    @property
+    def notes_checksum(self) -> str | None:
+        """SHA-256 of the default notes.json as last loaded or saved (None if unknown).
+        Saves run on every edit and don't hash; a saved file is hashed on first use.
+        """
+        if self._checksum_stale:
+            self._checksum_stale = False
+            try:
+                self._checksum = hashlib.sha256(self._get_storage_path().read_bytes()).hexdigest()
+            except OSError:
+                self._checksum = None
+        return self._checksum
 
     def _get_storage_path(self) -> Path:
         """Get the full path to the notes JSON file.
@@ -36,10 +81,20 @@ class StorageService:
         """Get the path to notes.json in the local directory (exe dir when frozen)."""
         return self._get_storage_path()
 
+    def get_history_path(self) -> Path:
+        """Path of the per-note version history file (next to notes.json)."""
+        return self._get_storage_path().with_name(self.HISTORY_FILENAME)
+
+    def get_backup_dir(self) -> Path:
+        """Folder of the rolling backup generations (next to notes.json)."""
+        return self._get_storage_path().with_name(self.BACKUP_FOLDER)
+
     def local_notes_exists(self) -> bool:
         """Check if notes.json exists in the local directory."""
         return self.get_local_notes_path().exists()
 
+    @timed("storage.load_notes")
+    @profiled("storage.load_notes")
     def load_notes(self) -> list[Note]:
         """Load notes from JSON file. Returns empty list if file doesn't exist."""
         path = self._get_storage_path()
@@ -47,33 +102,84 @@ class StorageService:
             return []
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            notes_data = data.get("notes", [])
-            return [Note.from_dict(n) for n in notes_data]
-        except (json.JSONDecodeError, IOError):
+            raw = path.read_bytes()
+            with _gc_paused():
+                notes = self._decode_notes(json_codec.loads(raw))
+            self._checksum = hashlib.sha256(raw).hexdigest()
+            self._checksum_stale = False
+            return notes
+        except (json_codec.JSONDecodeError, UnicodeDecodeError, IOError):
             return []
 
+    @timed("storage.save_notes")
+    @profiled("storage.save_notes")
     def save_notes(self, notes: list[Note]) -> None:
         """Save notes to default JSON file."""
-        self.save_notes_to_path(self._get_storage_path(), notes)
+        self._write_notes(self._get_storage_path(), notes, self.PRETTY_STORE)
+        self._checksum_stale = True
 
+    @profiled("storage.save_notes_to_path")
     def save_notes_to_path(self, path: str | Path, notes: list[Note]) -> None:
-        """Save notes to a specific file path."""
-        path = Path(path)
+        """Save notes to a specific file path (export: indented JSON)."""
+        self._write_notes(Path(path), notes, pretty=True)
+
+    def _write_notes(self, path: Path, notes: list[Note], pretty: bool) -> None:
+        """Write notes as JSON."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        data = {"notes": [n.to_dict() for n in notes]}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        data = {"schema_version": SCHEMA_VERSION, "notes": encode_list(notes)}
+        raw = json_codec.dumps(data, pretty)
+        with open(path, "wb") as f:
+            f.write(raw)
 
-    def load_notes_from_path(self, path: str | Path) -> list[Note]:
-        """Load notes from a specific file path."""
+    @profiled("storage.load_notes_from_path")
+    def load_notes_from_path(self, path: str | Path, validate: bool = False) -> list[Note]:
+        """Load notes from a specific file path.
+        With validate, a file that doesn't match the schema loads as an empty list.
+        """
         path = Path(path)
         if not path.exists():
             return []
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return [Note.from_dict(n) for n in data.get("notes", [])]
-        except (json.JSONDecodeError, IOError):
+            raw = path.read_bytes()
+            with _gc_paused():
+                return self._decode_notes(json_codec.loads(raw), validate)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError, SchemaError, IOError):
             return []
+
+    @staticmethod
+    def _decode_notes(data: dict, validate: bool = False) -> list[Note]:
+        """Notes from a parsed notes file.
+        With validate, malformed data or a newer schema_version raises SchemaError.
+        """
+        if validate:
+            if not isinstance(data, dict):
+                raise SchemaError("file", "expected an object, got " + type(data).__name__)
+            version = data.get("schema_version", 0)
+            if not isinstance(version, int) or not 0 <= version <= SCHEMA_VERSION:
+                raise SchemaError("schema_version", f"unsupported version {version!r}")
+        return decode_list(Note, data.get("notes", []), validate)
+
+    def load_search_index(self) -> dict | None:
+        """Load the persisted search index stored next to notes.json, or None.
+        Returns None if it was written by a different Python version (see save_search_index).
+        """
+        path = self._get_storage_path().with_name(self.INDEX_FILENAME)
+        if not path.exists():
+            return None
+        try:
+            data = marshal.loads(path.read_bytes())
+        except (EOFError, ValueError, TypeError, IOError):
+            return None
+        if not isinstance(data, dict) or data.get("python") != list(sys.version_info[:2]):
+            return None
+        return data
+
+    def save_search_index(self, data: dict) -> None:
+        """Persist the search index next to notes.json.
+        Uses marshal (plain containers only, several times faster to load than JSON); the
+        format is Python-version specific, so the version is recorded and checked on load.
+        """
+        path = self._get_storage_path().with_name(self.INDEX_FILENAME)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(marshal.dumps({**data, "python": list(sys.version_info[:2])}))
+        os.replace(tmp, path)
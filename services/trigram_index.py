@@ -0,0 +1,231 @@
+"""
+Trigram Index - Substring and typo-tolerant search over note title, content and task text.
+Finds fragments inside words (e.g. part of a ticket number) that the word index cannot.
+"""
+
+import heapq
+
+from models.note import Note
+
+
+def trigrams(text: str) -> set[str]:
+    """Distinct 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def substring_edit_distance(pattern: str, text: str, max_errors: int) -> int | None:
+    """Fewest edits to turn pattern into some substring of text (Sellers' algorithm).
+    Returns None if more than max_errors edits are needed.
+    """
+    if pattern in text:
+        return 0
+    m = len(pattern)
+    prev = list(range(m + 1))
+    best = m
+    for ch in text:
+        cur = [0]
+        for j in range(1, m + 1):
+            cost = prev[j - 1] + (pattern[j - 1] != ch)
+            cur.append(min(cost, prev[j] + 1, cur[j - 1] + 1))
+        prev = cur
+        if cur[m] < best:
+            best = cur[m]
+    return best if best <= max_errors else None
+
+
+class TrigramIndex:
+    """Two-level index over case-folded note text, updated incrementally.
+
+    Text is split into whitespace-free chunks ("proj-40213", "meeting,"). Chunks map to
+    the notes containing them, and trigrams map to the (far fewer) distinct chunks, so a
+    fragment is resolved against the chunk vocabulary instead of every note.
+    """
+
+    INDEXED_FIELDS = frozenset({"title", "content", "tasks"})
+    MIN_QUERY_LENGTH = 3  # Shorter fragments are matched by scanning the chunk vocabulary
+
+    def __init__(self):
+        self._chunk_notes: dict[str, set[str]] = {}  # Chunk -> ids of notes containing it
+        self._gram_chunks: dict[str, set[str]] = {}  # Trigram -> chunks containing it
+        self._note_chunks: dict[str, set[str]] = {}
+        self._texts: dict[str, str] = {}  # Note id -> folded text, for verification
+        self._notes: dict[str, Note] = {}
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    @staticmethod
+    def note_text(note: Note) -> str:
+        """Case-folded text searched for a note (fields separated by newlines)."""
+        parts = [note.title, note.content]
+        parts.extend(t.text for t in note.tasks)
+        return "\n".join(parts).casefold()
+
+    def rebuild(self, notes: list[Note]) -> None:
+        """Index all notes from scratch."""
+        self._chunk_notes.clear()
+        self._gram_chunks.clear()
+        self._note_chunks.clear()
+        self._texts.clear()
+        self._notes.clear()
+        chunk_notes = self._chunk_notes
+        for note in notes:
+            text = self.note_text(note)
+            chunks = set(text.split())
+            self._texts[note.id] = text
+            self._note_chunks[note.id] = chunks
+            self._notes[note.id] = note
+            for chunk in chunks:
+                ids = chunk_notes.get(chunk)
+                if ids is None:
+                    chunk_notes[chunk] = {note.id}
+                else:
+                    ids.add(note.id)
+        for chunk in chunk_notes:
+            self._add_chunk_grams(chunk)
+
+    def sync(self, notes: list[Note]) -> None:
+        """Reconcile with the current notes list, re-indexing only notes not seen before."""
+        seen = set()
+        for note in notes:
+            seen.add(note.id)
+            if self._notes.get(note.id) is not note:
+                self.update_note(note)
+        for note_id in self._notes.keys() - seen:
+            self.remove_note(note_id)
+
+    def note_updated(self, note: Note, fields: frozenset[str] | None) -> None:
+        """Viewmodel change event: re-index when an indexed field changed."""
+        if fields is None or fields & self.INDEXED_FIELDS:
+            self.update_note(note)
+
+    def update_note(self, note: Note) -> None:
+        """Add or re-index a single note, touching only the chunks that changed."""
+        text = self.note_text(note)
+        self._notes[note.id] = note
+        if self._texts.get(note.id) == text:
+            return
+        self._texts[note.id] = text
+        self._set_chunks(note.id, set(text.split()))
+
+    def remove_note(self, note_id: str) -> None:
+        """Drop a note from the index."""
+        if note_id in self._notes:
+            self._set_chunks(note_id, set())
+            del self._note_chunks[note_id]
+            del self._texts[note_id]
+            del self._notes[note_id]
+
+    def _set_chunks(self, note_id: str, chunks: set[str]) -> None:
+        old = self._note_chunks.get(note_id, set())
+        for chunk in old - chunks:
+            ids = self._chunk_notes[chunk]
+            ids.discard(note_id)
+            if not ids:
+                del self._chunk_notes[chunk]
+                self._remove_chunk_grams(chunk)
+        for chunk in chunks - old:
+            ids = self._chunk_notes.get(chunk)
+            if ids is None:
+                self._chunk_notes[chunk] = {note_id}
+                self._add_chunk_grams(chunk)
+            else:
+                ids.add(note_id)
+        self._note_chunks[note_id] = chunks
+
+    def _add_chunk_grams(self, chunk: str) -> None:
+        for gram in trigrams(chunk):
+            chunks = self._gram_chunks.get(gram)
+            if chunks is None:
+                self._gram_chunks[gram] = {chunk}
+            else:
+                chunks.add(chunk)
+
+    def _remove_chunk_grams(self, chunk: str) -> None:
+        for gram in trigrams(chunk):
+            chunks = self._gram_chunks[gram]
+            chunks.discard(chunk)
+            if not chunks:
+                del self._gram_chunks[gram]
+
+    def _chunks_containing(self, fragment: str):
+        """Vocabulary chunks that contain a whitespace-free fragment."""
+        if len(fragment) < self.MIN_QUERY_LENGTH:
+            return (chunk for chunk in self._chunk_notes if fragment in chunk)
+        sets = [self._gram_chunks.get(g) for g in trigrams(fragment)]
+        if not all(sets):
+            return ()
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+        return (chunk for chunk in candidates if fragment in chunk)
+
+    def _matching_ids(self, q: str) -> set[str]:
+        """Ids of notes whose text contains q (already case-folded)."""
+        parts = q.split()
+        if not parts:
+            return set()
+        # Resolve the longest whitespace-free part through the chunk index
+        anchor = max(parts, key=len)
+        ids: set[str] = set()
+        for chunk in self._chunks_containing(anchor):
+            ids |= self._chunk_notes[chunk]
+        if anchor != q:
+            texts = self._texts
+            ids = {note_id for note_id in ids if q in texts[note_id]}
+        return ids
+
+    def search(self, query: str, limit: int | None = 50) -> list[str]:
+        """Ids of notes whose text contains query (case-insensitive), ordered by id."""
+        q = query.strip().casefold()
+        if not q:
+            return []
+        ids = self._matching_ids(q)
+        if limit is None:
+            return sorted(ids)
+        return heapq.nsmallest(limit, ids)
+
+    def fuzzy_search(self, query: str, max_errors: int = 1, limit: int | None = 50) -> list[str]:
+        """Ids of notes containing query with at most max_errors typos, closest first.
+        Queries shorter than MIN_QUERY_LENGTH * (max_errors + 1) return no fuzzy matches.
+        """
+        q = query.strip().casefold()
+        n = max_errors + 1
+        if len(q) < self.MIN_QUERY_LENGTH * n:
+            return []
+        # Pigeonhole: split q into max_errors + 1 pieces; any match contains one piece exactly
+        bounds = [len(q) * i // n for i in range(n + 1)]
+        best: dict[str, int] = {}
+        for offset, end in zip(bounds, bounds[1:]):
+            piece = q[offset:end]
+            if not piece.strip():
+                continue
+            for note_id in self._matching_ids(piece):
+                if best.get(note_id) == 0:
+                    continue
+                errors = self._anchored_distance(q, piece, offset, self._texts[note_id], max_errors)
+                if errors is not None and errors < best.get(note_id, max_errors + 1):
+                    best[note_id] = errors
+        matches = [(errors, note_id) for note_id, errors in best.items()]
+        if limit is None:
+            matches.sort()
+        else:
+            matches = heapq.nsmallest(limit, matches)
+        return [note_id for _, note_id in matches]
+
+    @staticmethod
+    def _anchored_distance(q: str, piece: str, offset: int, text: str, max_errors: int) -> int | None:
+        """Closest distance of q to text around each occurrence of one of its pieces."""
+        if q in text:
+            return 0
+        best = None
+        i = text.find(piece)
+        while i != -1:
+            start = max(0, i - offset - max_errors)
+            window = text[start:i - offset + len(q) + max_errors]
+            errors = substring_edit_distance(q, window, max_errors)
+            if errors is not None and (best is None or errors < best):
+                best = errors
+                if best == 1:
+                    break  # q itself is not in text, so one edit is the best possible
+            i = text.find(piece, i + 1)
+        return best
@@ -0,0 +1,326 @@
+"""
+VersionStore - Per-note version history in an append-only side file (notes.history).
+
+Each version is a note encoded as JSON, stored zlib-compressed either whole (a keyframe,
+every KEYFRAME_EVERY versions) or as a delta against the previous version: the bytes
+that replace everything between their common prefix and suffix. Any version is read
+by bisecting to the nearest keyframe and applying fewer than KEYFRAME_EVERY deltas.
+
+Versions are written at most once per INTERVAL_SECONDS per note while it is being
+edited (and on save). mark() does no file I/O, so it can run on every keystroke: the
+file is opened, and pending versions written, by flush_due() (run from a timer) or
+flush().
+
+compact() rewrites the file under the retention policy: everything from the last day,
+one version per day for KEEP_DAYS, at most MAX_VERSIONS per note; histories of deleted
+notes go once their last version is KEEP_DAYS old.
+"""
+
+import logging
+import os
+import struct
+import time
+import zlib
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from models.note import Note
+from services import json_codec
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"SNVH"
+_HEADER = struct.Struct("<4sBd")  # magic, format version, compacted_at
+_RECORD = struct.Struct("<BBIdI")  # id length, kind, seq, timestamp, payload length
+_DELTA = struct.Struct("<II")  # common prefix, common suffix (bytes)
+_KEYFRAME, _DELTA_KIND = 0, 1
+_DAY = 86400
+
+
+def common_affixes(old, new) -> tuple[int, int]:
+    """Lengths of the common prefix and (non-overlapping) common suffix of two str/bytes.
+    Binary search on slice equality: O(n log n) in C rather than a per-character loop.
+    """
+    limit = min(len(old), len(new))
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[:mid] == new[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    prefix = lo
+    lo, hi = 0, limit - prefix
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[len(old) - mid:] == new[len(new) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return prefix, lo
+
+
+class _History:
+    """Versions of one note, in seq order: where each record is and which are keyframes."""
+
+    __slots__ = ("seqs", "times", "offsets", "lengths", "keyframes")
+
+    def __init__(self):
+        self.seqs: list[int] = []
+        self.times: list[float] = []
+        self.offsets: list[int] = []  # File offset of each record's payload
+        self.lengths: list[int] = []  # Compressed payload sizes
+        self.keyframes: list[int] = []  # Positions (into seqs) of keyframe records
+
+
+class VersionStore:
+    """Reads and appends note versions; keeps only an index of the records in memory."""
+
+    KEYFRAME_EVERY = 16
+    INTERVAL_SECONDS = 120
+    KEEP_ALL_SECONDS = _DAY
+    KEEP_DAYS = 30
+    MAX_VERSIONS = 200
+    COMPACT_EVERY_SECONDS = _DAY
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._histories: dict[str, _History] = {}
+        self._latest: dict[str, bytes] = {}  # Text of the newest version, for notes written this session
+        self._pending: dict[str, tuple[Note, float]] = {}  # note id -> (note, first change time)
+        self._baselines: dict[str, bytes] = {}  # note id -> state before its first pending change
+        self.compacted_at = time.time()  # Read from the file header, if there is a file
+        self._loaded = False
+
+    def _ensure_index(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            self._load_index()
+
+    def _load_index(self) -> None:
+        """Scan record headers (not payloads); a torn record at the end is cut off."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            header = f.read(_HEADER.size)
+            bad = len(header) < _HEADER.size or header[:4] != _MAGIC
+            if not bad:
+                self.compacted_at = _HEADER.unpack(header)[2]
+            end = f.seek(0, os.SEEK_END)
+            offset = f.seek(_HEADER.size)
+            while not bad and offset + _RECORD.size <= end:
+                id_len, kind, seq, ts, length = _RECORD.unpack(f.read(_RECORD.size))
+                payload_at = offset + _RECORD.size + id_len
+                if payload_at + length > end:
+                    break
+                note_id = f.read(id_len).decode("ascii")
+                self._index(note_id, kind, seq, ts, payload_at, length)
+                offset = f.seek(payload_at + length)
+        if bad:
+            # Keep the unreadable file aside and start a new history
+            logger.warning("Unreadable version history %s, starting a new one", self.path)
+            os.replace(self.path, self.path.with_suffix(".bad"))
+        elif offset < end:
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def _index(self, note_id: str, kind: int, seq: int, ts: float, payload_at: int, length: int) -> None:
+        history = self._histories.get(note_id)
+        if history is None:
+            history = self._histories[note_id] = _History()
+        if kind == _KEYFRAME:
+            history.keyframes.append(len(history.seqs))
+        history.seqs.append(seq)
+        history.times.append(ts)
+        history.offsets.append(payload_at)
+        history.lengths.append(length)
+
+    def has_history(self, note_id: str) -> bool:
+        self._ensure_index()
+        return note_id in self._histories or note_id in self._pending
+
+    def pending(self, note_id: str) -> bool:
+        """Whether the note has changes waiting to be written."""
+        return note_id in self._pending
+
+    def versions(self, note_id: str) -> list[tuple[int, float]]:
+        """(seq, timestamp) of each stored version of a note, oldest first."""
+        self._ensure_index()
+        history = self._histories.get(note_id)
+        return list(zip(history.seqs, history.times)) if history else []
+
+    # Writing
+
+    def mark(self, note: Note, baseline: dict | None = None) -> None:
+        """Note changed; its new state is written by the first flush_due() at least
+        INTERVAL_SECONDS later (or by flush()). baseline is the note's state before this
+        change, written first if the note has no history yet. No file I/O.
+        """
+        if note.id not in self._pending:
+            self._pending[note.id] = (note, time.time())
+            if baseline is not None:
+                self._baselines[note.id] = json_codec.dumps(baseline)
+
+    def flush_due(self, now: float | None = None) -> None:
+        """Write notes that have been changing for at least INTERVAL_SECONDS."""
+        now = time.time() if now is None else now
+        due = [note for note, since in self._pending.values() if now - since >= self.INTERVAL_SECONDS]
+        if due:
+            self.flush(due, now)
+
+    def flush(self, notes: list[Note] | None = None, now: float | None = None) -> None:
+        """Write the pending versions of notes (all pending notes if None)."""
+        if notes is None:
+            notes = [note for note, _ in self._pending.values()]
+        now = time.time() if now is None else now
+        baselines = {}
+        texts = {}
+        for note in notes:
+            if self._pending.pop(note.id, None) is not None:
+                baseline = self._baselines.pop(note.id, None)
+                if baseline is not None:
+                    baselines[note.id] = baseline
+                texts[note.id] = json_codec.dumps(note.to_dict())
+        if baselines:
+            self._ensure_index()
+            self._write({note_id: baseline for note_id, baseline in baselines.items()
+                         if note_id not in self._histories}, now)
+        if texts:
+            self._write(texts, now)
+
+    def _write(self, texts: dict[str, bytes], now: float) -> None:
+        """Append one version per note (skipping unchanged ones) in a single write."""
+        self._ensure_index()
+        chunks = []
+        records = []
+        new_file = not self.path.exists()
+        offset = _HEADER.size if new_file else self.path.stat().st_size
+        for note_id, text in texts.items():
+            history = self._histories.get(note_id)
+            previous = self._latest.get(note_id)
+            if previous is None and history is not None:
+                previous = self._read(history, len(history.seqs) - 1)
+            if previous == text:
+                continue
+            count = len(history.seqs) if history else 0
+            since_keyframe = count - history.keyframes[-1] if history and history.keyframes else count
+            kind, payload = _KEYFRAME, zlib.compress(text)
+            if previous is not None and since_keyframe < self.KEYFRAME_EVERY:
+                prefix, suffix = common_affixes(previous, text)
+                delta = zlib.compress(_DELTA.pack(prefix, suffix) + text[prefix:len(text) - suffix])
+                if len(delta) < len(payload) // 2:
+                    kind, payload = _DELTA_KIND, delta
+            seq = history.seqs[-1] + 1 if history else 0
+            raw_id = note_id.encode("ascii")
+            chunks.append(_RECORD.pack(len(raw_id), kind, seq, now, len(payload)) + raw_id + payload)
+            payload_at = offset + _RECORD.size + len(raw_id)
+            records.append((note_id, kind, seq, now, payload_at, len(payload)))
+            offset = payload_at + len(payload)
+            self._latest[note_id] = text
+        if not chunks:
+            return
+        try:
+            with open(self.path, "ab") as f:
+                if new_file:
+                    f.write(_HEADER.pack(_MAGIC, 1, self.compacted_at))
+                f.write(b"".join(chunks))
+        except (IOError, OSError):
+            logger.warning("Could not write version history to %s", self.path)
+            for note_id, *_ in records:
+                self._latest.pop(note_id, None)
+            return
+        for record in records:
+            self._index(*record)
+
+    # Reading
+
+    def _read(self, history: _History, pos: int, f=None) -> bytes:
+        """Text of the version at position pos: its keyframe plus the deltas after it."""
+        if f is None:
+            with open(self.path, "rb") as f:
+                return self._read(history, pos, f)
+        start = history.keyframes[bisect_right(history.keyframes, pos) - 1]
+        text = b""
+        for i in range(start, pos + 1):
+            f.seek(history.offsets[i])
+            payload = zlib.decompress(f.read(history.lengths[i]))
+            if i == start:
+                text = payload
+            else:
+                prefix, suffix = _DELTA.unpack_from(payload)
+                text = text[:prefix] + payload[_DELTA.size:] + text[len(text) - suffix:]
+        return text
+
+    def get(self, note_id: str, seq: int) -> dict | None:
+        """A stored version as note data (for Note.from_dict), or None if there is no such version."""
+        self._ensure_index()
+        history = self._histories.get(note_id)
+        if history is None:
+            return None
+        pos = bisect_left(history.seqs, seq)
+        if pos == len(history.seqs) or history.seqs[pos] != seq:
+            return None
+        return json_codec.loads(self._read(history, pos))
+
+    # Compaction
+
+    def _kept(self, times: list[float], now: float) -> list[int]:
+        """Positions kept by the retention policy (the newest version always is)."""
+        kept = []
+        last_day = None
+        for pos in range(len(times) - 1, -1, -1):
+            day = int(times[pos] // _DAY)
+            age = now - times[pos]
+            if pos == len(times) - 1 or age < self.KEEP_ALL_SECONDS:
+                kept.append(pos)
+            elif age < self.KEEP_DAYS * _DAY and day != last_day:
+                kept.append(pos)
+            last_day = day
+        return kept[:self.MAX_VERSIONS][::-1]
+
+    def maybe_compact(self, live_ids, now: float | None = None) -> bool:
+        """Compact if the last compaction is more than COMPACT_EVERY_SECONDS old."""
+        now = time.time() if now is None else now
+        self._ensure_index()  # Reads compacted_at
+        if now - self.compacted_at < self.COMPACT_EVERY_SECONDS:
+            return False
+        self.compact(live_ids, now)
+        return True
+
+    def compact(self, live_ids, now: float | None = None) -> None:
+        """Rewrite the file keeping what the retention policy keeps, with fresh keyframes."""
+        now = time.time() if now is None else now
+        self.flush(now=now)
+        self._ensure_index()
+        if not self.path.exists():
+            self.compacted_at = now
+            return
+        live_ids = set(live_ids)
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            with open(self.path, "rb") as src, open(tmp, "wb") as dst:
+                dst.write(_HEADER.pack(_MAGIC, 1, now))
+                for note_id, history in self._histories.items():
+                    if note_id not in live_ids and now - history.times[-1] >= self.KEEP_DAYS * _DAY:
+                        continue
+                    raw_id = note_id.encode("ascii")
+                    previous = None
+                    for n, pos in enumerate(self._kept(history.times, now)):
+                        text = self._read(history, pos, src)
+                        kind, payload = _KEYFRAME, zlib.compress(text)
+                        if n % self.KEYFRAME_EVERY:
+                            prefix, suffix = common_affixes(previous, text)
+                            kind = _DELTA_KIND
+                            payload = zlib.compress(_DELTA.pack(prefix, suffix) + text[prefix:len(text) - suffix])
+                        previous = text
+                        dst.write(_RECORD.pack(len(raw_id), kind, history.seqs[pos], history.times[pos],
+                                               len(payload)) + raw_id + payload)
+            os.replace(tmp, self.path)
+        except (IOError, OSError):
+            logger.warning("Could not compact version history %s", self.path)
+            return
+        self._histories.clear()
+        self._latest.clear()
+        self._load_index()
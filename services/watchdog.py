@@ -0,0 +1,169 @@
+"""
+Watchdog - Detects event-loop stalls and which callback caused them.
+
+The main loop runs a tick every interval; a tick that fires late means the loop was
+blocked. Meanwhile a helper thread samples the main thread's stack whenever a tick is
+overdue, so each stall is recorded with the handler that was running (the first frame
+below tkinter's dispatch) and its most common stack.
+
+STICKY_WATCHDOG=1 starts it at launch (a number sets the stall threshold in ms); it
+can also be toggled from the diagnostics menu.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Callable
+
+from services import metrics
+
+logger = logging.getLogger(__name__)
+
+WATCHDOG_ENV = "STICKY_WATCHDOG"
+
+
+def _env_threshold() -> float | None:
+    """Stall threshold (ms) requested via STICKY_WATCHDOG, or None if not set."""
+    value = os.environ.get(WATCHDOG_ENV, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return None
+    try:
+        threshold = float(value)
+    except ValueError:
+        return LagWatchdog.THRESHOLD_MS
+    return threshold if threshold > 1 else LagWatchdog.THRESHOLD_MS  # "1" means on
+
+
+ENV_THRESHOLD_MS = _env_threshold()
+
+
+def _frame_label(frame: traceback.FrameSummary) -> str:
+    return f"{Path(frame.filename).stem}.{frame.name}:{frame.lineno}"
+
+
+def _is_tkinter(frame: traceback.FrameSummary) -> bool:
+    return f"{os.sep}tkinter{os.sep}" in frame.filename
+
+
+class LagWatchdog:
+    """Measures tick lateness on the main loop; samples the main thread's stack while it is stuck."""
+
+    INTERVAL_MS = 100
+    THRESHOLD_MS = 200.0
+    SAMPLE_MS = 20  # Stack sampling period while a tick is overdue
+    MAX_STALLS = 200
+    STACK_DEPTH = 30
+
+    def __init__(self, schedule: Callable[[int, Callable], Any], threshold_ms: float | None = None):
+        self._schedule = schedule  # schedule(ms, callback), e.g. a Tk widget's after
+        self.threshold_ms = threshold_ms or self.THRESHOLD_MS
+        self.stalls: deque[dict] = deque(maxlen=self.MAX_STALLS)
+        self._running = False
+        self._generation = 0  # Bumped on start, so ticks and samplers of an earlier run stop
+        self._main_ident = threading.main_thread().ident
+        self._due = 0.0  # perf_counter time the next tick should fire
+        self._samples: Counter = Counter()  # Stacks seen during the current overdue period
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._generation += 1
+        self._arm()
+        threading.Thread(target=self._sample_loop, args=(self._generation,),
+                         name="lag-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        self._running = False  # The pending tick and the sampler both exit on their next turn
+
+    def _arm(self) -> None:
+        generation = self._generation
+        self._due = time.perf_counter() + self.INTERVAL_MS / 1000
+        self._schedule(self.INTERVAL_MS, lambda: self._tick(generation))
+
+    def _tick(self, generation: int) -> None:
+        if not self._running or generation != self._generation:
+            return
+        lag_ms = (time.perf_counter() - self._due) * 1000
+        with self._lock:
+            samples, self._samples = self._samples, Counter()
+        if metrics.ENABLED:
+            metrics.metrics.record("mainloop.lag", int(max(0.0, lag_ms) * 1000))
+        if lag_ms >= self.threshold_ms:
+            self._record_stall(lag_ms, samples)
+        self._arm()
+
+    def _record_stall(self, lag_ms: float, samples: Counter) -> None:
+        stack, seen = samples.most_common(1)[0] if samples else ((), 0)
+        handler = self.handler(stack)
+        self.stalls.append({
+            "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "lag_ms": round(lag_ms, 1),
+            "handler": handler,
+            "samples": sum(samples.values()),
+            "stack_samples": seen,
+            "stack": list(stack),
+        })
+        logger.warning("Main loop stalled %.0f ms in %s", lag_ms, handler or "unknown")
+
+    @staticmethod
+    def handler(stack: tuple[str, ...]) -> str | None:
+        """The callback tkinter dispatched to: the first app frame after the outermost run
+        of tkinter frames (mainloop, CallWrapper). Tkinter calls made by the callback
+        itself (destroy, configure, update_idletasks) are deeper, so they are not blamed.
+        """
+        if "tkinter" not in stack:
+            return stack[0] if stack else None
+        i = stack.index("tkinter")
+        while i < len(stack) and stack[i] == "tkinter":
+            i += 1
+        return stack[i] if i < len(stack) else "tkinter"
+
+    def _sample_loop(self, generation: int) -> None:
+        while self._running and generation == self._generation:
+            time.sleep(self.SAMPLE_MS / 1000)
+            overdue_ms = (time.perf_counter() - self._due) * 1000
+            if overdue_ms < self.threshold_ms / 2:
+                continue
+            frame = sys._current_frames().get(self._main_ident)
+            if frame is None:
+                continue
+            summary = traceback.extract_stack(frame, limit=self.STACK_DEPTH)
+            del frame
+            # Stack as labels, outermost first; tkinter frames are kept as "tkinter" markers
+            stack = tuple("tkinter" if _is_tkinter(f) else _frame_label(f) for f in summary)
+            with self._lock:
+                self._samples[stack] += 1
+
+    def summary(self) -> dict[str, dict]:
+        """Stalls grouped by handler: count and worst/total lag."""
+        by_handler: dict[str, dict] = {}
+        for stall in self.stalls:
+            entry = by_handler.setdefault(stall["handler"] or "unknown",
+                                          {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + stall["lag_ms"], 1)
+            entry["max_ms"] = max(entry["max_ms"], stall["lag_ms"])
+        return dict(sorted(by_handler.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+    def dump(self, path: Path | None = None) -> Path:
+        """Write the stalls as JSON (next to the metrics dumps by default)."""
+        if path is None:
+            folder = metrics.metrics.output_dir
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"stalls-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        report = {"threshold_ms": self.threshold_ms, "by_handler": self.summary(), "stalls": list(self.stalls)}
+        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info("Stall report written to %s", path)
+        return Path(path)
@@ -0,0 +1,65 @@
+"""Tests for BackupStore: generation naming, deduplication across packs and reloading."""
+
+from models.note import Note
+from services.backup_store import BackupStore
+
+
+def _notes(*contents: str) -> list[Note]:
+    return [Note(title=f"Note {i}", content=content, note_id=f"n{i}") for i, content in enumerate(contents)]
+
+
+def _dicts(notes: list[Note]) -> list[dict]:
+    return [n.to_dict() for n in notes]
+
+
+def test_generations_in_the_same_second_do_not_replace_each_other(tmp_path):
+    a = _notes("alpha", "beta")
+    b = _notes("gamma", "delta")
+    store = BackupStore(tmp_path)
+    first = store.take(a, now=1000.0)
+    second = store.take(b, now=1000.4)
+    assert first != second
+    third = store.take(_notes("alpha", "beta"), now=5000.0)  # Deduplicates against the first pack
+
+    assert _dicts(store.load(first)) == _dicts(a)
+    assert _dicts(store.load(second)) == _dicts(b)
+    assert _dicts(store.load(third)) == _dicts(a)
+    fresh = BackupStore(tmp_path)
+    assert {g["id"] for g in fresh.generations()} == {first, second, third}
+    assert _dicts(fresh.load(third)) == _dicts(a)
+
+
+def test_unchanged_notes_are_not_written_again(tmp_path):
+    notes = _notes("one", "two", "three")
+    store = BackupStore(tmp_path)
+    store.take(notes, now=1000.0)
+    notes[1].content = "two, edited"
+    generation = store.take(notes, changed_ids={notes[1].id}, now=2000.0)
+    assert len(list((tmp_path / "packs").glob("*.pack"))) == 2
+    assert _dicts(BackupStore(tmp_path).load(generation)) == _dicts(notes)
+
+
+def test_seed_reuses_digests_of_the_same_source(tmp_path):
+    notes = _notes("one", "two")
+    store = BackupStore(tmp_path)
+    store.take(notes, now=1000.0, source="abc")
+    fresh = BackupStore(tmp_path)
+    assert not fresh.seed(notes, "other")
+    assert fresh.seed(notes, "abc")
+    generation = fresh.take(notes, changed_ids=set(), now=2000.0, source="abc")
+    assert len(list((tmp_path / "packs").glob("*.pack"))) == 1  # Nothing new to write
+    assert _dicts(fresh.load(generation)) == _dicts(notes)
+
+
+def test_prune_keeps_retained_generations_loadable(tmp_path):
+    store = BackupStore(tmp_path)
+    hour = 3600.0
+    for i in range(6):  # Two per hour: the older of each pair is dropped
+        notes = _notes(f"version {i}", "constant")
+        store.take(notes, now=1_000_000 * hour + (i // 2) * hour + (i % 2) * 60)
+    assert store.prune() == 3
+    fresh = BackupStore(tmp_path)
+    generations = fresh.generations()
+    assert len(generations) == 3
+    for generation in generations:
+        assert fresh.load(generation["id"])[1].content == "constant"
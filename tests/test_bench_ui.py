@@ -0,0 +1,20 @@
+"""Tests for the UI benchmark's latency statistics (the harness itself needs a display)."""
+
+import pytest
+
+from benchmarks.bench_ui import _stats
+
+
+def test_stats_of_one_hundred_samples():
+    samples = [float(ms) for ms in range(100, 0, -1)]  # Unsorted input
+    assert _stats(samples) == {"count": 100, "median_ms": 50.5, "p95_ms": 95.0, "max_ms": 100.0}
+
+
+@pytest.mark.parametrize("count, p95", [(1, 7.0), (2, 8.0), (19, 25.0), (20, 25.0), (21, 26.0)])
+def test_p95_is_the_nearest_rank(count, p95):
+    samples = [7.0 + i for i in range(count)]
+    assert _stats(samples)["p95_ms"] == p95
+
+
+def test_stats_round_to_microseconds():
+    assert _stats([1.23456, 2.34567]) == {"count": 2, "median_ms": 1.79, "p95_ms": 2.346, "max_ms": 2.346}
@@ -0,0 +1,58 @@
+"""Tests for IdAllocator: ids are fixed-width, unique and sort in allocation order."""
+
+import random
+
+import pytest
+
+from models import ids
+from models.ids import ID_LENGTH, SEQ_BITS, IdAllocator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time_ns, frozen until a test moves it."""
+    now = [1_700_000_000_000 * 1_000_000]
+    monkeypatch.setattr(ids.time, "time_ns", lambda: now[0])
+    return now
+
+
+def test_ids_within_one_millisecond_are_unique_and_ascending(clock):
+    allocator = IdAllocator(random.Random(1))
+    made = [allocator.new_id() for _ in range(5000)]
+    made += allocator.new_ids(5000)
+    assert len(set(made)) == len(made)
+    assert made == sorted(made)
+    assert all(len(i) == ID_LENGTH for i in made)
+
+
+def test_ids_stay_ascending_across_milliseconds_and_a_clock_step_back(clock):
+    allocator = IdAllocator(random.Random(2))
+    made = []
+    for step in (0, 1_000_000, 5_000_000, -3_000_000, 1_000_000):
+        clock[0] += step
+        made += [allocator.new_id() for _ in range(10)]
+    assert len(set(made)) == len(made)
+    assert made == sorted(made)
+
+
+def test_exhausted_sequence_advances_the_timestamp(clock):
+    rng = random.Random()
+    rng.getrandbits = lambda bits: (1 << bits) - 1  # Start at the top of the lower half
+    allocator = IdAllocator(rng)
+    made = allocator.new_ids((1 << (SEQ_BITS - 1)) + 5)
+    assert len(set(made)) == len(made)
+    assert made == sorted(made)
+    clock[0] += 1_000_000  # Next millisecond is already used: keep counting from the last id
+    later = allocator.new_id()
+    assert later > made[-1]
+
+
+def test_taken_ids_are_skipped_without_breaking_order(clock):
+    allocator = IdAllocator(random.Random(3))
+    probe = IdAllocator(random.Random(3))
+    taken = set(probe.new_ids(20)[::2])
+    made = allocator.new_ids(20, taken)
+    assert len(made) == 20
+    assert not taken.intersection(made)
+    assert made == sorted(made)
+    assert allocator.new_id(taken) > made[-1]
@@ -0,0 +1,44 @@
+"""Tests for json_codec: orjson and stdlib json must write byte-identical notes files."""
+
+import pytest
+
+from benchmarks.corpus import make_notes
+from models.schema import SCHEMA_VERSION, encode_list
+from services import json_codec
+
+pytest.importorskip("orjson")
+
+DOCUMENTS = [
+    {"schema_version": SCHEMA_VERSION, "notes": encode_list(make_notes(50, seed=4))},
+    {"title": "Ünïcode ✓   emoji \U0001F600", "quote": 'a "b" \\ c', "ctl": "tab\there\nnl\x01"},
+    {"nested": [[], {}, [1, 2.5, -3]], "flags": [True, False, None], "big": 2 ** 53},
+    [],
+    {},
+]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    def use(name):
+        monkeypatch.setattr(json_codec, "BACKEND", name)
+    return use
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_backends_write_identical_bytes(backend, doc, pretty):
+    backend("orjson")
+    fast = json_codec.dumps(doc, pretty)
+    backend("json")
+    slow = json_codec.dumps(doc, pretty)
+    assert fast == slow
+    assert json_codec.loads(slow) == doc
+    backend("orjson")
+    assert json_codec.loads(fast) == doc
+
+
+def test_decode_errors_share_one_type(backend):
+    for name in ("orjson", "json"):
+        backend(name)
+        with pytest.raises(json_codec.JSONDecodeError):
+            json_codec.loads(b"{not json")
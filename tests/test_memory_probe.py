@@ -0,0 +1,75 @@
+"""Tests for MemoryProbe: snapshot counts and growth() on a Tcl interpreter (no display needed)."""
+
+import tkinter
+
+import pytest
+
+from services.memory_probe import MemoryProbe
+
+
+class _Widget:
+    """Stand-in for a Tk widget: only winfo_children is used by the probe."""
+
+    def __init__(self, children=()):
+        self.children = list(children)
+
+    def winfo_children(self):
+        return self.children
+
+
+class _Root(_Widget):
+    def __init__(self, interp: tkinter.Tk):
+        super().__init__()
+        self.interp = interp
+        self.tk = interp.tk
+
+
+class _Leaked:
+    pass
+
+
+@pytest.fixture
+def root():
+    return _Root(tkinter.Tcl())
+
+
+def test_counts_nested_widgets_vars_and_commands(root):
+    probe = MemoryProbe(root)
+    before = probe.snapshot("before")
+    root.children = [_Widget([_Widget(), _Widget([_Widget()])]), _Widget()]
+    keep = [tkinter.StringVar(root.interp, value="x") for _ in range(3)]
+    root.interp.register(lambda: None)
+    after = probe.snapshot("after")
+    assert after["widgets"] == 5 and before["widgets"] == 0
+    assert after["tcl_vars"] - before["tcl_vars"] == len(keep)
+    assert after["tcl_commands"] - before["tcl_commands"] == 1
+    assert list(probe.history) == [before, after]
+
+
+def test_growth_is_empty_when_everything_is_released(root):
+    probe = MemoryProbe(root)
+    before = probe.snapshot()
+    for _ in range(3):  # Build and tear down, as a repopulate does
+        root.children = [_Widget() for _ in range(10)]
+        variables = [tkinter.StringVar(root.interp) for _ in range(10)]
+        objects = [_Leaked() for _ in range(MemoryProbe.OBJECT_SLACK * 2)]
+        root.children = []
+        del variables, objects
+    assert probe.growth(before, probe.snapshot()) == []
+
+
+def test_growth_reports_what_kept_growing(root):
+    probe = MemoryProbe(root)
+    before = probe.snapshot()
+    root.children = [_Widget() for _ in range(4)]
+    leaked_vars = [tkinter.StringVar(root.interp) for _ in range(2)]
+    leaked = [_Leaked() for _ in range(MemoryProbe.OBJECT_SLACK + 1)]
+    extra = [_Widget() for _ in range(MemoryProbe.OBJECT_SLACK - 4)]  # 200 _Widgets: within the slack
+    after = probe.snapshot()
+    problems = probe.growth(before, after)
+    assert "widgets: 0 -> 4" in problems
+    assert f"tcl_vars: {before['tcl_vars']} -> {before['tcl_vars'] + len(leaked_vars)}" in problems
+    assert f"_Leaked objects: +{len(leaked)}" in problems
+    assert not any(p.startswith("_Widget objects") for p in problems)
+    assert not any(p.startswith("widgets") for p in probe.growth(before, after, tolerance=4))
+    assert extra
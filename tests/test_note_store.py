@@ -0,0 +1,75 @@
+"""Tests for NoteStore: columnar counts and filters agree with plain scans over the notes."""
+
+from collections import Counter
+from datetime import date
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+from services.note_store import NoteStore
+
+
+def _store(notes: list[Note]) -> NoteStore:
+    store = NoteStore()
+    store.rebuild(notes)
+    return store
+
+
+def _check(store: NoteStore, notes: list[Note]) -> None:
+    """Every aggregation matches the same query answered from the Note objects."""
+    statuses = Counter(n.status for n in notes)
+    colors = Counter(n.color for n in notes)
+    assert len(store) == len(notes)
+    assert {k: v for k, v in store.count_by_status().items() if v} == statuses
+    assert {k: v for k, v in store.count_by_color().items() if v} == colors
+    for status in statuses:
+        assert sorted(store.filter_ids(status=status)) == sorted(n.id for n in notes if n.status == status)
+        for color in list(colors)[:3]:
+            expected = [n.id for n in notes if n.status == status and n.color == color]
+            assert sorted(store.filter_ids(status=status, color=color)) == sorted(expected)
+            assert store.count(status=status, color=color) == len(expected)
+    lo, hi = date(2025, 1, 1), date(2025, 12, 31)
+    due = [n.id for n in notes if n.due_date and lo.isoformat() <= n.due_date <= hi.isoformat()]
+    assert sorted(store.filter_ids(due_from=lo, due_to=hi)) == sorted(due)
+    histogram = Counter(date.fromisoformat(n.due_date) for n in notes
+                        if n.due_date and lo.isoformat() <= n.due_date < hi.isoformat())
+    assert store.due_histogram(lo, hi) == histogram
+
+
+def test_counts_and_filters_match_object_scan():
+    notes = make_notes(500, seed=3)
+    _check(_store(notes), notes)
+
+
+def test_incremental_updates_match_rebuild():
+    notes = make_notes(300, seed=4)
+    store = _store(notes)
+    for note in notes[::7]:
+        note.status = Note.STATUS_DEFERRED
+        note.color = Note.COLORS[2]
+        note.due_date = "2025-06-15"
+        store.note_updated(note, frozenset({"status", "color", "due_date"}))
+    for note in notes[::11]:
+        store.remove_note(note.id)
+    remaining = [n for i, n in enumerate(notes) if i % 11]
+    added = make_notes(20, seed=5)
+    for note in added:
+        note.id = "x" + note.id
+        store.update_note(note)
+    _check(store, remaining + added)
+
+
+def test_colors_past_the_byte_codes_are_counted_exactly():
+    notes = [Note(color=f"#{i:06x}") for i in range(300)]
+    store = _store(notes)
+    assert store.count(color="#00012b") == 1
+    assert store.filter_ids(color="#00012b") == [notes[0x12b].id]
+    assert sum(store.count_by_color().values()) == 300
+
+
+def test_float_sizes_are_stored():
+    note = Note.from_dict({"id": "a", "width": 300.5, "height": 280}, validate=True)
+    store = _store([note])
+    assert len(store) == 1
+    note.width = note.height = 411.7
+    store.note_updated(note, frozenset({"width", "height"}))
+    assert store.count() == 1
@@ -0,0 +1,96 @@
+"""Tests for the generated Note/TaskItem codecs, against the hand-written format they replaced."""
+
+import pytest
+
+from models.note import Note
+from models.schema import SchemaError, decode_list, encode_list
+from models.task_item import TaskItem
+
+
+def _legacy_to_dict(note: Note) -> dict:
+    """Note.to_dict as it was written by hand before the codecs were generated."""
+    return {
+        "id": note.id,
+        "title": note.title,
+        "content": note.content,
+        "color": note.color,
+        "tasks": [{"id": t.id, "text": t.text, "checked": t.checked} for t in note.tasks],
+        "width": note.width,
+        "height": note.height,
+        "due_date": note.due_date,
+        "completed": note.completed,
+        "status": note.status,
+    }
+
+
+def _legacy_from_dict(data: dict) -> Note:
+    """Note.from_dict as it was written by hand before the codecs were generated."""
+    tasks = [TaskItem(text=t.get("text", ""), checked=t.get("checked", False), task_id=t.get("id"))
+             for t in data.get("tasks", [])]
+    w = data.get("width", Note.DEFAULT_WIDTH)
+    h = data.get("height", Note.DEFAULT_HEIGHT)
+    size = max(w or Note.DEFAULT_WIDTH, h or Note.DEFAULT_HEIGHT)
+    completed = data.get("completed", False)
+    status = data.get("status")
+    if status is None:
+        status = Note.STATUS_COMPLETED if completed else Note.STATUS_NEW
+    return Note(title=data.get("title", "New Note"), content=data.get("content", ""),
+                color=data.get("color", Note.COLORS[0]), note_id=data.get("id"), tasks=tasks,
+                width=size, height=size, due_date=data.get("due_date"), completed=completed, status=status)
+
+
+STORED = [
+    {"id": "a1", "title": "Full", "content": "body", "color": "#BBDEFB",
+     "tasks": [{"id": "t1", "text": "one", "checked": True}, {"id": "t2", "text": "two", "checked": False}],
+     "width": 300, "height": 320, "due_date": "2026-10-19", "completed": False, "status": "in_progress"},
+    {"id": "a2"},  # Every other field defaulted
+    {"id": "a3", "completed": True},  # Status derived from completed
+    {"id": "a4", "width": None, "height": 200, "color": None, "status": None, "tasks": [{"id": "t3"}]},
+    {"id": "a5", "title": "Ünïcode ✓", "color": "#123456", "width": 280.5, "height": 100},
+]
+
+
+def _state(note: Note) -> dict:
+    return {**_legacy_to_dict(note), "deleted_at": note.deleted_at}
+
+
+@pytest.mark.parametrize("data", STORED, ids=[d["id"] for d in STORED])
+def test_decode_matches_hand_written_from_dict(data):
+    assert _state(Note.from_dict(data)) == _state(_legacy_from_dict(data))
+    assert _state(Note.from_dict(data, validate=True)) == _state(_legacy_from_dict(data))
+
+
+@pytest.mark.parametrize("data", STORED, ids=[d["id"] for d in STORED])
+def test_encode_matches_hand_written_to_dict(data):
+    note = _legacy_from_dict(data)
+    encoded = note.to_dict()
+    assert encoded == {**_legacy_to_dict(note), "deleted_at": None}
+    assert list(encoded) == [*_legacy_to_dict(note), "deleted_at"]  # Key order kept
+    assert _state(Note.from_dict(encoded)) == _state(note)
+
+
+def test_deleted_at_round_trips():
+    note = Note(title="gone", note_id="d1")
+    note.deleted_at = 1_700_000_000.5
+    assert Note.from_dict(note.to_dict()).deleted_at == 1_700_000_000.5
+
+
+def test_missing_ids_are_generated_and_shared_values_reused():
+    a, b = decode_list(Note, [{"color": "#FFF9C4", "tasks": [{}]}, {"color": "#FFF9C4"}])
+    assert a.id and b.id and a.id != b.id and a.tasks[0].id
+    assert a.color is b.color is Note.COLORS[0]
+    assert encode_list([a, b]) == [a.to_dict(), b.to_dict()]
+    assert encode_list([]) == []
+
+
+@pytest.mark.parametrize("items, path", [
+    ([{"id": "x", "title": 5}], "notes[0].title"),
+    ([{"id": "x"}, {"id": "y", "width": -1}], "notes[1].width"),
+    ([{"id": "x", "tasks": [{"id": "t", "checked": "yes"}]}], "notes[0].tasks[0].checked"),
+    ([["not", "a", "note"]], "notes[0]"),
+    ({"id": "x"}, "notes"),
+])
+def test_validation_names_the_bad_field(items, path):
+    with pytest.raises(SchemaError) as err:
+        decode_list(Note, items, validate=True)
+    assert err.value.path == path
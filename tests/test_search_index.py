@@ -0,0 +1,114 @@
+"""Tests for SearchIndex: results match a naive scan through adds, edits, removals and restores."""
+
+import random
+
+import pytest
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+from models.task_item import TaskItem
+from services.search_index import SearchIndex, tokenize
+
+
+def _naive(notes: list[Note], query: str) -> set[str]:
+    """Ids of notes containing every query token; the last one as a prefix unless query ends in a space."""
+    tokens = tokenize(query)
+    if not tokens:
+        return set()
+    prefix_last = not query[-1:].isspace() and len(tokens[-1]) >= SearchIndex.MIN_PREFIX_LENGTH
+    ids = set()
+    for note in notes:
+        words = set(tokenize(" ".join([note.title, note.content, *(t.text for t in note.tasks)])))
+        whole = tokens[:-1] if prefix_last else tokens
+        if all(t in words for t in whole) and (
+                not prefix_last or any(w.startswith(tokens[-1]) for w in words)):
+            ids.add(note.id)
+    return ids
+
+
+def _queries(notes: list[Note], rng: random.Random) -> list[str]:
+    queries = ["", "   ", "zzzzqqq", "a"]
+    for note in rng.sample(notes, min(10, len(notes))):
+        words = tokenize(note.content) or ["x"]
+        first, second = rng.choice(words), rng.choice(words)
+        queries += [first, first.upper(), first[:3], f"{first} {second[:2]}", f"{first} {second} ",
+                    rng.choice(tokenize(note.title))]
+    return queries
+
+
+def _check(index: SearchIndex, notes: list[Note], rng: random.Random) -> None:
+    assert len(index) == len(notes)
+    for query in _queries(notes, rng):
+        assert set(index.search(query, limit=None)) == _naive(notes, query), query
+
+
+def _mutate(index: SearchIndex, notes: list[Note], rng: random.Random) -> None:
+    """Apply random edits, additions and removals, reporting each to the index as the viewmodel does."""
+    words = tokenize(" ".join(n.content for n in notes[:20]))
+    for step in range(60):
+        action = rng.random()
+        if action < 0.2 or len(notes) < 5:
+            note = Note(title=" ".join(rng.choices(words, k=2)), content=" ".join(rng.choices(words, k=8)))
+            notes.append(note)
+            index.update_note(note)
+        elif action < 0.35:
+            index.remove_note(notes.pop(rng.randrange(len(notes))).id)
+        else:
+            note = rng.choice(notes)
+            field = rng.choice(["title", "content", "tasks", "color"])
+            if field == "tasks":
+                note.tasks.append(TaskItem(text=" ".join(rng.choices(words, k=3))))
+            elif field == "color":
+                note.cycle_color()
+            else:
+                setattr(note, field, " ".join(rng.choices(words, k=rng.randint(0, 6))))
+            index.note_updated(note, frozenset({field}))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_results_match_naive_scan_after_changes(seed):
+    rng = random.Random(seed)
+    notes = make_notes(150, content_words=12, seed=seed)
+    index = SearchIndex()
+    index.rebuild(notes)
+    _check(index, notes, rng)
+    _mutate(index, notes, rng)
+    _check(index, notes, rng)
+
+
+def test_sync_catches_up_with_replaced_notes():
+    rng = random.Random(4)
+    notes = make_notes(80, content_words=10, seed=4)
+    index = SearchIndex()
+    index.rebuild(notes)
+    notes = [Note.from_dict(n.to_dict()) for n in notes[10:]] + make_notes(5, seed=9)
+    notes[0].content = "entirely different words"
+    index.sync(notes)
+    _check(index, notes, rng)
+
+
+@pytest.mark.parametrize("verify", [True, False])
+def test_restored_snapshot_matches_naive_scan(verify):
+    rng = random.Random(5)
+    notes = make_notes(120, content_words=12, seed=5)
+    index = SearchIndex()
+    index.rebuild(notes)
+    snapshot = index.snapshot()
+    if verify:  # The notes moved on since the snapshot was taken
+        notes[0].content = "rewritten after the snapshot"
+        del notes[1]
+        notes.append(Note(title="added later", content="fresh"))
+    restored = SearchIndex()
+    stale = restored.restore(snapshot, notes, verify=verify)
+    assert stale == (2 if verify else 0)
+    _check(restored, notes, rng)
+    _mutate(restored, notes, rng)  # Packed per-note terms must unpack correctly on change
+    _check(restored, notes, rng)
+
+
+def test_title_matches_rank_first():
+    notes = [Note(title="other", content="budget budget", note_id="a"),
+             Note(title="budget", content="", note_id="b")]
+    index = SearchIndex()
+    index.rebuild(notes)
+    assert index.search("budget") == ["b", "a"]
@@ -0,0 +1,62 @@
+"""Tests for StorageService: the notes.json checksum and the persisted search index."""
+
+import hashlib
+
+import pytest
+
+from models.note import Note
+from services import storage as storage_module
+from services.search_index import SearchIndex
+from services.storage import StorageService
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    return StorageService()
+
+
+def _file_checksum(storage: StorageService) -> str:
+    return hashlib.sha256(storage._get_storage_path().read_bytes()).hexdigest()
+
+
+def test_saves_do_not_hash_until_the_checksum_is_used(storage, monkeypatch):
+    notes = [Note(title="a", content="alpha"), Note(title="b", content="beta")]
+    assert storage.notes_checksum is None
+    calls = []
+    real_sha256 = hashlib.sha256
+    monkeypatch.setattr(storage_module.hashlib, "sha256", lambda data=b"": calls.append(1) or real_sha256(data))
+    for _ in range(5):
+        storage.save_notes(notes)
+    assert not calls
+    expected = real_sha256(storage._get_storage_path().read_bytes()).hexdigest()
+    assert storage.notes_checksum == expected
+    assert storage.notes_checksum == expected
+    assert len(calls) == 1  # Cached until the next save
+
+
+def test_load_takes_the_checksum_of_the_file_read(storage):
+    storage.save_notes([Note(title="a", content="alpha")])
+    fresh = StorageService()
+    fresh.load_notes()
+    assert fresh.notes_checksum == _file_checksum(storage)
+
+
+def test_search_index_round_trip(storage):
+    notes = [Note(title="Groceries", content="milk eggs bread"), Note(title="Work", content="quarterly report")]
+    index = SearchIndex()
+    index.rebuild(notes)
+    storage.save_notes(notes)
+    storage.save_search_index({"version": SearchIndex.INDEX_VERSION, "index": index.snapshot()})
+
+    data = storage.load_search_index()
+    restored = SearchIndex()
+    restored.restore(data["index"], notes, verify=True)
+    for query in ("milk", "rep", "groceries", "nothing"):
+        assert restored.search(query) == index.search(query)
+
+
+def test_search_index_from_another_python_is_ignored(storage, monkeypatch):
+    storage.save_search_index({"version": SearchIndex.INDEX_VERSION, "index": {}})
+    monkeypatch.setattr(storage_module.sys, "version_info", (2, 7, 0))
+    assert storage.load_search_index() is None
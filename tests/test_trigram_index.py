@@ -0,0 +1,136 @@
+"""Tests for TrigramIndex: substring and fuzzy results match a naive scan, including a batched build."""
+
+import random
+
+import pytest
+
+from benchmarks.corpus import make_notes
+from models.note import Note
+from models.task_item import TaskItem
+from services.trigram_index import TrigramIndex, substring_edit_distance
+from viewmodels.main_viewmodel import MainViewModel
+
+
+def _naive(notes: list[Note], query: str) -> list[str]:
+    q = query.strip().casefold()
+    return sorted(n.id for n in notes if q and q in TrigramIndex.note_text(n))
+
+
+def _naive_fuzzy(notes: list[Note], query: str, max_errors: int) -> set[str]:
+    q = query.strip().casefold()
+    return {n.id for n in notes if substring_edit_distance(q, TrigramIndex.note_text(n), max_errors) is not None}
+
+
+def _queries(notes: list[Note], rng: random.Random) -> list[str]:
+    queries = ["", "  ", "qqqzzz", "e", "ab"]
+    for note in rng.sample(notes, min(10, len(notes))):
+        text = TrigramIndex.note_text(note)
+        start = rng.randrange(max(1, len(text) - 12))
+        queries += [text[start:start + rng.randint(2, 12)], text[start:start + 6].upper()]
+    return queries
+
+
+def _check(index: TrigramIndex, notes: list[Note], rng: random.Random) -> None:
+    assert len(index) == len(notes)
+    for query in _queries(notes, rng):
+        assert index.search(query, limit=None) == _naive(notes, query), query
+
+
+def _mutate(notes: list[Note], rng: random.Random, report) -> None:
+    """Random edits, additions and removals; report(kind, note, fields) tells the index."""
+    words = " ".join(n.content for n in notes[:20]).split()
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.2 or len(notes) < 5:
+            note = Note(title=" ".join(rng.choices(words, k=2)), content=" ".join(rng.choices(words, k=8)))
+            notes.append(note)
+            report("add", note, None)
+        elif action < 0.35:
+            report("remove", notes.pop(rng.randrange(len(notes))), None)
+        else:
+            note = rng.choice(notes)
+            field = rng.choice(["title", "content", "tasks", "status"])
+            if field == "tasks":
+                note.tasks.append(TaskItem(text=f"ticket OPS-{rng.randrange(100000):05d}"))
+            elif field == "status":
+                note.status = Note.STATUS_DEFERRED
+            else:
+                setattr(note, field, " ".join(rng.choices(words, k=rng.randint(0, 6))))
+            report("update", note, frozenset({field}))
+
+
+def _report_to(index: TrigramIndex):
+    def report(kind, note, fields):
+        if kind == "remove":
+            index.remove_note(note.id)
+        elif kind == "add":
+            index.update_note(note)
+        else:
+            index.note_updated(note, fields)
+    return report
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_substring_results_match_naive_scan_after_changes(seed):
+    rng = random.Random(seed)
+    notes = make_notes(150, content_words=12, ticket_ratio=0.5, seed=seed)
+    index = TrigramIndex()
+    index.rebuild(notes)
+    _check(index, notes, rng)
+    _mutate(notes, rng, _report_to(index))
+    _check(index, notes, rng)
+    index.sync(notes[::2])
+    _check(index, notes[::2], rng)
+
+
+def test_fuzzy_results_match_naive_scan():
+    rng = random.Random(7)
+    notes = make_notes(120, content_words=10, ticket_ratio=0.5, seed=7)
+    index = TrigramIndex()
+    index.rebuild(notes)
+    _mutate(notes, rng, _report_to(index))
+    for note in rng.sample(notes, 15):
+        text = TrigramIndex.note_text(note)
+        start = rng.randrange(max(1, len(text) - 8))
+        q = list(text[start:start + 8])
+        q[rng.randrange(len(q))] = "#"  # One typo
+        query = "".join(q)
+        assert set(index.fuzzy_search(query, max_errors=1, limit=None)) == _naive_fuzzy(notes, query, 1), query
+    assert index.fuzzy_search("ab#", max_errors=1) == []  # Too short to split into exact pieces
+
+
+def test_fuzzy_ranks_exact_matches_first():
+    notes = [Note(title="", content="PROJ-40214", note_id="a"), Note(title="", content="PROJ-40213", note_id="b")]
+    index = TrigramIndex()
+    index.rebuild(notes)
+    assert index.fuzzy_search("proj-40213", max_errors=1) == ["b", "a"]
+
+
+def test_batched_build_matches_naive_scan_with_edits_between_batches(monkeypatch, tmp_path):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setattr(MainViewModel, "TRIGRAM_BATCH_SIZE", 40)
+    vm = MainViewModel()
+    vm._set_notes(make_notes(300, content_words=10, ticket_ratio=0.5, seed=11))
+    queue = []
+    done = []
+    assert vm.build_trigram_index(lambda delay, fn, *args: queue.append((fn, args)), lambda: done.append(1))
+    assert not vm.build_trigram_index(lambda *a: None)
+    rng = random.Random(11)
+    batches = 0
+    while queue:
+        fn, args = queue.pop(0)
+        fn(*args)
+        batches += 1
+        # Edits while the build is in progress go through the viewmodel's change events
+        note = rng.choice(vm.notes)
+        note.content = f"edited during build BUG-{batches:05d}"
+        vm.update_note(note, {"content"})
+        if batches % 3 == 0:
+            vm.delete_note(rng.choice(vm.notes))
+        if batches % 4 == 0:
+            vm.add_note()
+    assert batches == 8 and done == [1]
+    index = vm._trigram_index
+    notes = vm.notes
+    _check(index, notes, rng)
+    assert index.search("bug-00003", limit=None) == _naive(notes, "bug-00003")
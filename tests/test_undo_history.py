@@ -0,0 +1,135 @@
+"""Tests for UndoHistory: diffing, coalescing into word-sized steps and the byte budget."""
+
+import pytest
+
+from models.note import Note
+from viewmodels import undo_history
+from viewmodels.undo_history import FieldEdit, NoteInsert, NoteRemove, TextEdit, UndoHistory, invert
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the coalescing window."""
+    now = [1000.0]
+    monkeypatch.setattr(undo_history.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _history(note: Note, **kwargs) -> UndoHistory:
+    history = UndoHistory(**kwargs)
+    history.reset([note])
+    return history
+
+
+def _type(history: UndoHistory, note: Note, text: str, field: str = "content") -> None:
+    """Append text one character at a time, recording each keystroke."""
+    for ch in text:
+        setattr(note, field, getattr(note, field) + ch)
+        history.record_update(note, frozenset({field}))
+
+
+def test_text_change_is_recorded_as_splice(clock):
+    note = Note(content="hello world")
+    history = _history(note)
+    note.content = "hello there world"
+    history.record_update(note, frozenset({"content"}))
+    assert history.pop_undo() == [TextEdit(note.id, "content", 6, "there ", "")]
+
+
+def test_unchanged_and_untracked_fields_record_nothing(clock):
+    note = Note()
+    history = _history(note)
+    history.record_update(note, frozenset({"content"}))
+    history.record_update(note, frozenset({"tasks"}))
+    assert not history.can_undo
+
+
+def test_typing_coalesces_until_word_ends(clock):
+    note = Note(content="")
+    history = _history(note)
+    _type(history, note, "one two")
+    assert history.pop_undo() == [TextEdit(note.id, "content", 4, "two", "")]
+    assert history.pop_undo() == [TextEdit(note.id, "content", 0, "one ", "")]
+    assert not history.can_undo
+
+
+def test_pause_starts_new_step(clock):
+    note = Note(content="")
+    history = _history(note)
+    _type(history, note, "ab")
+    clock[0] += UndoHistory.COALESCE_SECONDS + 1
+    _type(history, note, "cd")
+    assert history.pop_undo() == [TextEdit(note.id, "content", 2, "cd", "")]
+    assert history.pop_undo() == [TextEdit(note.id, "content", 0, "ab", "")]
+
+
+def test_backspace_and_delete_coalesce(clock):
+    note = Note(content="abcdef")
+    history = _history(note)
+    for _ in range(3):  # Backspace from the end
+        note.content = note.content[:-1]
+        history.record_update(note, frozenset({"content"}))
+    assert history.pop_undo() == [TextEdit(note.id, "content", 3, "", "def")]
+
+    note = Note(content="abcdef")
+    history = _history(note)
+    for _ in range(2):  # Delete key at position 1
+        note.content = note.content[:1] + note.content[2:]
+        history.record_update(note, frozenset({"content"}))
+    assert history.pop_undo() == [TextEdit(note.id, "content", 1, "", "bc")]
+
+
+def test_paste_is_its_own_step(clock):
+    note = Note(content="")
+    history = _history(note)
+    _type(history, note, "ab")
+    note.content += "x" * (UndoHistory.WORD_MAX + 1)
+    history.record_update(note, frozenset({"content"}))
+    _type(history, note, "c")
+    assert len(history.pop_undo()[0].removed) == 1
+    assert len(history.pop_undo()[0].removed) == UndoHistory.WORD_MAX + 1
+    assert history.pop_undo()[0].removed == "ab"
+
+
+def test_field_edits_coalesce_and_fields_do_not_mix(clock):
+    note = Note()
+    history = _history(note)
+    for width in (300, 320, 340):
+        note.width = width
+        history.record_update(note, frozenset({"width"}))
+    _type(history, note, "x", field="title")
+    assert history.pop_undo() == [TextEdit(note.id, "title", len(note.title) - 1, "x", "")]
+    assert history.pop_undo() == [FieldEdit(note.id, "width", 340, Note.DEFAULT_WIDTH)]
+
+
+def test_undo_then_redo_round_trip_and_new_edit_clears_redo(clock):
+    note = Note(content="")
+    history = _history(note)
+    _type(history, note, "word ")
+    undo = history.pop_undo()
+    assert history.can_redo
+    assert history.pop_redo() == [invert(c) for c in undo]
+    history.pop_undo()
+    _type(history, note, "z")
+    assert not history.can_redo
+
+
+def test_invert_structural_changes():
+    assert invert(NoteInsert(2, {"id": "a"})) == NoteRemove(2, {"id": "a"})
+    assert invert(NoteRemove(2, {"id": "a"})) == NoteInsert(2, {"id": "a"})
+
+
+def test_budget_drops_oldest_steps_but_keeps_newest(clock):
+    note = Note(content="")
+    history = _history(note, budget_bytes=2000)
+    for i in range(50):
+        history.record(NoteInsert(i, {"id": str(i), "content": "x" * 100}))
+    assert history.size <= 2000
+    kept = 0
+    while history.pop_undo() is not None:
+        kept += 1
+    assert 0 < kept < 50
+
+    history = _history(note, budget_bytes=10)
+    history.record(NoteInsert(0, {"content": "x" * 1000}))
+    assert history.can_undo  # A single step over budget is still kept
@@ -0,0 +1,126 @@
+"""Tests for VersionStore: keyframe/delta round trips, reloading, compaction and damaged files."""
+
+import struct
+
+from models.note import Note
+from services.version_store import VersionStore, _DAY, _HEADER
+
+NOW = 1_700_000_000.0
+
+
+def _edit(store: VersionStore, note: Note, content: str, now: float) -> None:
+    note.content = content
+    store.mark(note)
+    store.flush([note], now=now)
+
+
+def _contents(store: VersionStore, note_id: str) -> list[str]:
+    return [store.get(note_id, seq)["content"] for seq, _ in store.versions(note_id)]
+
+
+def test_round_trip_across_keyframes_and_reload(tmp_path):
+    path = tmp_path / "notes.history"
+    store = VersionStore(path)
+    note = Note(title="Log", content="")
+    body = "line of text that stays the same\n" * 40
+    expected = []
+    for i in range(VersionStore.KEYFRAME_EVERY * 2 + 5):
+        content = body + f"entry {i}\n"
+        _edit(store, note, content, NOW + i)
+        expected.append(content)
+    history = store._histories[note.id]
+    assert len(history.keyframes) >= 3  # Deltas were used, with a keyframe every KEYFRAME_EVERY
+    assert len(history.keyframes) < len(history.seqs)
+    assert _contents(store, note.id) == expected
+
+    fresh = VersionStore(path)
+    assert [seq for seq, _ in fresh.versions(note.id)] == list(range(len(expected)))
+    assert _contents(fresh, note.id) == expected
+    _edit(fresh, note, "appended after reload", NOW + 100)  # Deltas against a version read back from disk
+    assert _contents(VersionStore(path), note.id) == expected + ["appended after reload"]
+
+
+def test_unchanged_note_writes_no_version(tmp_path):
+    store = VersionStore(tmp_path / "notes.history")
+    note = Note(content="same")
+    _edit(store, note, "same", NOW)
+    _edit(store, note, "same", NOW + 1)
+    assert len(store.versions(note.id)) == 1
+
+
+def test_baseline_is_written_before_first_change(tmp_path):
+    store = VersionStore(tmp_path / "notes.history")
+    note = Note(content="before")
+    baseline = note.to_dict()
+    note.content = "after"
+    store.mark(note, baseline)
+    assert store.pending(note.id)
+    store.flush(now=NOW)
+    assert _contents(store, note.id) == ["before", "after"]
+
+
+def test_compact_applies_retention_policy(tmp_path):
+    path = tmp_path / "notes.history"
+    store = VersionStore(path)
+    now = NOW
+    live, deleted, kept_deleted = Note(content=""), Note(content=""), Note(content="")
+    times = [now - 40 * _DAY,  # Older than KEEP_DAYS: dropped
+             now - 5 * _DAY + 10, now - 5 * _DAY + 20,  # Same day: only the later one kept
+             now - 3 * _DAY,
+             now - 3600, now - 60]  # Within KEEP_ALL_SECONDS: all kept
+    for i, ts in enumerate(times):
+        _edit(store, live, f"live {i}", ts)
+    _edit(store, deleted, "gone", now - 31 * _DAY)
+    _edit(store, kept_deleted, "recently deleted", now - 2 * _DAY)
+
+    store.compact({live.id}, now=now)
+    for reader in (store, VersionStore(path)):
+        assert [ts for _, ts in reader.versions(live.id)] == [times[2], times[3], times[4], times[5]]
+        assert _contents(reader, live.id) == ["live 2", "live 3", "live 4", "live 5"]
+        assert reader.versions(deleted.id) == []
+        assert _contents(reader, kept_deleted.id) == ["recently deleted"]
+        assert reader.compacted_at == now
+
+
+def test_compact_caps_versions_per_note(tmp_path):
+    store = VersionStore(tmp_path / "notes.history")
+    store.MAX_VERSIONS = 5
+    note = Note(content="")
+    for i in range(12):
+        _edit(store, note, f"text {i}", NOW + i)
+    store.compact({note.id}, now=NOW + 20)
+    assert _contents(store, note.id) == [f"text {i}" for i in range(7, 12)]
+
+
+def test_torn_or_corrupt_tail_record_is_cut_off(tmp_path):
+    path = tmp_path / "notes.history"
+    store = VersionStore(path)
+    note = Note(content="")
+    for i in range(3):
+        _edit(store, note, f"version {i}", NOW + i)
+    intact = path.stat().st_size
+
+    with open(path, "r+b") as f:  # Torn write: the last record lost its final bytes
+        f.truncate(intact - 3)
+    fresh = VersionStore(path)
+    assert _contents(fresh, note.id) == ["version 0", "version 1"]
+    assert path.stat().st_size < intact
+    _edit(fresh, note, "version 3", NOW + 10)
+    assert _contents(VersionStore(path), note.id) == ["version 0", "version 1", "version 3"]
+
+    grown = path.stat().st_size
+    with open(path, "ab") as f:  # Garbage header claiming a payload past the end of the file
+        f.write(struct.pack("<BBIdI", 12, 0, 9, NOW, 1 << 20) + b"x" * 20)
+    assert _contents(VersionStore(path), note.id) == ["version 0", "version 1", "version 3"]
+    assert path.stat().st_size == grown
+
+
+def test_unreadable_file_is_set_aside(tmp_path):
+    path = tmp_path / "notes.history"
+    path.write_bytes(b"not a history file" + b"\0" * _HEADER.size)
+    store = VersionStore(path)
+    note = Note(content="fresh")
+    assert store.versions(note.id) == []
+    assert path.with_suffix(".bad").exists()
+    _edit(store, note, "fresh", NOW)
+    assert _contents(VersionStore(path), note.id) == ["fresh"]
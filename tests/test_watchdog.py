@@ -0,0 +1,20 @@
+"""Tests for LagWatchdog: attributing a sampled stack to the dispatched callback."""
+
+from services.watchdog import LagWatchdog
+
+
+def test_handler_is_first_app_frame_after_dispatch():
+    stack = ("main.main:10", "tkinter", "tkinter", "main_window._on_add_note:300", "note_card.__init__:40")
+    assert LagWatchdog.handler(stack) == "main_window._on_add_note:300"
+
+
+def test_nested_tkinter_calls_do_not_take_the_blame():
+    stack = ("main.main:10", "tkinter", "tkinter", "main_window._on_notes_changed:400",
+             "main_window._clear_cards:320", "note_card.destroy:350", "tkinter", "tkinter")
+    assert LagWatchdog.handler(stack) == "main_window._on_notes_changed:400"
+
+
+def test_stacks_without_a_dispatch():
+    assert LagWatchdog.handler(()) is None
+    assert LagWatchdog.handler(("main.main:10", "storage.load_notes:90")) == "main.main:10"
+    assert LagWatchdog.handler(("main.main:10", "tkinter")) == "tkinter"
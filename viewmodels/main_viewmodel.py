@@ -1,27 +1,78 @@
 """
-MainViewModel - Handles logic for notes: add, delete, save, load.
+MainViewModel - Handles logic for notes: add, delete, undo/redo, save, load.
 Implements observable pattern via callbacks (no external GUI framework).
 """
 
+import time
+import zlib
+
+from models.ids import new_id
 from models.note import Note
 from models.task_item import TaskItem
+from services.backup_store import BackupStore
+from services.note_store import NoteStore
+from services.metrics import timed
+from services.profiling import profiled
+from services.search_index import SearchIndex
 from services.storage import StorageService
+from services.trigram_index import TrigramIndex
+from services.version_store import VersionStore
+from viewmodels.undo_history import (
+    FieldEdit, NoteInsert, NoteRemove, NoteTrash, NoteUntrash, TaskInsert, TaskRemove, TextEdit, UndoHistory,
+)
 
 
 class MainViewModel:
     """ViewModel for the main window. Manages notes collection and persistence."""
 
+    # Note fields that affect the calendar (due-date highlights)
+    CALENDAR_FIELDS = frozenset({"due_date", "status"})
+    TRASH_KEEP_SECONDS = 30 * 86400  # Deleted notes are purged from the trash after this
+    TRIGRAM_BATCH_SIZE = 500  # Notes indexed per event-loop turn by build_trigram_index
+
     def __init__(self):
         self._notes: list[Note] = []
+        self._notes_by_id: dict[str, Note] = {}
+        self._trash: dict[str, Note] = {}  # Tombstones (deleted_at set) by id, oldest deletion first
+        self._search_index: SearchIndex | None = None  # Built on first search
+        self._trigram_index: TrigramIndex | None = None  # Built on first substring search
+        self._trigram_build: TrigramIndex | None = None  # Being built by build_trigram_index
+        self._note_store: NoteStore | None = None  # Built on first bulk query
+        self._versions: VersionStore | None = None  # Opened on first change or history view
+        self._backups: BackupStore | None = None  # Opened on first backup
+        self._backup_changed: set[str] = set()  # Ids of notes changed since the last backup
+        self._backup_source: str | None = None  # Checksum of the notes file the notes were loaded from
+        self._backup_seeded = False  # Whether the backup store knows the digests of the current notes
         self._storage = StorageService()
+        self._history = UndoHistory()
         self._on_notes_changed_callbacks: list[callable] = []
+        self._on_note_updated_callbacks: list[callable] = []
+        self._on_note_added_callbacks: list[callable] = []
+        self._on_note_removed_callbacks: list[callable] = []
         self._on_calendar_refresh_callbacks: list[callable] = []
+        self.on_note_updated(lambda note, fields: self._backup_changed.add(note.id))
+        self.on_note_added(lambda note, index: self._backup_changed.add(note.id))
+        self.on_note_removed(lambda note, index: self._backup_changed.add(note.id))
         self.load_notes()  # Load from local directory (exe dir when frozen) on start
 
     def on_notes_changed(self, callback: callable) -> None:
-        """Register a callback to run when notes change."""
+        """Register a callback to run when the notes list is replaced (load)."""
         self._on_notes_changed_callbacks.append(callback)
 
+    def on_note_added(self, callback: callable) -> None:
+        """Register a callback(note, index) to run when a single note is inserted into notes."""
+        self._on_note_added_callbacks.append(callback)
+
+    def on_note_removed(self, callback: callable) -> None:
+        """Register a callback(note, index) to run when a single note is removed (index it had)."""
+        self._on_note_removed_callbacks.append(callback)
+
+    def on_note_updated(self, callback: callable) -> None:
+        """Register a callback(note, fields) to run when fields of a single note change.
+        fields is a frozenset of attribute names, or None if unknown (treat as all fields).
+        """
+        self._on_note_updated_callbacks.append(callback)
+
     def on_calendar_refresh(self, callback: callable) -> None:
         """Register a callback to refresh the calendar (e.g. when due dates change)."""
         self._on_calendar_refresh_callbacks.append(callback)
@@ -32,67 +83,574 @@ class MainViewModel:
 
     @property
     def notes(self) -> list[Note]:
-        """Get list of notes."""
+        """Get list of notes (deleted notes are in trash instead)."""
         return self._notes
 
+    @property
+    def trash(self) -> list[Note]:
+        """Deleted notes that can still be restored, most recently deleted first."""
+        return list(reversed(self._trash.values()))
+
+    def _stored_notes(self) -> list[Note]:
+        """The notes followed by the tombstones: everything notes.json holds."""
+        return self._notes + list(self._trash.values()) if self._trash else self._notes
+
+    def get_note(self, note_id: str) -> Note | None:
+        """Look up a note by id."""
+        return self._notes_by_id.get(note_id)
+
+    def _set_notes(self, notes: list[Note], keep_trash: bool = False) -> None:
+        """Replace all notes (as stored: tombstones go to the trash). With keep_trash, notes
+        in the current trash that the new notes don't contain stay in the trash.
+        """
+        if self._versions is not None:
+            self._versions.flush()  # Pending versions belong to the notes being replaced
+        deleted = [n for n in notes if n.deleted_at is not None]
+        if deleted:
+            notes = [n for n in notes if n.deleted_at is None]
+        if keep_trash and self._trash:
+            ids = {n.id for n in notes}
+            ids.update(n.id for n in deleted)
+            deleted.extend(n for n in self._trash.values() if n.id not in ids)
+        if deleted:
+            deleted.sort(key=lambda n: n.deleted_at)
+        self._trash = {n.id: n for n in deleted}
+        self._notes = notes
+        self._notes_by_id = {n.id: n for n in notes}
+        self._history.reset(notes)
+        self._backup_changed = set()
+        self._backup_source = None  # Set by the load paths when the notes match the saved file
+        self._backup_seeded = False
+
+    @profiled("viewmodel.search")
+    def search(self, query: str, limit: int | None = 50) -> list[Note]:
+        """Search title, content and task text. Whole-word/prefix matches rank first, then
+        substring matches (e.g. part of a ticket number); if nothing matches, notes within
+        one typo of the query. While build_trigram_index is running, only word matches.
+        """
+        ids = self._ensure_search_index().search(query, limit)
+        if (len(query.strip()) >= TrigramIndex.MIN_QUERY_LENGTH and (limit is None or len(ids) < limit)
+                and self._trigram_build is None):
+            trigram_index = self._ensure_trigram_index()
+            found = set(ids)
+            more = trigram_index.search(query, None if limit is None else limit + len(ids))
+            ids.extend(note_id for note_id in more if note_id not in found)
+            if limit is not None:
+                del ids[limit:]
+            if not ids:
+                ids = trigram_index.fuzzy_search(query, max_errors=1, limit=limit)
+        return [self._notes_by_id[note_id] for note_id in ids]
+
+    def _ensure_search_index(self) -> SearchIndex:
+        """Load (or build) the word index on first use."""
+        if self._search_index is None:
+            index = self._load_persisted_search_index()
+            if index is None:
+                index = SearchIndex()
+                index.rebuild(self._notes)
+            self._search_index = self._attach_index(index, build=False)
+        return self._search_index
+
+    def _load_persisted_search_index(self) -> SearchIndex | None:
+        """Restore the index saved next to notes.json, catching up on notes changed since.
+        If it was written for the notes.json we loaded, entries are trusted as-is;
+        otherwise each note's fingerprint is checked and stale notes are re-tokenized.
+        """
+        data = self._storage.load_search_index()
+        if not data or data.get("version") != SearchIndex.INDEX_VERSION:
+            return None
+        checksum = self._storage.notes_checksum
+        trusted = checksum is not None and data.get("source_checksum") == checksum
+        index = SearchIndex()
+        index.restore(data.get("index", {}), self._notes, verify=not trusted)
+        return index
+
+    def _save_search_index(self) -> None:
+        """Persist the search index (if built) against the notes.json just written."""
+        if self._search_index is None or self._storage.notes_checksum is None:
+            return
+        try:
+            self._storage.save_search_index({
+                "version": SearchIndex.INDEX_VERSION,
+                "source_checksum": self._storage.notes_checksum,
+                "index": self._search_index.snapshot(),
+            })
+        except (IOError, OSError):
+            pass  # Index is a cache; it is rebuilt on the next search
+
+    def _ensure_trigram_index(self) -> TrigramIndex:
+        """Build the trigram index on first use."""
+        if self._trigram_index is None:
+            self._trigram_index = self._attach_index(TrigramIndex())
+        return self._trigram_index
+
+    def build_trigram_index(self, schedule, on_done=None) -> bool:
+        """Build the trigram index TRIGRAM_BATCH_SIZE notes at a time, one batch per
+        schedule(0, callback, *args) call (e.g. Tk's after), so a UI is not blocked for
+        the whole build. on_done() runs once it is ready. Returns False if the index is
+        already built or being built.
+        """
+        if self._trigram_index is not None or self._trigram_build is not None:
+            return False
+        # Attached first, so notes changed during the build are indexed by the change events
+        index = self._trigram_build = self._attach_index(TrigramIndex(), build=False)
+        pending = list(self._notes)
+
+        def step(start: int) -> None:
+            for note in pending[start:start + self.TRIGRAM_BATCH_SIZE]:
+                if self._notes_by_id.get(note.id) is note:  # Else removed (or replaced) meanwhile
+                    index.update_note(note)
+            start += self.TRIGRAM_BATCH_SIZE
+            if start < len(pending):
+                schedule(0, step, start)
+                return
+            self._trigram_index = index
+            self._trigram_build = None
+            if on_done is not None:
+                on_done()
+
+        schedule(0, step, 0)
+        return True
+
+    @property
+    def note_store(self) -> NoteStore:
+        """Columnar copy of note metadata for counts, histograms and filters (built on first use)."""
+        if self._note_store is None:
+            self._note_store = self._attach_index(NoteStore())
+        return self._note_store
+
+    def due_days(self, year: int, month: int) -> set[int]:
+        """Days of the month on which at least one note is due."""
+        return self.note_store.due_days(year, month)
+
+    @property
+    def versions(self) -> VersionStore:
+        """Per-note version history stored next to notes.json (opened on first use)."""
+        if self._versions is None:
+            self._versions = VersionStore(self._storage.get_history_path())
+        return self._versions
+
+    def _mark_version(self, note: Note) -> None:
+        """Queue the note's new state for its version history (written later by
+        flush_due_versions or on save, not on the edit). Call before the undo history
+        records the change: a note without history first gets its previous state stored.
+        """
+        versions = self.versions
+        baseline = None
+        if not versions.pending(note.id):
+            previous = self._history.previous_values(note.id)
+            if previous is not None:
+                baseline = {**note.to_dict(), **previous}
+        versions.mark(note, baseline)
+
+    def flush_due_versions(self) -> None:
+        """Write versions of notes that have been changing for the version interval.
+        Meant for a timer; edits only queue versions.
+        """
+        if self._versions is not None:
+            try:
+                self._versions.flush_due()
+            except (IOError, OSError):
+                pass  # Retried by the next call or on save
+
+    def note_versions(self, note: Note) -> list[tuple[int, float]]:
+        """(version number, timestamp) of each stored version of a note, oldest first.
+        Pending edits are written first, so the newest version is the current state.
+        """
+        self.versions.flush([note])
+        return self.versions.versions(note.id)
+
+    def note_version(self, note: Note, seq: int) -> Note | None:
+        """A stored version of a note, decoded (not attached to the notes list)."""
+        data = self.versions.get(note.id, seq)
+        return Note.from_dict(data) if data is not None else None
+
+    def restore_note_version(self, note: Note, seq: int) -> bool:
+        """Roll a note back to a stored version, as one undoable step (fields and tasks).
+        Returns True if anything changed.
+        """
+        old = self.note_version(note, seq)
+        if old is None:
+            return False
+        self._mark_version(note)
+        changed = set()
+        for field in UndoHistory.TRACKED_FIELDS:
+            if getattr(note, field) != getattr(old, field):
+                setattr(note, field, getattr(old, field))
+                changed.add(field)
+        changes = self._history.diff(note, frozenset(changed))
+        if [t.to_dict() for t in note.tasks] != [t.to_dict() for t in old.tasks]:
+            # Replace the whole list: remove current tasks from the end, insert the old ones
+            changes += [TaskRemove(note.id, i, note.tasks[i].to_dict()) for i in range(len(note.tasks) - 1, -1, -1)]
+            changes += [TaskInsert(note.id, i, task.to_dict()) for i, task in enumerate(old.tasks)]
+            note.tasks = old.tasks
+            changed.add("tasks")
+        if not changed:
+            return False
+        if changes:
+            self._history.record(*changes)
+        self._save_only()
+        self._notify_note_updated(note, frozenset(changed))
+        return True
+
+    @property
+    def backups(self) -> BackupStore:
+        """Rolling backup generations stored next to notes.json (opened on first use)."""
+        if self._backups is None:
+            self._backups = BackupStore(self._storage.get_backup_dir())
+        return self._backups
+
+    @timed("viewmodel.backup")
+    def backup(self) -> str:
+        """Save, then take a backup generation (only notes changed since the last one are
+        written) and apply the retention policy. Returns the generation id.
+        """
+        store = self.backups
+        stored = self._stored_notes()
+        changed = self._backup_changed
+        if not self._backup_seeded:
+            # First backup of these notes: reuse digests if the newest generation is of the loaded file
+            if self._backup_source is None or not store.seed(stored, self._backup_source):
+                changed = None
+            self._backup_seeded = True
+        self._storage.save_notes(stored)
+        generation_id = store.take(stored, changed, source=self._storage.notes_checksum)
+        self._backup_changed = set()
+        store.prune()
+        return generation_id
+
+    def backup_if_due(self) -> bool:
+        """Take a backup if the newest one is older than the backup interval."""
+        try:
+            if not self.backups.due():
+                return False
+            self.backup()
+            return True
+        except (IOError, OSError):
+            return False
+
+    def backup_generations(self) -> list[dict]:
+        """Backup generations ({"id", "created", "count"}), newest first."""
+        return [{"id": g["id"], "created": g["created"], "count": g["count"]} for g in self.backups.generations()]
+
+    def restore_backup(self, generation_id: str) -> bool:
+        """Replace the notes with a backup generation (after backing up the current notes).
+        Notes in the trash that the backup doesn't contain stay in the trash.
+        """
+        try:
+            notes = self.backups.load(generation_id)
+            self.backup()
+        except (IOError, OSError, ValueError, KeyError, zlib.error):
+            return False
+        self._set_notes(notes, keep_trash=True)
+        self._save_and_notify()
+        return True
+
+    def _attach_index(self, index, build: bool = True):
+        """Index the current notes and keep the index updated from change events."""
+        if build:
+            index.rebuild(self._notes)
+        self.on_notes_changed(lambda: index.sync(self._notes))
+        self.on_note_updated(index.note_updated)
+        self.on_note_added(lambda note, i: index.update_note(note))
+        self.on_note_removed(lambda note, i: index.remove_note(note.id))
+        return index
+
+    @timed("viewmodel.add_note")
+    @profiled("viewmodel.add_note")
     def add_note(self) -> Note:
         """Create and add a new note, save, and notify UI."""
-        note = Note()
-        self._notes.append(note)
-        self._save_and_notify()
+        note = Note(note_id=new_id(taken=self._notes_by_id))
+        index = len(self._notes)
+        self._insert_note(note, index)
+        self._history.record(NoteInsert(index, note.to_dict()))
+        self.versions.mark(note)
+        self._save_only()
+        self._notify_note_added(note, index)
         return note
 
+    @timed("viewmodel.delete_note")
+    @profiled("viewmodel.delete_note")
     def delete_note(self, note: Note) -> None:
-        """Remove a note, save, and notify UI."""
-        if note in self._notes:
-            self._notes.remove(note)
-            self._save_and_notify()
+        """Move a note to the trash (it stays stored as a tombstone until purged), save, and notify UI."""
+        if self._notes_by_id.get(note.id) is note:
+            index = self._notes.index(note)
+            if self._versions is not None:
+                self._versions.flush([note])  # Keep the last edits in its history
+            self._trash_note(index)
+            self._history.record(NoteTrash(note.id, index))
+            self._save_only()
+            self._notify_note_removed(note, index)
+
+    @timed("viewmodel.restore_note")
+    def restore_note(self, note: Note) -> bool:
+        """Move a note from the trash back to the end of the notes."""
+        return self.restore_notes([note]) == 1
+
+    @timed("viewmodel.restore_notes")
+    def restore_notes(self, notes: list[Note]) -> int:
+        """Move notes from the trash back to the end of the notes as one undoable step,
+        saving once. Returns the number restored.
+        """
+        changes = []
+        for note in notes:
+            if self._trash.get(note.id) is note:
+                index = len(self._notes)
+                self._untrash_note(note.id, index)
+                changes.append(NoteUntrash(note.id, index))
+        if not changes:
+            return 0
+        self._history.record(*changes)
+        self._save_only()
+        for change in changes:
+            self._notify_note_added(self._notes_by_id[change.note_id], change.index)
+        return len(changes)
+
+    def purge_notes(self, notes: list[Note] | None = None) -> int:
+        """Permanently delete notes from the trash (all of it if None), saving once.
+        Returns the number purged.
+        """
+        ids = list(self._trash) if notes is None else [n.id for n in notes if n.id in self._trash]
+        for note_id in ids:
+            del self._trash[note_id]
+        if ids:
+            self._save_only()
+        return len(ids)
 
+    def purge_expired(self, now: float | None = None) -> int:
+        """Purge tombstones older than TRASH_KEEP_SECONDS in one save. Cheap when there
+        are none: the trash is ordered by deletion, so only the oldest entry is checked.
+        """
+        cutoff = (time.time() if now is None else now) - self.TRASH_KEEP_SECONDS
+        expired = []
+        for note in self._trash.values():
+            if note.deleted_at > cutoff:
+                break
+            expired.append(note)
+        return self.purge_notes(expired) if expired else 0
+
+    def _insert_note(self, note: Note, index: int) -> None:
+        self._notes.insert(index, note)
+        self._notes_by_id[note.id] = note
+        self._history.track(note)
+
+    def _remove_note(self, index: int) -> Note:
+        note = self._notes.pop(index)
+        self._notes_by_id.pop(note.id, None)
+        self._history.forget(note.id)
+        return note
+
+    def _trash_note(self, index: int) -> Note:
+        note = self._remove_note(index)
+        note.deleted_at = time.time()
+        self._trash[note.id] = note
+        return note
+
+    def _untrash_note(self, note_id: str, index: int) -> Note:
+        note = self._trash.pop(note_id)
+        note.deleted_at = None
+        self._insert_note(note, index)
+        return note
+
+    def _notify_note_added(self, note: Note, index: int) -> None:
+        for cb in self._on_note_added_callbacks:
+            cb(note, index)
+        if note.due_date:
+            self._notify_calendar_refresh()
+
+    def _notify_note_removed(self, note: Note, index: int) -> None:
+        for cb in self._on_note_removed_callbacks:
+            cb(note, index)
+        if note.due_date:
+            self._notify_calendar_refresh()
+
+    @timed("viewmodel.add_task_to_note")
+    @profiled("viewmodel.add_task_to_note")
     def add_task_to_note(self, note: Note, text: str = "") -> TaskItem:
         """Add a checklist item to a note."""
-        task = TaskItem(text=text)
+        task = TaskItem(text=text, task_id=new_id(taken={t.id for t in note.tasks}))
+        self._mark_version(note)
         note.tasks.append(task)
+        self._history.record(TaskInsert(note.id, len(note.tasks) - 1, task.to_dict()))
         self._save_only()
+        self._notify_note_updated(note, frozenset({"tasks"}))
         return task
 
+    @timed("viewmodel.remove_task_from_note")
+    @profiled("viewmodel.remove_task_from_note")
     def remove_task_from_note(self, note: Note, task: TaskItem) -> None:
         """Remove a checklist item from a note."""
         if task in note.tasks:
-            note.tasks.remove(task)
+            index = note.tasks.index(task)
+            self._mark_version(note)
+            del note.tasks[index]
+            self._history.record(TaskRemove(note.id, index, task.to_dict()))
             self._save_only()
+            self._notify_note_updated(note, frozenset({"tasks"}))
 
     def _notify_calendar_refresh(self) -> None:
         for cb in self._on_calendar_refresh_callbacks:
             cb()
 
-    def update_note(self, note: Note) -> None:
-        """Mark note as updated and save (title, content, task checkboxes, due date, completed)."""
+    def _notify_note_updated(self, note: Note, fields: frozenset[str] | None) -> None:
+        for cb in self._on_note_updated_callbacks:
+            cb(note, fields)
+        if fields is None or fields & self.CALENDAR_FIELDS:
+            self._notify_calendar_refresh()
+
+    @timed("viewmodel.update_note")
+    @profiled("viewmodel.update_note")
+    def update_note(self, note: Note, fields: set[str] | frozenset[str] | None = None) -> None:
+        """Mark note as updated and save (title, content, task checkboxes, due date, completed).
+        fields names the attributes that changed; the calendar is only refreshed when
+        due_date or status is among them (or when fields is None). The change is recorded
+        for undo (typing in one field coalesces into word-sized steps).
+        """
+        fields = frozenset(fields) if fields is not None else None
+        self._mark_version(note)
+        self._history.record_update(note, fields)
         self._save_only()
-        self._notify_calendar_refresh()
+        self._notify_note_updated(note, fields)
 
+    @timed("viewmodel.cycle_note_color")
+    @profiled("viewmodel.cycle_note_color")
     def cycle_note_color(self, note: Note) -> str:
         """Cycle note color and save."""
         color = note.cycle_color()
+        self._mark_version(note)
+        self._history.record_update(note, frozenset({"color"}))
         self._save_only()
+        self._notify_note_updated(note, frozenset({"color"}))
         return color
 
+    @property
+    def can_undo(self) -> bool:
+        return self._history.can_undo
+
+    @property
+    def can_redo(self) -> bool:
+        return self._history.can_redo
+
+    @timed("viewmodel.undo")
+    def undo(self) -> list[Note]:
+        """Revert the last recorded step. Returns the notes whose fields changed (for views
+        to redisplay); added/removed notes are reported through the usual change events.
+        """
+        changes = self._history.pop_undo()
+        return self._apply_changes(changes) if changes else []
+
+    @timed("viewmodel.redo")
+    def redo(self) -> list[Note]:
+        """Re-apply the last undone step. Returns the notes whose fields changed."""
+        changes = self._history.pop_redo()
+        return self._apply_changes(changes) if changes else []
+
+    def _apply_changes(self, changes: list) -> list[Note]:
+        """Apply undo/redo changes through the incremental change events, then save once."""
+        updated: dict[str, set[str]] = {}
+        stale = False
+        for change in changes:
+            kind = type(change)
+            if kind is NoteInsert:
+                note = Note.from_dict(change.data)
+                if note.id in self._notes_by_id:
+                    stale = True
+                    continue
+                index = min(change.index, len(self._notes))
+                self._insert_note(note, index)
+                self._notify_note_added(note, index)
+                continue
+            if kind is NoteRemove:
+                note = self._notes_by_id.get(change.data["id"])
+                if note is None:
+                    stale = True
+                    continue
+                index = self._notes.index(note)
+                self._remove_note(index)
+                updated.pop(note.id, None)
+                self._notify_note_removed(note, index)
+                continue
+            if kind is NoteTrash:
+                note = self._notes_by_id.get(change.note_id)
+                if note is None:
+                    stale = True
+                    continue
+                index = self._notes.index(note)
+                self._trash_note(index)
+                updated.pop(note.id, None)
+                self._notify_note_removed(note, index)
+                continue
+            if kind is NoteUntrash:
+                if change.note_id not in self._trash:
+                    stale = True  # Purged since
+                    continue
+                index = min(change.index, len(self._notes))
+                note = self._untrash_note(change.note_id, index)
+                self._notify_note_added(note, index)
+                continue
+            note = self._notes_by_id.get(change.note_id)
+            if note is None:
+                stale = True
+                continue
+            if kind is TextEdit:
+                value = getattr(note, change.field)
+                if value[change.pos:change.pos + len(change.removed)] != change.removed:
+                    stale = True  # Edited outside the history; the splice no longer fits
+                    continue
+                setattr(note, change.field, value[:change.pos] + change.inserted
+                        + value[change.pos + len(change.removed):])
+                updated.setdefault(note.id, set()).add(change.field)
+            elif kind is FieldEdit:
+                setattr(note, change.field, change.new)
+                updated.setdefault(note.id, set()).add(change.field)
+            elif kind is TaskInsert:
+                note.tasks.insert(min(change.index, len(note.tasks)), TaskItem.from_dict(change.data))
+                updated.setdefault(note.id, set()).add("tasks")
+            elif kind is TaskRemove:
+                task_id = change.data["id"]
+                note.tasks[:] = [t for t in note.tasks if t.id != task_id]
+                updated.setdefault(note.id, set()).add("tasks")
+        if stale:
+            self._history.clear()
+        self._save_only()
+        notes = [self._notes_by_id[note_id] for note_id in updated]
+        for note in notes:
+            self._mark_version(note)
+            self._history.track(note)
+            self._notify_note_updated(note, frozenset(updated[note.id]))
+        return notes
+
+    @timed("viewmodel.load_notes")
+    @profiled("viewmodel.load_notes")
     def load_notes(self) -> None:
         """Load notes from storage."""
-        self._notes = self._storage.load_notes()
+        self._set_notes(self._storage.load_notes())
+        self._backup_source = self._storage.notes_checksum
         if not self._notes:
-            self._notes.append(Note(title="Welcome!", content="Add more notes with the + button."))
+            self._set_notes([Note(title="Welcome!", content="Add more notes with the + button.")])
             self._save_and_notify()
         else:
             self._notify_notes_changed()
 
     def _save_only(self) -> None:
         """Save to storage without notifying (avoids repopulating UI on each keystroke)."""
-        self._storage.save_notes(self._notes)
+        self._storage.save_notes(self._stored_notes())
 
+    @timed("viewmodel.save_all")
+    @profiled("viewmodel.save_all")
     def save_all(self) -> None:
-        """Force save all notes to default storage."""
-        self._storage.save_notes(self._notes)
+        """Force save all notes (and the search index, if built) to default storage.
+        Pending note versions are written too, and the version history compacted when due.
+        A backup generation is taken if one is due (that saves the notes as well).
+        """
+        if not self.backup_if_due():
+            self._storage.save_notes(self._stored_notes())
+        self._save_search_index()
+        if self._versions is not None:
+            self._versions.flush()
+            self._versions.maybe_compact(self._notes_by_id.keys() | self._trash.keys())
 
+    @profiled("viewmodel.export_to_file")
     def export_to_file(self, path: str) -> bool:
         """Export notes to a file. Returns True on success."""
         try:
@@ -101,13 +659,17 @@ class MainViewModel:
         except (IOError, OSError):
             return False
 
+    @profiled("viewmodel.load_from_file")
     def load_from_file(self, path: str) -> bool:
-        """Load notes from a file, replacing current notes. Saves to default location."""
+        """Load notes from a file, replacing current notes (the trash is kept). Saves to
+        default location.
+        """
         try:
-            notes = self._storage.load_notes_from_path(path)
+            notes = self._storage.load_notes_from_path(path, validate=True)
             if notes:
-                self._notes = notes
-                self._storage.save_notes(self._notes)  # Persist to default location
+                self._set_notes(notes, keep_trash=True)
+                self._storage.save_notes(self._stored_notes())  # Persist to default location
+                self._backup_source = self._storage.notes_checksum
                 self._notify_notes_changed()
                 return True
             return False
@@ -129,5 +691,5 @@ class MainViewModel:
 
     def _save_and_notify(self) -> None:
         """Save to storage and notify listeners (repopulate notes list)."""
-        self._storage.save_notes(self._notes)
+        self._storage.save_notes(self._stored_notes())
         self._notify_notes_changed()
@@ -0,0 +1,261 @@
+"""
+UndoHistory - Undo/redo steps recorded as minimal per-field changes.
+
+Views edit Note attributes in place and then report which fields changed, so the
+history keeps a shadow copy of each note's tracked field values to diff against.
+Text fields are stored as splices (position, removed, inserted) rather than whole
+values, and consecutive typing in one field is coalesced into word-sized steps.
+The history is bounded by an estimate of the memory its steps hold, not by a step
+count: the oldest steps are dropped once the budget is exceeded.
+"""
+
+import sys
+import time
+from collections import deque
+from operator import attrgetter
+from typing import NamedTuple
+
+from models.note import Note
+from services.version_store import common_affixes
+
+
+class TextEdit(NamedTuple):
+    """Replace removed at pos with inserted in a text field."""
+    note_id: str
+    field: str
+    pos: int
+    removed: str
+    inserted: str
+
+
+class FieldEdit(NamedTuple):
+    """Set a non-text field from old to new."""
+    note_id: str
+    field: str
+    old: object
+    new: object
+
+
+class NoteInsert(NamedTuple):
+    """Insert a note (encoded with to_dict) at index."""
+    index: int
+    data: dict
+
+
+class NoteRemove(NamedTuple):
+    """Remove the note at index (data keeps it encoded for the inverse)."""
+    index: int
+    data: dict
+
+
+class NoteTrash(NamedTuple):
+    """Move the note at index to the trash."""
+    note_id: str
+    index: int
+
+
+class NoteUntrash(NamedTuple):
+    """Restore a note from the trash to index."""
+    note_id: str
+    index: int
+
+
+class TaskInsert(NamedTuple):
+    note_id: str
+    index: int
+    data: dict
+
+
+class TaskRemove(NamedTuple):
+    note_id: str
+    index: int
+    data: dict
+
+
+_INVERSE = {NoteInsert: NoteRemove, NoteRemove: NoteInsert, NoteTrash: NoteUntrash, NoteUntrash: NoteTrash,
+            TaskInsert: TaskRemove, TaskRemove: TaskInsert}
+
+
+def invert(change):
+    """The change that undoes change."""
+    if type(change) is TextEdit:
+        return change._replace(removed=change.inserted, inserted=change.removed)
+    if type(change) is FieldEdit:
+        return change._replace(old=change.new, new=change.old)
+    return _INVERSE[type(change)](*change)
+
+
+def _size(value) -> int:
+    """Approximate bytes held by value (strings, numbers and encoded notes)."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_size(k) + _size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class _Step:
+    """One undoable user action: changes applied in order, plus coalescing state."""
+
+    __slots__ = ("changes", "size", "at", "open")
+
+    def __init__(self, changes: list, open_: bool):
+        self.changes = changes
+        self.size = sum(_size(c) for c in changes)
+        self.at = time.monotonic()
+        self.open = open_  # Later edits of the same field may still merge into this step
+
+
+class UndoHistory:
+    """Undo and redo stacks of steps, plus the shadow values needed to diff edits."""
+
+    TRACKED_FIELDS = ("title", "content", "color", "due_date", "status", "completed", "width", "height")
+    TEXT_FIELDS = frozenset({"title", "content"})
+    BUDGET_BYTES = 4 * 2**20
+    COALESCE_SECONDS = 2.0  # Pause after which typing starts a new step
+    WORD_MAX = 32  # Longer insertions (pastes) are steps of their own
+
+    _values = staticmethod(attrgetter(*TRACKED_FIELDS))
+    _field_index = {name: i for i, name in enumerate(TRACKED_FIELDS)}
+
+    def __init__(self, budget_bytes: int | None = None):
+        self.budget_bytes = budget_bytes or self.BUDGET_BYTES
+        self._undo: deque[_Step] = deque()
+        self._redo: list[_Step] = []
+        self._size = 0  # Bytes held by steps on both stacks
+        self._shadow: dict[str, tuple] = {}  # note id -> last recorded TRACKED_FIELDS values
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes held by the recorded steps."""
+        return self._size
+
+    def reset(self, notes: list[Note]) -> None:
+        """Forget all steps and take new shadow values (the notes were replaced wholesale)."""
+        self.clear()
+        self._shadow = dict(zip(map(attrgetter("id"), notes), map(self._values, notes)))
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    def track(self, note: Note) -> None:
+        """Take the note's current values as its shadow (after the note was added or changed)."""
+        self._shadow[note.id] = self._values(note)
+
+    def forget(self, note_id: str) -> None:
+        self._shadow.pop(note_id, None)
+
+    def previous_values(self, note_id: str) -> dict | None:
+        """Tracked field values as last recorded (i.e. before the change being reported)."""
+        values = self._shadow.get(note_id)
+        return dict(zip(self.TRACKED_FIELDS, values)) if values is not None else None
+
+    def record_update(self, note: Note, fields: frozenset[str] | None) -> None:
+        """Diff the note against its shadow values and record the changed fields."""
+        changes = self.diff(note, fields)
+        if changes and not (len(changes) == 1 and self._coalesce(changes[0])):
+            self._push(changes, open_=len(changes) == 1 and not self._ends_word(changes[0]))
+
+    def diff(self, note: Note, fields: frozenset[str] | None) -> list:
+        """Changes from the note's shadow values to its current ones (which become the
+        shadow), without recording them.
+        """
+        old_values = self._shadow.get(note.id)
+        new_values = self._values(note)
+        self._shadow[note.id] = new_values
+        if old_values is None:
+            return []
+        changes = []
+        for name in self.TRACKED_FIELDS if fields is None else fields:
+            i = self._field_index.get(name)
+            if i is None or old_values[i] == new_values[i]:
+                continue
+            old, new = old_values[i], new_values[i]
+            if name in self.TEXT_FIELDS:
+                prefix, suffix = common_affixes(old, new)
+                changes.append(TextEdit(note.id, name, prefix, old[prefix:len(old) - suffix],
+                                        new[prefix:len(new) - suffix]))
+            else:
+                changes.append(FieldEdit(note.id, name, old, new))
+        return changes
+
+    def record(self, *changes) -> None:
+        """Record changes (e.g. a note insert/remove/trash or task insert/remove) as one step."""
+        self._push(list(changes), open_=False)
+
+    def _ends_word(self, change) -> bool:
+        """Whether change closes its step: a word was finished, or it was not typing."""
+        if type(change) is not TextEdit:
+            return False
+        if change.removed and change.inserted:
+            return True  # Replacement (e.g. typing over a selection)
+        text = change.inserted or change.removed
+        return len(text) > self.WORD_MAX or text[-1:].isspace()
+
+    def _coalesce(self, change) -> bool:
+        """Merge change into the open step on top of the undo stack, if it continues it."""
+        if self._redo or not self._undo:
+            return False
+        top = self._undo[-1]
+        if not top.open or time.monotonic() - top.at > self.COALESCE_SECONDS or len(top.changes) != 1:
+            return False
+        prev = top.changes[0]
+        if type(prev) is not type(change) or prev.note_id != change.note_id or prev.field != change.field:
+            return False
+        if type(change) is FieldEdit:
+            merged = prev._replace(new=change.new)
+        elif len(change.inserted or change.removed) > self.WORD_MAX:
+            return False  # Paste or cut
+        elif not prev.removed and not change.removed and change.pos == prev.pos + len(prev.inserted):
+            merged = prev._replace(inserted=prev.inserted + change.inserted)  # Typing on
+        elif not prev.inserted and not change.inserted and change.pos + len(change.removed) == prev.pos:
+            merged = prev._replace(pos=change.pos, removed=change.removed + prev.removed)  # Backspace
+        elif not prev.inserted and not change.inserted and change.pos == prev.pos:
+            merged = prev._replace(removed=prev.removed + change.removed)  # Delete key
+        else:
+            return False
+        self._size -= top.size
+        top.changes[0] = merged
+        top.size = _size(merged)
+        top.at = time.monotonic()
+        top.open = not self._ends_word(change)
+        self._size += top.size
+        return True
+
+    def _push(self, changes: list, open_: bool) -> None:
+        for step in self._redo:
+            self._size -= step.size
+        self._redo.clear()
+        step = _Step(changes, open_)
+        self._undo.append(step)
+        self._size += step.size
+        # Drop the oldest steps over budget, but always keep the newest one
+        while self._size > self.budget_bytes and len(self._undo) > 1:
+            self._size -= self._undo.popleft().size
+
+    def pop_undo(self) -> list | None:
+        """Changes that revert the newest step (moving it to the redo stack), or None."""
+        if not self._undo:
+            return None
+        step = self._undo.pop()
+        step.open = False
+        self._redo.append(step)
+        return [invert(c) for c in reversed(step.changes)]
+
+    def pop_redo(self) -> list | None:
+        """Changes that re-apply the most recently undone step, or None."""
+        if not self._redo:
+            return None
+        step = self._redo.pop()
+        self._undo.append(step)
+        return list(step.changes)
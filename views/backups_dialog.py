@@ -0,0 +1,72 @@
+"""
+BackupsDialog - Lists backup generations and restores one (tkinter).
+"""
+
+import tkinter as tk
+from datetime import datetime
+from tkinter import messagebox
+
+
+class BackupsDialog:
+    """Modal dialog: backup generations newest first, Back up now and Restore buttons."""
+
+    def __init__(self, parent, viewmodel):
+        self.restored = False
+        self.viewmodel = viewmodel
+        self._generations: list[dict] = []
+        self._win = tk.Toplevel(parent)
+        self._win.title("Backups")
+        self._win.transient(parent)
+        self._win.grab_set()
+        self._win.geometry("360x360")
+        self._build_ui()
+        self._win.wait_window()
+
+    def _build_ui(self) -> None:
+        buttons = tk.Frame(self._win, padx=8, pady=6)
+        buttons.pack(side=tk.BOTTOM, fill=tk.X)
+        self._restore_btn = tk.Button(buttons, text="Restore", state=tk.DISABLED, command=self._on_restore)
+        self._restore_btn.pack(side=tk.RIGHT, padx=4)
+        tk.Button(buttons, text="Close", command=self._win.destroy).pack(side=tk.RIGHT, padx=4)
+        tk.Button(buttons, text="Back up now", command=self._on_backup).pack(side=tk.LEFT, padx=4)
+
+        self._list = tk.Listbox(self._win, exportselection=False, activestyle=tk.NONE)
+        self._list.pack(fill=tk.BOTH, expand=True, padx=8, pady=(8, 0))
+        self._list.bind("<<ListboxSelect>>", self._on_select)
+        self._fill()
+
+    def _fill(self) -> None:
+        self._generations = self.viewmodel.backup_generations()
+        self._list.delete(0, tk.END)
+        for generation in self._generations:
+            label = datetime.fromtimestamp(generation["created"]).strftime("%Y-%m-%d %H:%M")
+            self._list.insert(tk.END, f"{label}  ({generation['count']} notes)")
+        if not self._generations:
+            self._list.insert(tk.END, "No backups yet.")
+        self._restore_btn.configure(state=tk.DISABLED)
+
+    def _on_select(self, event=None) -> None:
+        state = tk.NORMAL if self._generations and self._list.curselection() else tk.DISABLED
+        self._restore_btn.configure(state=state)
+
+    def _on_backup(self) -> None:
+        try:
+            self.viewmodel.backup()
+        except (IOError, OSError):
+            messagebox.showerror("Backup failed", "Could not write the backup.", parent=self._win)
+        self._fill()
+
+    def _on_restore(self) -> None:
+        selection = self._list.curselection()
+        if not selection:
+            return
+        generation = self._generations[selection[0]]
+        label = datetime.fromtimestamp(generation["created"]).strftime("%Y-%m-%d %H:%M")
+        if not messagebox.askyesno("Restore backup", f"Replace all notes with the backup from {label}?\n"
+                                   "The current notes are backed up first.", parent=self._win):
+            return
+        if self.viewmodel.restore_backup(generation["id"]):
+            self.restored = True
+            self._win.destroy()
+        else:
+            messagebox.showerror("Restore failed", "Could not restore this backup.", parent=self._win)
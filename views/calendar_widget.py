@@ -8,16 +8,22 @@ import tkinter as tk
 from datetime import datetime
 from typing import Callable
 
+from services.metrics import timed
+
 
 class CalendarWidget(tk.Frame):
     """Shows one month with prev/next and optional highlight for days with due notes."""
 
-    def __init__(self, parent, get_notes_with_due: Callable[[], list], **kwargs):
+    def __init__(self, parent, get_notes_with_due: Callable[[], list],
+                 get_due_days: Callable[[int, int], set[int]] | None = None, **kwargs):
         super().__init__(parent, **kwargs)
         self.get_notes_with_due = get_notes_with_due
+        # Optional fast path: (year, month) -> days with notes due, instead of scanning notes
+        self.get_due_days = get_due_days
         self._year = datetime.now().year
         self._month = datetime.now().month
         self._day_buttons: list[tk.Button] = []
+        self._refresh_pending: str | None = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -41,6 +47,7 @@ class CalendarWidget(tk.Frame):
         self._days_frame.pack(fill=tk.BOTH, expand=True)
         self._refresh_calendar()
 
+    @timed("calendar.refresh")
     def _refresh_calendar(self) -> None:
         self._month_label.config(text=datetime(self._year, self._month, 1).strftime("%B %Y"))
         for w in self._days_frame.winfo_children():
@@ -49,17 +56,7 @@ class CalendarWidget(tk.Frame):
         cal = calendar.Calendar(calendar.MONDAY)
         weeks = cal.monthdayscalendar(self._year, self._month)
         today = datetime.now()
-        due_days = set()
-        for note in self.get_notes_with_due():
-            if note.due_date:
-                try:
-                    parts = note.due_date.split("-")
-                    if len(parts) == 3:
-                        y, m, d = int(parts[0]), int(parts[1]), int(parts[2])
-                        if y == self._year and m == self._month:
-                            due_days.add(d)
-                except (ValueError, IndexError):
-                    pass
+        due_days = self._due_days()
         for row, week in enumerate(weeks):
             for col, d in enumerate(week):
                 if d == 0:
@@ -76,6 +73,23 @@ class CalendarWidget(tk.Frame):
                     btn.configure(bg="#C8E6C9", fg="#2E7D32")  # Green for days with due notes
                 self._day_buttons.append(btn)
 
+    def _due_days(self) -> set[int]:
+        """Days of the shown month that have notes due."""
+        if self.get_due_days is not None:
+            return self.get_due_days(self._year, self._month)
+        due_days = set()
+        for note in self.get_notes_with_due():
+            if note.due_date:
+                try:
+                    parts = note.due_date.split("-")
+                    if len(parts) == 3:
+                        y, m, d = int(parts[0]), int(parts[1]), int(parts[2])
+                        if y == self._year and m == self._month:
+                            due_days.add(d)
+                except (ValueError, IndexError):
+                    pass
+        return due_days
+
     def _prev_month(self) -> None:
         if self._month == 1:
             self._year -= 1
@@ -93,5 +107,18 @@ class CalendarWidget(tk.Frame):
         self._refresh_calendar()
 
     def refresh(self) -> None:
-        """Call when notes change to update due-date highlights."""
+        """Call when notes change to update due-date highlights.
+        Requests are coalesced: at most one redraw per idle cycle.
+        """
+        if self._refresh_pending is None:
+            self._refresh_pending = self.after_idle(self._run_pending_refresh)
+
+    def _run_pending_refresh(self) -> None:
+        self._refresh_pending = None
         self._refresh_calendar()
+
+    def destroy(self) -> None:
+        if self._refresh_pending is not None:
+            self.after_cancel(self._refresh_pending)
+            self._refresh_pending = None
+        super().destroy()
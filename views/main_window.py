@@ -2,32 +2,82 @@
 MainWindow - Dashboard displaying all sticky notes in a grid layout (tkinter).
 """
 
+import logging
+import math
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from views.note_card import NoteCard
+from models.note import Note
+from services import memory_probe
+from services.memory_probe import MemoryProbe
+from services.metrics import timed
+from services.profiling import profiler
+from services.search_index import SearchIndex
+from services.watchdog import ENV_THRESHOLD_MS, LagWatchdog
+from views.note_card import NoteCard, configure_note_styles
 from views.calendar_widget import CalendarWidget
+from views.note_wall import NoteWall
+from views.metrics_panel import MetricsPanel
+from views.backups_dialog import BackupsDialog
+from views.trash_dialog import TrashDialog
+
+logger = logging.getLogger(__name__)
 
 
 class MainWindow:
     """Main dashboard window with notes grid and floating add button."""
 
-    def __init__(self, viewmodel):
+    CARD_SLOT_WIDTH = 340  # Card width plus grid padding, used to compute columns
+    CARD_SLOT_HEIGHT = Note.DEFAULT_HEIGHT + 16
+    POPULATE_BATCH_SIZE = 6  # Cards materialized per event-loop turn
+    VERSION_CHECK_MS = 30 * 1000  # How often queued note versions are written to the history
+    BACKUP_CHECK_MS = 5 * 60 * 1000  # How often to check whether a backup generation is due
+    PURGE_CHECK_MS = 10 * 60 * 1000  # How often to purge expired notes from the trash (when idle)
+
+    def __init__(self, viewmodel, started_at: float | None = None):
         self.viewmodel = viewmodel
+        self._started_at = started_at if started_at is not None else time.perf_counter()
+        self.startup_timings: dict[str, float] = {}  # first_paint_ms / interactive_ms
         self._note_cards: dict[str, NoteCard] = {}
+        self._skeletons: dict[str, tk.Frame] = {}
+        self._pending_notes: list[Note] = []
+        self._slots: dict[str, int] = {}  # Grid position of each note being populated, by id
+        self._populate_generation = 0
+        self._editor_cards: dict[str, NoteCard] = {}  # Wall mode editors, by note id
+        self._search_filter: set[str] | None = None  # Ids matching the search box, None = all
+        self._visible_cache: list[Note] | None = None  # Notes matching _search_filter, in order
+        self._search_pending: str | None = None
+        self._metrics_panel: MetricsPanel | None = None
+        self._memory_probe: MemoryProbe | None = None
         self._root = tk.Tk()
         self._root.title("Sticky Notes")
         self._root.minsize(500, 400)
         self._root.configure(bg="#f5f5f5")
+        configure_note_styles(self._root)
+        if memory_probe.ENABLED:
+            self._memory_probe = MemoryProbe(self._root, trace=True)
 
         self._setup_ui()
-        self._populate_notes()
         viewmodel.on_notes_changed(self._on_notes_changed)
+        viewmodel.on_note_updated(self._on_note_updated)
+        viewmodel.on_note_added(self._on_note_added)
+        viewmodel.on_note_removed(self._on_note_removed)
         viewmodel.on_calendar_refresh(self._on_calendar_refresh)
         self._root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._watchdog = LagWatchdog(self._root.after, threshold_ms=ENV_THRESHOLD_MS)
+        if ENV_THRESHOLD_MS is not None:
+            self._watchdog.start()
+        self._watchdog_var.set(self._watchdog.running)
 
         self._root.geometry("900x600")
         self._center_on_screen()
+        # Window shows skeletons first; cards are materialized in batches from the event loop
+        self._root.after_idle(self._on_first_paint)
+        self._populate_notes()
+        self._root.after(self.VERSION_CHECK_MS, self._on_version_timer)
+        self._root.after(self.BACKUP_CHECK_MS, self._on_backup_timer)
+        self._root.after(self.PURGE_CHECK_MS, self._on_purge_timer)
 
     def _setup_ui(self) -> None:
         # Toolbar: Save, Export, Load
@@ -46,6 +96,27 @@ class MainWindow:
                              relief=tk.FLAT, bg="#FF9800", fg="white", padx=12, pady=4, cursor="hand2")
         load_btn.pack(side=tk.LEFT, padx=4)
 
+        backups_btn = tk.Button(toolbar, text="Backups", command=self._on_backups,
+                                relief=tk.FLAT, bg="#795548", fg="white", padx=12, pady=4, cursor="hand2")
+        backups_btn.pack(side=tk.LEFT, padx=4)
+
+        trash_btn = tk.Button(toolbar, text="Trash", command=self._on_trash,
+                              relief=tk.FLAT, bg="#9E9E9E", fg="white", padx=12, pady=4, cursor="hand2")
+        trash_btn.pack(side=tk.LEFT, padx=4)
+
+        self._wall_btn = tk.Button(toolbar, text="Wall", command=self._on_toggle_wall,
+                                   relief=tk.FLAT, bg="#607D8B", fg="white", padx=12, pady=4, cursor="hand2")
+        self._wall_btn.pack(side=tk.RIGHT, padx=4)
+
+        # Search box: filters the grid (and wall) as you type
+        self._search_var = tk.StringVar()
+        search_entry = tk.Entry(toolbar, textvariable=self._search_var, font=("Segoe UI", 10),
+                                relief=tk.FLAT, width=24)
+        search_entry.pack(side=tk.RIGHT, padx=4, ipady=4)
+        self._search_entry = search_entry
+        tk.Label(toolbar, text="Search:", bg="#f5f5f5", fg="#555").pack(side=tk.RIGHT)
+        self._search_var.trace_add("write", lambda *_: self._on_search_changed())
+
         main_frame = tk.Frame(self._root, padx=16, pady=8, bg="#f5f5f5")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -56,6 +127,7 @@ class MainWindow:
         self._calendar = CalendarWidget(
             calendar_panel,
             get_notes_with_due=lambda: self.viewmodel.notes,
+            get_due_days=self.viewmodel.due_days,
         )
         self._calendar.pack(fill=tk.BOTH, expand=True)
 
@@ -68,15 +140,17 @@ class MainWindow:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=canvas.yview)
-        canvas.config(yscrollcommand=scrollbar.set)
+        canvas.config(yscrollcommand=self._on_canvas_yscroll)
+        self._scrollbar = scrollbar
 
         self._notes_container = tk.Frame(canvas, bg="#f5f5f5")
         self._canvas_window_id = canvas.create_window((0, 0), window=self._notes_container, anchor=tk.NW)
-        self._notes_container.bind("<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        self._notes_container.bind("<Configure>", self._on_container_configure)
         canvas.bind("<Configure>", lambda e: self._on_canvas_configure(e, canvas))
 
         self._canvas = canvas
+        # Read-only overview drawn on the same canvas (toggled with the Wall button)
+        self._wall = NoteWall(canvas, get_notes=self._visible_notes, on_open=self._open_note_editor)
 
         # FAB - Floating Add Button
         self._fab = tk.Button(self._root, text="+", font=("Segoe UI", 24, "bold"),
@@ -85,11 +159,93 @@ class MainWindow:
                               width=3, height=1, command=self._on_add_note)
         self._fab.place(relx=1.0, rely=1.0, anchor=tk.SE, x=-24, y=-24)
 
+        # Hidden diagnostics menu (Ctrl+Shift+D)
+        self._diagnostics_menu = tk.Menu(self._root, tearoff=0)
+        self._diagnostics_menu.add_command(label="Profile next 10 seconds", command=self._on_profile_window)
+        self._diagnostics_menu.add_command(label="Latency histograms...", command=self._on_show_metrics)
+        self._watchdog_var = tk.BooleanVar(value=False)
+        self._diagnostics_menu.add_checkbutton(label="Lag watchdog", variable=self._watchdog_var,
+                                               command=self._on_toggle_watchdog)
+        self._diagnostics_menu.add_command(label="Save stall report", command=self._on_dump_stalls)
+        self._diagnostics_menu.add_command(label="Memory snapshot", command=self._on_memory_snapshot)
+        self._root.bind_all("<Control-Key-D>", self._on_diagnostics_menu)
+
+        # Undo/redo on this window only (wall editors bind their own), not in dialogs
+        self._bind_undo_keys(self._root)
+
+    def _bind_undo_keys(self, toplevel) -> None:
+        """Note undo/redo keys for a toplevel (Text widgets are created with undo off)."""
+        toplevel.bind("<Control-z>", lambda e: self._on_undo_key(e, self._on_undo))
+        toplevel.bind("<Control-y>", lambda e: self._on_undo_key(e, self._on_redo))
+        toplevel.bind("<Control-Key-Z>", lambda e: self._on_undo_key(e, self._on_redo))
+
+    def _on_undo_key(self, event, action):
+        if event.widget is self._search_entry:
+            return None  # Typing in the search box is not a note edit
+        action()
+        return "break"
+
     def _on_canvas_configure(self, event, canvas: tk.Canvas) -> None:
         """Update scroll region and reposition notes on resize."""
+        if self._wall.active:
+            self._wall.redraw()
+            return
         canvas.itemconfig(self._canvas_window_id, width=event.width)
         self._relayout_cards()
 
+    def _on_container_configure(self, event) -> None:
+        if not self._wall.active:
+            self._canvas.configure(scrollregion=self._canvas.bbox("all"))
+
+    def _on_canvas_yscroll(self, first, last) -> None:
+        self._scrollbar.set(first, last)
+        self._wall.on_view_changed()
+
+    def _on_toggle_wall(self) -> None:
+        """Switch between the editable card grid and the canvas-drawn wall overview."""
+        if self._wall.active:
+            self._wall.hide()
+            self._canvas_window_id = self._canvas.create_window(
+                (0, 0), window=self._notes_container, anchor=tk.NW, width=self._canvas.winfo_width())
+            self._wall_btn.configure(text="Wall")
+            self._canvas.yview_moveto(0)
+            self._populate_notes()
+        else:
+            # Cards are destroyed in wall mode so huge boards cost only canvas items
+            self._sync_all_cards()
+            self._clear_cards()
+            self._canvas.delete(self._canvas_window_id)
+            self._wall_btn.configure(text="Grid")
+            self._wall.show()
+
+    def _open_note_editor(self, note) -> None:
+        """Open a real NoteCard for a note clicked on the wall."""
+        existing = self._editor_cards.get(note.id)
+        if existing is not None:
+            existing.winfo_toplevel().lift()
+            return
+        win = tk.Toplevel(self._root)
+        win.title(note.title or "Note")
+        win.transient(self._root)
+        win.configure(bg="#f5f5f5")
+
+        def close() -> None:
+            card = self._editor_cards.pop(note.id, None)
+            if card is not None:
+                card.sync_from_ui()
+            win.destroy()
+            self._wall.refresh()
+
+        def delete(n) -> None:
+            close()
+            self._on_delete_note(n)
+
+        card = NoteCard(win, note, self.viewmodel, on_delete=delete, editing=True, auto_downgrade=False)
+        card.pack(fill=tk.BOTH, expand=True)
+        self._bind_undo_keys(win)
+        self._editor_cards[note.id] = card
+        win.protocol("WM_DELETE_WINDOW", close)
+
     def _center_on_screen(self) -> None:
         self._root.update_idletasks()
         w, h = self._root.winfo_width(), self._root.winfo_height()
@@ -97,28 +253,145 @@ class MainWindow:
         y = (self._root.winfo_screenheight() - h) // 2
         self._root.geometry(f"+{x}+{y}")
 
+    def _on_first_paint(self) -> None:
+        self.startup_timings["first_paint_ms"] = (time.perf_counter() - self._started_at) * 1000
+
+    @timed("window.populate_notes")
     def _populate_notes(self) -> None:
+        """Rebuild all cards progressively: viewport first, in small batches per event-loop turn."""
         self._clear_cards()
-        for note in self.viewmodel.notes:
-            self._add_card(note)
+        self._populate_generation += 1
+        if self._wall.active:
+            self._wall.refresh()
+            return
+        notes = self.viewmodel.notes
+        first, count = self._viewport_range(len(notes))
+        # Viewport notes get skeleton placeholders and are materialized first
+        self._pending_notes = notes[first:first + count] + notes[:first] + notes[first + count:]
+        for note in notes[first:first + count]:
+            self._skeletons[note.id] = tk.Frame(
+                self._notes_container, bg="#e8e8e8", width=note.width, height=note.height)
+        # Batches grid only their own cards, at these slots; one full relayout runs at the end
+        self._slots = {note.id: i for i, note in enumerate(self._visible_notes())}
         self._relayout_cards()
+        self._schedule_populate_batch()
+
+    def _schedule_populate_batch(self) -> None:
+        # after_idle first so pending redraws happen between batches, then after(0) to run
+        self._root.after_idle(self._root.after, 0, self._populate_batch, self._populate_generation)
+
+    def _populate_batch(self, generation: int) -> None:
+        if generation != self._populate_generation:
+            return  # Superseded by a newer repopulation
+        batch = self._pending_notes[:self.POPULATE_BATCH_SIZE]
+        del self._pending_notes[:self.POPULATE_BATCH_SIZE]
+        cols = self._grid_columns()
+        for note in batch:
+            skeleton = self._skeletons.pop(note.id, None)
+            if skeleton is not None:
+                skeleton.destroy()
+            self._add_card(note)
+            slot = self._slots.get(note.id)
+            if slot is not None:  # Not hidden by the search box
+                self._grid_at(self._note_cards[note.id], slot, cols)
+        if self._pending_notes:
+            self._schedule_populate_batch()
+        else:
+            self._on_populated()
+
+    def _on_populated(self) -> None:
+        """All cards of the current population are materialized."""
+        self._slots = {}
+        self._relayout_cards()  # Notes changed while populating may have shifted slots
+        if "interactive_ms" not in self.startup_timings:
+            self.startup_timings["interactive_ms"] = (time.perf_counter() - self._started_at) * 1000
+            logger.info("Startup: first paint %.0f ms, interactive %.0f ms (%d notes)",
+                        self.startup_timings.get("first_paint_ms", 0.0),
+                        self.startup_timings["interactive_ms"], len(self._note_cards))
+        if memory_probe.ENABLED:
+            self._memory_probe.record("repopulate")
+
+    def _viewport_range(self, total: int) -> tuple[int, int]:
+        """Return (first index, count) of the notes that fit in the visible part of the grid."""
+        cols = self._grid_columns()
+        height = self._canvas.winfo_height()
+        if height <= 1:
+            height = self._root.winfo_height()
+        rows = max(1, math.ceil(height / self.CARD_SLOT_HEIGHT))
+        first_row = int(self._canvas.yview()[0] * math.ceil(total / cols))
+        first = min(first_row * cols, max(0, total - 1))
+        return first, rows * cols
+
+    def _grid_columns(self) -> int:
+        return max(1, self._root.winfo_width() // self.CARD_SLOT_WIDTH)
 
     def _clear_cards(self) -> None:
         for card in self._note_cards.values():
             card.destroy()
         self._note_cards.clear()
-
-    def _relayout_cards(self) -> None:
-        """Arrange cards in a flow grid."""
-        for w in self._notes_container.winfo_children():
-            w.grid_forget()
-        cards = list(self._note_cards.values())
-        if not cards:
+        for skeleton in self._skeletons.values():
+            skeleton.destroy()
+        self._skeletons.clear()
+        self._pending_notes = []
+        self._slots = {}
+
+    @timed("window.relayout_cards")
+    def _relayout_cards(self, start: int = 0) -> None:
+        """Arrange cards (and skeletons of cards still loading) in a flow grid by note order.
+        With start, only notes from that grid position on are moved (the ones before it
+        keep their slots, e.g. after a note was inserted or removed at start).
+        """
+        if start == 0:
+            for w in self._notes_container.winfo_children():
+                w.grid_forget()
+        if not self._note_cards and not self._skeletons:
             return
-        cols = max(1, self._root.winfo_width() // 340)
-        for i, card in enumerate(cards):
-            row, col = i // cols, i % cols
-            card.grid(row=row, column=col, padx=8, pady=8, sticky=tk.NW)
+        cols = self._grid_columns()
+        notes = self._visible_notes()
+        for i in range(start, len(notes)):
+            note = notes[i]
+            widget = self._note_cards.get(note.id)
+            if widget is None:
+                widget = self._skeletons.get(note.id)
+            if widget is not None:  # Else not materialized yet
+                self._grid_at(widget, i, cols)
+
+    @staticmethod
+    def _grid_at(widget, slot: int, cols: int) -> None:
+        widget.grid(row=slot // cols, column=slot % cols, padx=8, pady=8, sticky=tk.NW)
+
+    def _visible_notes(self) -> list:
+        """Notes shown in the grid/wall: all notes, or those matching the search box."""
+        if self._search_filter is None:
+            return self.viewmodel.notes
+        if self._visible_cache is None:
+            self._visible_cache = [n for n in self.viewmodel.notes if n.id in self._search_filter]
+        return self._visible_cache
+
+    def _on_search_changed(self) -> None:
+        # Coalesce fast typing into one search per idle cycle
+        if self._search_pending is None:
+            self._search_pending = self._root.after_idle(self._apply_search)
+
+    def _apply_search(self) -> None:
+        self._search_pending = None
+        query = self._search_var.get()
+        if query.strip():
+            # Substring matches join the results once the trigram index is built in the background
+            self.viewmodel.build_trigram_index(self._root.after, on_done=self._on_trigram_index_ready)
+            self._search_filter = {n.id for n in self.viewmodel.search(query, limit=None)}
+        else:
+            self._search_filter = None
+        self._visible_cache = None
+        if self._wall.active:
+            self._canvas.yview_moveto(0)
+            self._wall.redraw()
+        else:
+            self._relayout_cards()
+
+    def _on_trigram_index_ready(self) -> None:
+        if self._search_filter is not None:
+            self._on_search_changed()
 
     def _add_card(self, note) -> None:
         card = NoteCard(self._notes_container, note, self.viewmodel, on_delete=self._on_delete_note)
@@ -131,17 +404,80 @@ class MainWindow:
         self.viewmodel.delete_note(note)
 
     def _on_notes_changed(self) -> None:
+        self._visible_cache = None
+        if self._search_filter is not None:
+            self._on_search_changed()  # Re-run the active search against the new notes
         self._populate_notes()
         self._on_calendar_refresh()
 
+    def _on_note_updated(self, note, fields) -> None:
+        if self._search_filter is not None and (fields is None or fields & SearchIndex.INDEXED_FIELDS):
+            self._on_search_changed()  # The note may now match the search box, or no longer
+        if self._wall.active:
+            self._wall.refresh()
+
+    def _on_note_added(self, note, index) -> None:
+        """A single note was inserted: add its card instead of repopulating the grid."""
+        self._visible_cache = None
+        if self._search_filter is not None:
+            self._on_search_changed()  # Re-run the active search (it relayouts)
+        if self._wall.active:
+            self._wall.refresh()
+            return
+        self._add_card(note)
+        if self._slots:
+            return  # Still populating: gridded by the relayout when population ends
+        # Only the new card and those after it move (none when appended)
+        self._relayout_cards(start=index if self._search_filter is None else 0)
+
+    def _on_note_removed(self, note, index) -> None:
+        self._visible_cache = None
+        editor = self._editor_cards.pop(note.id, None)
+        if editor is not None:
+            editor.winfo_toplevel().destroy()
+        if self._wall.active:
+            self._wall.refresh()
+            return
+        card = self._note_cards.pop(note.id, None) or self._skeletons.pop(note.id, None)
+        if card is not None:
+            card.destroy()
+        if note in self._pending_notes:
+            self._pending_notes.remove(note)
+        if not self._slots:
+            self._relayout_cards(start=index if self._search_filter is None else 0)
+
+    def _on_undo(self) -> None:
+        self._flush_card_edits()
+        self._refresh_cards(self.viewmodel.undo())
+
+    def _on_redo(self) -> None:
+        self._flush_card_edits()
+        self._refresh_cards(self.viewmodel.redo())
+
+    def _flush_card_edits(self) -> None:
+        """Commit edits still waiting for idle, so undo sees them as the latest step."""
+        for card in (*self._note_cards.values(), *self._editor_cards.values()):
+            card.flush_edits()
+
+    def _refresh_cards(self, notes) -> None:
+        for note in notes:
+            for cards in (self._note_cards, self._editor_cards):
+                card = cards.get(note.id)
+                if card is not None:
+                    card.refresh()
+        if notes and not self._wall.active:
+            self._relayout_cards()  # Sizes may have changed
+
     def _on_calendar_refresh(self) -> None:
         if hasattr(self, "_calendar") and self._calendar.winfo_exists():
             self._calendar.refresh()
 
     def _sync_all_cards(self) -> None:
-        """Sync UI values from all note cards to the model."""
+        """Sync UI values from all note cards (and open wall editors) to the model."""
         for card in self._note_cards.values():
             card.sync_from_ui()
+        for card in self._editor_cards.values():
+            card.sync_from_ui()
 
     def _on_save(self) -> None:
         """Save all notes to default location."""
@@ -184,8 +520,82 @@ class MainWindow:
             else:
                 messagebox.showerror("Load failed", "Could not load notes from file.")
 
+    def _on_backups(self) -> None:
+        """List backup generations; restoring one replaces the notes (and repopulates)."""
+        self._sync_all_cards()
+        BackupsDialog(self._root, self.viewmodel)
+
+    def _on_version_timer(self) -> None:
+        # Edits only queue versions; the history file is written here, off the keystroke path
+        self.viewmodel.flush_due_versions()
+        self._root.after(self.VERSION_CHECK_MS, self._on_version_timer)
+
+    def _on_backup_timer(self) -> None:
+        self._sync_all_cards()
+        self.viewmodel.backup_if_due()
+        self._root.after(self.BACKUP_CHECK_MS, self._on_backup_timer)
+
+    def _on_trash(self) -> None:
+        """List deleted notes; restored notes come back through the note added event."""
+        TrashDialog(self._root, self.viewmodel)
+
+    def _on_purge_timer(self) -> None:
+        # Purging rewrites notes.json once for all expired tombstones; wait until the UI is idle
+        self._root.after_idle(self.viewmodel.purge_expired)
+        self._root.after(self.PURGE_CHECK_MS, self._on_purge_timer)
+
+    def _on_diagnostics_menu(self, event) -> None:
+        self._diagnostics_menu.tk_popup(event.x_root, event.y_root)
+        self._diagnostics_menu.grab_release()
+
+    def _on_profile_window(self) -> None:
+        """Capture a cProfile of the next 10 seconds to the profiles folder."""
+        def done(path) -> None:
+            messagebox.showinfo("Profile saved", f"Profile written to:\n{path}")
+
+        if not profiler.profile_for(10, self._root.after, on_done=done):
+            messagebox.showinfo("Profiling", "A profile is already being recorded.")
+
+    def _on_show_metrics(self) -> None:
+        panel = self._metrics_panel
+        if panel is not None and panel._win.winfo_exists():
+            panel._win.lift()
+            return
+        self._metrics_panel = MetricsPanel(self._root)
+
+    def _on_toggle_watchdog(self) -> None:
+        if self._watchdog_var.get():
+            self._watchdog.start()
+        else:
+            self._watchdog.stop()
+
+    def _on_dump_stalls(self) -> None:
+        """Write the stalls recorded so far (grouped by handler) to a JSON report."""
+        path = self._watchdog.dump()
+        count = len(self._watchdog.stalls)
+        messagebox.showinfo("Stall report", f"{count} stall(s) written to:\n{path}")
+
+    def _on_memory_snapshot(self) -> None:
+        """Snapshot widget/Tcl/object counts now and save the snapshot history."""
+        if self._memory_probe is None:
+            self._memory_probe = MemoryProbe(self._root)
+        previous = self._memory_probe.history[-1] if self._memory_probe.history else None
+        snap = self._memory_probe.snapshot("manual")
+        lines = [f"Widgets: {snap['widgets']}", f"Tcl variables: {snap['tcl_vars']}",
+                 f"Tcl commands: {snap['tcl_commands']}", f"Python objects: {sum(snap['objects'].values())}"]
+        if snap["traced_kb"] is not None:
+            lines.append(f"Traced memory: {snap['traced_kb'] / 1024:.1f} MiB")
+        if previous is not None:
+            grown = MemoryProbe.growth(previous, snap)
+            lines.append("Since last snapshot: " + ("; ".join(grown[:5]) if grown else "no growth"))
+        path = self._memory_probe.dump()
+        messagebox.showinfo("Memory snapshot", "\n".join(lines) + f"\n\nSaved to:\n{path}")
+
     def _on_close(self) -> None:
         """Save all notes and close the app."""
+        self._watchdog.stop()
+        if self._watchdog.stalls:
+            self._watchdog.dump()
         self._sync_all_cards()
         self.viewmodel.save_all()
         self._root.destroy()
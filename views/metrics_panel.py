@@ -0,0 +1,60 @@
+"""
+MetricsPanel - Diagnostics window listing hot-path latency histograms (tkinter).
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from services.metrics import ENABLED, METRICS_ENV, metrics
+
+
+class MetricsPanel:
+    """Non-modal window with one row per timed entry point; refreshes itself while open."""
+
+    COLUMNS = ("count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+    REFRESH_MS = 1000
+
+    def __init__(self, parent):
+        self._win = tk.Toplevel(parent)
+        self._win.title("Latency histograms")
+        self._win.geometry("640x320")
+        self._refresh_job: str | None = None
+        self._build_ui()
+        self._win.protocol("WM_DELETE_WINDOW", self.close)
+        self._refresh()
+
+    def _build_ui(self) -> None:
+        buttons = tk.Frame(self._win, pady=6, padx=8)
+        buttons.pack(fill=tk.X)
+        tk.Button(buttons, text="Dump JSON", command=self._on_dump).pack(side=tk.LEFT, padx=4)
+        tk.Button(buttons, text="Reset", command=self._on_reset).pack(side=tk.LEFT, padx=4)
+        if not ENABLED:
+            tk.Label(buttons, text=f"Recording is off (set {METRICS_ENV}=1 and restart)",
+                     fg="#b00").pack(side=tk.LEFT, padx=8)
+
+        self._tree = ttk.Treeview(self._win, columns=self.COLUMNS, show="tree headings")
+        self._tree.heading("#0", text="Entry point")
+        self._tree.column("#0", width=200)
+        for col in self.COLUMNS:
+            self._tree.heading(col, text=col.replace("_ms", " (ms)"))
+            self._tree.column(col, width=70, anchor=tk.E)
+        self._tree.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+
+    def _refresh(self) -> None:
+        self._tree.delete(*self._tree.get_children())
+        for name, summary in metrics.summary().items():
+            self._tree.insert("", tk.END, text=name, values=[summary[col] for col in self.COLUMNS])
+        self._refresh_job = self._win.after(self.REFRESH_MS, self._refresh)
+
+    def _on_dump(self) -> None:
+        path = metrics.dump()
+        messagebox.showinfo("Metrics saved", f"Metrics written to:\n{path}", parent=self._win)
+
+    def _on_reset(self) -> None:
+        metrics.reset()
+        self._tree.delete(*self._tree.get_children())
+
+    def close(self) -> None:
+        if self._refresh_job is not None:
+            self._win.after_cancel(self._refresh_job)
+        self._win.destroy()
@@ -9,6 +9,42 @@ from datetime import datetime
 from models.note import Note
 
 
+# Shared ttk styles for the status dropdown, one per color/status (see configure_note_styles)
+_style: ttk.Style | None = None
+_styles_ready: set[str] = set()
+
+
+def configure_note_styles(root: tk.Misc) -> None:
+    """Configure the status dropdown style of every palette color and status, once per
+    Tk root (the main window calls this at startup); cards only reference the names.
+    """
+    global _style
+    if _style is not None and _style.master is root:
+        return
+    _style = ttk.Style(root)
+    _styles_ready.clear()
+    for color in Note.COLORS:
+        for status, _ in Note.STATUS_CHOICES:
+            _configure_combobox_style(color, status)
+
+
+def combobox_style(widget: tk.Misc, color: str, status: str) -> str:
+    """Name of the shared status dropdown style for a color/status combination."""
+    configure_note_styles(widget._root())  # No-op once the app has configured them
+    name = f"{color.lstrip('#')}.{status}.Note.TCombobox"
+    if name not in _styles_ready:
+        _configure_combobox_style(color, status)  # Color outside the palette
+    return name
+
+
+def _configure_combobox_style(color: str, status: str) -> None:
+    name = f"{color.lstrip('#')}.{status}.Note.TCombobox"
+    fg = NoteCard.COMPLETED_FG if status == Note.STATUS_COMPLETED else "#000"
+    _style.configure(name, foreground=fg, background=color, fieldbackground=color)
+    _style.map(name, fieldbackground=[("readonly", color)], foreground=[("readonly", fg)])
+    _styles_ready.add(name)
+
+
 class NoteCard(tk.Frame):
     """Sticky note card with title, content, status dropdown, color picker, and delete."""
 
@@ -16,62 +52,190 @@ class NoteCard(tk.Frame):
     MIN_HEIGHT = 180
     MAX_WIDTH = 500
     MAX_HEIGHT = 600
-
-    def __init__(self, parent, note: Note, viewmodel, on_delete=None, **kwargs):
+    RESIZE_FRAME_MS = 16  # Preview throttle (~60 Hz display refresh)
+    TITLE_FONT = ("Segoe UI", 12, "bold")
+    TITLE_FONT_COMPLETED = ("Segoe UI", 12, "bold", "overstrike")
+    COMPLETED_FG = "#666"
+    SNIPPET_CHARS = 400  # Content shown by the read-mode card
+    DOWNGRADE_DELAY_MS = 5000  # Editable card returns to read mode after losing focus this long
+
+    def __init__(self, parent, note: Note, viewmodel, on_delete=None, editing: bool = False,
+                 auto_downgrade: bool = True, **kwargs):
         super().__init__(parent, **kwargs)
         self.note = note
         self.viewmodel = viewmodel
         self.on_delete = on_delete
+        self._editing = False
+        # False: stay editable when focus leaves (a card that is its window's whole content)
+        self._auto_downgrade = auto_downgrade
         self._resize_start: tuple[int, int, int, int] | None = None
+        self._content_sync_pending: str | None = None
+        self._resize_preview: tuple[int, int] | None = None
+        self._resize_frame_pending: str | None = None
+        self._downgrade_pending: str | None = None
+        self._var_traces: list[tuple[tk.StringVar, str]] = []
+        self._refreshing = False  # Set while refresh() writes model values into the widgets
 
-        self._setup_ui()
-        self._apply_color(note.color)
-        self._apply_size()
-
-    def _setup_ui(self) -> None:
         self.configure(bg="#f5f5f5")
         self.grid_propagate(False)
         self.pack_propagate(False)
+        if editing:
+            self._build_edit_mode()
+        else:
+            self._build_read_mode()
+        self._apply_color(note.color)
+        self._apply_size()
+
+    @property
+    def editing(self) -> bool:
+        """True when the full editable widget set is built."""
+        return self._editing
+
+    def _reset_widget_registry(self) -> None:
+        # Widgets recolored on color change, and (widget, normal fg) pairs dimmed on completion
+        self._bg_widgets: list[tk.Widget] = []
+        self._fg_widgets: list[tuple[tk.Widget, str]] = []
+        self._status_dropdown: ttk.Combobox | None = None
+
+    def _build_read_mode(self) -> None:
+        """Lightweight card: title, content snippet and status badge on the note color."""
+        self._reset_widget_registry()
+        self._editing = False
+        inner = self._bg(tk.Frame(self, bg=self.note.color, relief=tk.RAISED, bd=1, highlightthickness=0,
+                                  takefocus=1, cursor="xterm"))
+        inner.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self._inner = inner
+
+        header = self._bg(tk.Frame(inner, bg=self.note.color))
+        header.pack(fill=tk.X, pady=(0, 6))
+        self._status_badge = self._fg(self._bg(tk.Label(
+            header, text=self._label_for_status(self.note.status), font=("Segoe UI", 8),
+            bg=self.note.color, fg="#555", relief=tk.GROOVE, bd=1, padx=4)))
+        self._status_badge.pack(side=tk.RIGHT, padx=(4, 0))
+        self._title_widget = self._fg(self._bg(tk.Label(
+            header, text=self.note.title, font=self.TITLE_FONT, bg=self.note.color, anchor=tk.W)))
+        self._title_widget.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=2)
+
+        snippet = self.note.content[:self.SNIPPET_CHARS]
+        self._snippet = self._fg(self._bg(tk.Label(
+            inner, text=snippet, font=("Segoe UI", 10), bg=self.note.color, anchor=tk.NW, justify=tk.LEFT,
+            wraplength=max(self.MIN_WIDTH, self.note.width) - 16)))
+        self._snippet.pack(fill=tk.BOTH, expand=True, padx=2)
+
+        # Any click or keyboard focus upgrades to the editable card
+        inner.bind("<FocusIn>", lambda e: self._upgrade())
+        for w in (inner, header, self._title_widget, self._snippet, self._status_badge):
+            w.bind("<Button-1>", lambda e, w=w: self._upgrade(focus_content=w is self._snippet))
+
+        self._apply_status_style()
+
+    def _upgrade(self, focus_content: bool = False) -> None:
+        """Replace the read-mode widgets with the full editable widget set."""
+        if self._editing:
+            return
+        self._inner.destroy()
+        self._build_edit_mode()
+        self._apply_color(self.note.color)
+        (self.content_edit if focus_content else self.title_edit).focus_set()
+
+    def _downgrade(self) -> None:
+        """Sync edits to the model and go back to the lightweight read-mode card."""
+        if not self._editing:
+            return
+        self._teardown_edit_mode()
+        self._build_read_mode()
+        self._apply_color(self.note.color)
+
+    def _schedule_downgrade(self, event=None) -> None:
+        if self._downgrade_pending is not None:
+            self.after_cancel(self._downgrade_pending)
+        self._downgrade_pending = self.after(self.DOWNGRADE_DELAY_MS, self._maybe_downgrade)
+
+    def _maybe_downgrade(self) -> None:
+        self._downgrade_pending = None
+        if self._resize_start is not None:
+            return
+        # Tcl focus path (focus_get() fails on Combobox popdowns); "" = app not focused
+        focused = str(self.tk.call("focus"))
+        if not focused or focused.startswith(str(self) + "."):
+            return
+        self._downgrade()
+
+    def _teardown_edit_mode(self) -> None:
+        if self._downgrade_pending is not None:
+            self.after_cancel(self._downgrade_pending)
+            self._downgrade_pending = None
+        if self._resize_frame_pending is not None:
+            self.after_cancel(self._resize_frame_pending)
+            self._resize_frame_pending = None
+        self._resize_start = self._resize_preview = None
+        if self._content_sync_pending is not None:
+            # Keep the unsynced burst in the model; the next save persists it
+            self.after_cancel(self._content_sync_pending)
+            self._content_sync_pending = None
+            self.note.content = self.content_edit.get("1.0", tk.END).strip()
+        # Traces hold lambdas bound to this card; remove them so the card can be freed
+        for var, trace_id in self._var_traces:
+            var.trace_remove("write", trace_id)
+        self._var_traces.clear()
+        self._inner.destroy()
+
+    def _trace_write(self, var: tk.StringVar, callback) -> None:
+        self._var_traces.append((var, var.trace_add("write", lambda *_: callback())))
+
+    def _build_edit_mode(self) -> None:
+        """Full editable card: title/content editors, due date, status, color, delete and resize grip."""
+        self._reset_widget_registry()
+        self._editing = True
         # Card frame with relief
-        inner = tk.Frame(self, bg=self.note.color, relief=tk.RAISED, bd=1, highlightthickness=0)
+        inner = self._bg(tk.Frame(self, bg=self.note.color, relief=tk.RAISED, bd=1, highlightthickness=0))
         inner.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self._inner = inner
 
         # Header
-        header = tk.Frame(inner, bg=self.note.color)
+        header = self._bg(tk.Frame(inner, bg=self.note.color))
         header.pack(fill=tk.X, pady=(0, 6))
 
         self.title_var = tk.StringVar(value=self.note.title)
-        self.title_edit = tk.Entry(header, textvariable=self.title_var, font=("Segoe UI", 12, "bold"),
-                                   relief=tk.FLAT, bg=self.note.color)
+        self.title_edit = self._fg(self._bg(tk.Entry(header, textvariable=self.title_var, font=self.TITLE_FONT,
+                                                     relief=tk.FLAT, bg=self.note.color)))
         self.title_edit.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=2)
-        self.title_var.trace_add("write", lambda *_: self._on_title_changed())
+        self._trace_write(self.title_var, self._on_title_changed)
+        self._title_widget = self.title_edit
 
-        btn_frame = tk.Frame(header, bg=self.note.color)
+        btn_frame = self._bg(tk.Frame(header, bg=self.note.color))
         btn_frame.pack(side=tk.RIGHT)
 
-        self.color_btn = tk.Button(btn_frame, text="\u2699", width=2, relief=tk.FLAT, cursor="hand2",
-                                   command=self._on_color_click)
+        self.color_btn = self._fg(self._bg(tk.Button(btn_frame, text="\u2699", width=2, relief=tk.FLAT,
+                                                     cursor="hand2", command=self._on_color_click)))
         self.color_btn.pack(side=tk.LEFT, padx=2)
 
-        self.delete_btn = tk.Button(btn_frame, text="\u00D7", width=2, relief=tk.FLAT, cursor="hand2",
-                                    fg="#c00", command=lambda: self.on_delete and self.on_delete(self.note))
+        self.history_btn = self._fg(self._bg(tk.Button(btn_frame, text="\u21BA", width=2, relief=tk.FLAT,
+                                                       cursor="hand2", command=self._on_history_click)))
+        self.history_btn.pack(side=tk.LEFT, padx=2)
+
+        self.delete_btn = self._fg(self._bg(tk.Button(btn_frame, text="\u00D7", width=2, relief=tk.FLAT,
+                                                      cursor="hand2", fg="#c00",
+                                                      command=lambda: self.on_delete and self.on_delete(self.note))))
         self.delete_btn.pack(side=tk.LEFT)
 
         # Due date row
-        self.meta_frame = tk.Frame(inner, bg=self.note.color)
+        self.meta_frame = self._bg(tk.Frame(inner, bg=self.note.color))
         self.meta_frame.pack(fill=tk.X, pady=(0, 4))
 
-        tk.Label(self.meta_frame, text="Due:", font=("Segoe UI", 9), bg=self.note.color, fg="#555").pack(side=tk.LEFT, padx=(0, 4))
+        self._fg(self._bg(tk.Label(self.meta_frame, text="Due:", font=("Segoe UI", 9), bg=self.note.color,
+                                   fg="#555"))).pack(side=tk.LEFT, padx=(0, 4))
         self.due_var = tk.StringVar(value=self.note.due_date or "")
-        self.due_entry = tk.Entry(self.meta_frame, textvariable=self.due_var, font=("Segoe UI", 9),
-                                  width=12, relief=tk.FLAT, bg=self.note.color)
+        self.due_entry = self._fg(self._bg(tk.Entry(self.meta_frame, textvariable=self.due_var, font=("Segoe UI", 9),
+                                                    width=12, relief=tk.FLAT, bg=self.note.color)))
         self.due_entry.pack(side=tk.LEFT, padx=(0, 2))
-        self.due_var.trace_add("write", lambda *_: self._on_due_changed())
-        tk.Button(self.meta_frame, text="...", relief=tk.FLAT, cursor="hand2", bg=self.note.color,
-                 font=("Segoe UI", 9), command=self._pick_due_date).pack(side=tk.LEFT)
+        self._trace_write(self.due_var, self._on_due_changed)
+        self._fg(self._bg(tk.Button(self.meta_frame, text="...", relief=tk.FLAT, cursor="hand2", bg=self.note.color,
+                                    font=("Segoe UI", 9), command=self._pick_due_date))).pack(side=tk.LEFT)
 
         # Status dropdown
-        tk.Label(self.meta_frame, text="Status:", font=("Segoe UI", 9), bg=self.note.color, fg="#555").pack(side=tk.LEFT, padx=(12, 4))
+        self._fg(self._bg(tk.Label(self.meta_frame, text="Status:", font=("Segoe UI", 9), bg=self.note.color,
+                                   fg="#555"))).pack(side=tk.LEFT, padx=(12, 4))
         self._status_values = [label for _, label in Note.STATUS_CHOICES]
         self._status_var = tk.StringVar(value=self._label_for_status(self.note.status))
         self._status_dropdown = ttk.Combobox(
@@ -82,23 +246,40 @@ class NoteCard(tk.Frame):
         self._status_dropdown.bind("<<ComboboxSelected>>", self._on_status_changed)
 
         # Content
-        content_frame = tk.Frame(inner, bg=self.note.color)
+        content_frame = self._bg(tk.Frame(inner, bg=self.note.color))
         content_frame.pack(fill=tk.BOTH, expand=True)
-        self.content_edit = tk.Text(content_frame, height=4, font=("Segoe UI", 10), relief=tk.FLAT,
-                                    wrap=tk.WORD, bg=self.note.color, padx=2, pady=2)
+        self.content_edit = self._fg(self._bg(tk.Text(content_frame, height=4, font=("Segoe UI", 10), relief=tk.FLAT,
+                                                      wrap=tk.WORD, bg=self.note.color, padx=2, pady=2)))
         self.content_edit.pack(fill=tk.BOTH, expand=True)
         self.content_edit.insert("1.0", self.note.content)
-        self.content_edit.bind("<KeyRelease>", lambda e: self._on_content_changed())
+        self.content_edit.edit_modified(False)
+        # <<Modified>> fires only on real edits (not arrows/modifiers); sync is coalesced to idle
+        self.content_edit.bind("<<Modified>>", self._on_content_modified)
 
         # Resize grip - bottom-right corner
-        self._resize_grip = tk.Frame(inner, bg=self.note.color, width=16, height=16, cursor="size")
+        self._resize_grip = self._bg(tk.Frame(inner, bg=self.note.color, width=16, height=16, cursor="size"))
         self._resize_grip.place(relx=1.0, rely=1.0, anchor=tk.SE)
         self._resize_grip.bind("<Button-1>", self._on_resize_start)
         self._resize_grip.bind("<B1-Motion>", self._on_resize_drag)
         self._resize_grip.bind("<ButtonRelease-1>", self._on_resize_end)
 
+        # Losing focus for a while returns the card to read mode
+        if self._auto_downgrade:
+            for w in (self.title_edit, self.due_entry, self._status_dropdown, self.content_edit):
+                w.bind("<FocusOut>", self._schedule_downgrade, add="+")
+
         self._apply_status_style()
 
+    def _bg(self, widget: tk.Widget) -> tk.Widget:
+        """Register a widget whose background follows the note color."""
+        self._bg_widgets.append(widget)
+        return widget
+
+    def _fg(self, widget: tk.Widget) -> tk.Widget:
+        """Register a widget whose foreground is dimmed when the note is completed."""
+        self._fg_widgets.append((widget, widget.cget("fg")))
+        return widget
+
     def _label_for_status(self, status: str) -> str:
         for value, label in Note.STATUS_CHOICES:
             if value == status:
@@ -113,53 +294,90 @@ class NoteCard(tk.Frame):
 
     def sync_from_ui(self) -> None:
         """Sync current UI values to the note model (call before save on close)."""
+        if not self._editing:
+            return  # Read mode shows the model as-is
         self.note.title = self.title_var.get()
         self.note.content = self.content_edit.get("1.0", tk.END).strip()
         self.note.due_date = self.due_var.get().strip() or None
         self.note.status = self._status_from_label(self._status_var.get())
         self.note.completed = self.note.status == Note.STATUS_COMPLETED
 
+    def flush_edits(self) -> None:
+        """Hand a pending (idle-coalesced) content edit to the viewmodel now."""
+        if self._content_sync_pending is not None:
+            self.after_cancel(self._content_sync_pending)
+            self._on_content_changed()
+
+    def refresh(self) -> None:
+        """Show model values changed outside this card (e.g. by undo/redo)."""
+        self._apply_size()
+        if not self._editing:
+            self._inner.destroy()
+            self._build_read_mode()
+            self._apply_color(self.note.color)
+            return
+        self._refreshing = True
+        try:
+            if self.title_var.get() != self.note.title:
+                self.title_var.set(self.note.title)
+            if self.due_var.get() != (self.note.due_date or ""):
+                self.due_var.set(self.note.due_date or "")
+            if self.content_edit.get("1.0", tk.END).strip() != self.note.content:
+                self.content_edit.delete("1.0", tk.END)
+                self.content_edit.insert("1.0", self.note.content)
+            self._status_var.set(self._label_for_status(self.note.status))
+        finally:
+            self._refreshing = False
+        self._apply_color(self.note.color)
+        self._apply_status_style()
+
     def _on_title_changed(self) -> None:
+        if self._refreshing:
+            return
         self.note.title = self.title_var.get()
-        self.viewmodel.update_note(self.note)
+        self.viewmodel.update_note(self.note, {"title"})
+
+    def _on_content_modified(self, event=None) -> None:
+        """Text modified flag was set: schedule one sync for the whole burst of edits."""
+        if not self.content_edit.edit_modified():
+            return  # Event raised by our own flag reset
+        self.content_edit.edit_modified(False)
+        if self._content_sync_pending is None:
+            self._content_sync_pending = self.after_idle(self._on_content_changed)
 
     def _on_content_changed(self) -> None:
-        self.note.content = self.content_edit.get("1.0", tk.END).strip()
-        self.viewmodel.update_note(self.note)
+        self._content_sync_pending = None
+        content = self.content_edit.get("1.0", tk.END).strip()
+        if content == self.note.content:
+            return
+        self.note.content = content
+        self.viewmodel.update_note(self.note, {"content"})
+
+    def destroy(self) -> None:
+        if self._editing:
+            self._teardown_edit_mode()
+        super().destroy()
 
     def _on_due_changed(self) -> None:
+        if self._refreshing:
+            return
         self.note.due_date = self.due_var.get().strip() or None
-        self.viewmodel.update_note(self.note)
+        self.viewmodel.update_note(self.note, {"due_date"})
 
     def _on_status_changed(self, event=None) -> None:
         self.note.status = self._status_from_label(self._status_var.get())
         self.note.completed = self.note.status == Note.STATUS_COMPLETED
-        self.viewmodel.update_note(self.note)
+        self.viewmodel.update_note(self.note, {"status", "completed"})
         self._apply_status_style()
 
     def _apply_status_style(self) -> None:
         """Dim and strikethrough title when status is Completed."""
-        if self.note.status != Note.STATUS_COMPLETED:
-            if hasattr(self, "title_edit"):
-                self.title_edit.configure(fg="#000", font=("Segoe UI", 12, "bold"))
-            return
-        # Completed: grey out and strikethrough title
-        for w in self.winfo_children():
-            self._set_fg_recursive(w, "#666")
-        if hasattr(self, "title_edit"):
-            self.title_edit.configure(fg="#666")
-        try:
-            self.title_edit.configure(font=("Segoe UI", 12, "bold overstrike"))
-        except tk.TclError:
-            self.title_edit.configure(font=("Segoe UI", 12, "bold"))
-
-    def _set_fg_recursive(self, w, color: str) -> None:
-        try:
-            w.configure(fg=color)
-        except (tk.TclError, AttributeError):
-            pass
-        for c in w.winfo_children():
-            self._set_fg_recursive(c, color)
+        completed = self.note.status == Note.STATUS_COMPLETED
+        for w, fg in self._fg_widgets:
+            w.configure(fg=self.COMPLETED_FG if completed else fg)
+        self._title_widget.configure(font=self.TITLE_FONT_COMPLETED if completed else self.TITLE_FONT)
+        if self._status_dropdown is not None:
+            self._status_dropdown.configure(style=combobox_style(self, self.note.color, self.note.status))
 
     def _pick_due_date(self) -> None:
         """Open a simple calendar popup to pick due date."""
@@ -178,7 +396,14 @@ class NoteCard(tk.Frame):
         if result:
             self.due_var.set(result)
             self.note.due_date = result
-            self.viewmodel.update_note(self.note)
+            self.viewmodel.update_note(self.note, {"due_date"})
+
+    def _on_history_click(self) -> None:
+        """Browse stored versions of the note and optionally roll back to one."""
+        from views.version_history import VersionHistoryDialog
+        self.flush_edits()
+        if VersionHistoryDialog(self, self.viewmodel, self.note).restored:
+            self.refresh()
 
     def _on_color_click(self) -> None:
         color = self.viewmodel.cycle_note_color(self.note)
@@ -193,50 +418,42 @@ class NoteCard(tk.Frame):
 
     def _on_resize_start(self, event) -> None:
         self._resize_start = (event.x_root, event.y_root, self.note.width, self.note.height)
+        self._resize_preview = None
 
     def _on_resize_drag(self, event) -> None:
+        """Preview only: remember the size and redraw at most once per display frame."""
         if self._resize_start is None:
             return
         dx = event.x_root - self._resize_start[0]
         dy = event.y_root - self._resize_start[1]
         w = max(self.MIN_WIDTH, min(self.MAX_WIDTH, self._resize_start[2] + dx))
         h = max(self.MIN_HEIGHT, min(self.MAX_HEIGHT, self._resize_start[3] + dy))
-        self.note.width, self.note.height = int(w), int(h)
-        self.configure(width=self.note.width, height=self.note.height)
-        self.viewmodel.update_note(self.note)
+        self._resize_preview = (int(w), int(h))
+        if self._resize_frame_pending is None:
+            self._resize_frame_pending = self.after(self.RESIZE_FRAME_MS, self._draw_resize_preview)
+
+    def _draw_resize_preview(self) -> None:
+        self._resize_frame_pending = None
+        if self._resize_preview is not None:
+            # Only this card is reconfigured; grid reflows its own row/column
+            self.configure(width=self._resize_preview[0], height=self._resize_preview[1])
 
     def _on_resize_end(self, event) -> None:
+        """Commit the previewed size: one model update and save per drag."""
+        if self._resize_frame_pending is not None:
+            self.after_cancel(self._resize_frame_pending)
+            self._resize_frame_pending = None
+        preview, self._resize_preview = self._resize_preview, None
         self._resize_start = None
+        if preview is None or preview == (self.note.width, self.note.height):
+            return
+        self.note.width, self.note.height = preview
+        self._apply_size()
+        self.viewmodel.update_note(self.note, {"width", "height"})
 
     def _apply_color(self, color: str) -> None:
         self.note.color = color
-        for w in self.winfo_children():
-            self._set_bg_recursive(w, color)
-        if hasattr(self, "content_edit"):
-            self.content_edit.configure(bg=color)
-        if hasattr(self, "title_edit"):
-            self.title_edit.configure(bg=color)
-        if hasattr(self, "color_btn"):
-            self.color_btn.configure(bg=color)
-        if hasattr(self, "delete_btn"):
-            self.delete_btn.configure(bg=color)
-        if hasattr(self, "_resize_grip"):
-            self._resize_grip.configure(bg=color)
-        if hasattr(self, "due_entry"):
-            self.due_entry.configure(bg=color)
-        if hasattr(self, "meta_frame"):
-            self.meta_frame.configure(bg=color)
-        # Update inner frame
-        for c in self.winfo_children():
-            if isinstance(c, tk.Frame):
-                c.configure(bg=color)
-                for cc in c.winfo_children():
-                    self._set_bg_recursive(cc, color)
-
-    def _set_bg_recursive(self, w, color: str) -> None:
-        try:
+        for w in self._bg_widgets:
             w.configure(bg=color)
-        except tk.TclError:
-            pass
-        for c in w.winfo_children():
-            self._set_bg_recursive(c, color)
+        if self._status_dropdown is not None:
+            self._status_dropdown.configure(style=combobox_style(self, color, self.note.status))
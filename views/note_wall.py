@@ -0,0 +1,159 @@
+"""
+NoteWall - Read-only overview that draws notes as canvas items (tkinter).
+Only the visible rows are drawn, so very large boards scroll smoothly.
+"""
+
+import tkinter as tk
+from typing import Callable
+
+from models.note import Note
+
+
+class NoteWall:
+    """Draws each note as a rectangle, title, snippet and status marker on an existing canvas."""
+
+    TILE_WIDTH = 180
+    TILE_HEIGHT = 110
+    GAP = 12
+    TITLE_CHARS = 24
+    SNIPPET_CHARS = 90
+    OVERSCAN_ROWS = 1  # Extra rows drawn above/below the viewport
+    TAG = "wall"
+
+    STATUS_MARKER_COLORS = {
+        Note.STATUS_NEW: "#2196F3",
+        Note.STATUS_IN_PROGRESS: "#FF9800",
+        Note.STATUS_COMPLETED: "#4CAF50",
+        Note.STATUS_DEFERRED: "#9E9E9E",
+    }
+
+    def __init__(self, canvas: tk.Canvas, get_notes: Callable[[], list[Note]],
+                 on_open: Callable[[Note], None]):
+        self._canvas = canvas
+        self.get_notes = get_notes
+        self.on_open = on_open
+        self._active = False
+        self._drawn_rows: tuple[int, int, int, int] | None = None  # (first, last, cols, total)
+        self._redraw_pending: str | None = None
+        self._bindings: list[tuple[str, str]] = []
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def show(self) -> None:
+        """Start drawing the wall on the canvas and handle clicks and mouse wheel."""
+        if self._active:
+            return
+        self._active = True
+        self._canvas.configure(yscrollincrement=(self.TILE_HEIGHT + self.GAP) // 2)
+        for sequence, handler in (("<Button-1>", self._on_click),
+                                  ("<MouseWheel>", self._on_wheel),
+                                  ("<Button-4>", self._on_wheel),
+                                  ("<Button-5>", self._on_wheel)):
+            self._bindings.append((sequence, self._canvas.bind(sequence, handler, add="+")))
+        self._canvas.yview_moveto(0)
+        self.redraw()
+
+    def hide(self) -> None:
+        """Remove all wall items and bindings from the canvas."""
+        if not self._active:
+            return
+        self._active = False
+        if self._redraw_pending is not None:
+            self._canvas.after_cancel(self._redraw_pending)
+            self._redraw_pending = None
+        for sequence, func_id in self._bindings:
+            self._canvas.unbind(sequence, func_id)
+        self._bindings.clear()
+        self._canvas.delete(self.TAG)
+        self._canvas.configure(yscrollincrement=0)
+        self._drawn_rows = None
+
+    def refresh(self) -> None:
+        """Notes changed: redraw once at idle time (coalesces bursts of changes)."""
+        if self._active and self._redraw_pending is None:
+            self._redraw_pending = self._canvas.after_idle(self.redraw)
+
+    def redraw(self) -> None:
+        """Redraw the visible rows and update the scroll region."""
+        self._redraw_pending = None
+        if not self._active:
+            return
+        self._drawn_rows = None
+        self._draw_visible()
+
+    def on_view_changed(self) -> None:
+        """Canvas scrolled or resized: draw again only if the visible rows changed."""
+        if self._active:
+            self._draw_visible()
+
+    def _columns(self) -> int:
+        return max(1, (self._canvas.winfo_width() - self.GAP) // (self.TILE_WIDTH + self.GAP))
+
+    def _draw_visible(self) -> None:
+        notes = self.get_notes()
+        cols = self._columns()
+        pitch = self.TILE_HEIGHT + self.GAP
+        total_rows = (len(notes) + cols - 1) // cols
+        width = self._canvas.winfo_width()
+        self._canvas.configure(scrollregion=(0, 0, width, max(total_rows * pitch + self.GAP,
+                                                              self._canvas.winfo_height())))
+        top = self._canvas.canvasy(0)
+        bottom = self._canvas.canvasy(self._canvas.winfo_height())
+        first = max(0, int(top // pitch) - self.OVERSCAN_ROWS)
+        last = min(total_rows - 1, int(bottom // pitch) + self.OVERSCAN_ROWS)
+        rows = (first, last, cols, len(notes))
+        if rows == self._drawn_rows:
+            return
+        self._drawn_rows = rows
+        self._canvas.delete(self.TAG)
+        for row in range(first, last + 1):
+            for col in range(cols):
+                i = row * cols + col
+                if i >= len(notes):
+                    break
+                self._draw_tile(notes[i], row, col)
+
+    def _draw_tile(self, note: Note, row: int, col: int) -> None:
+        c = self._canvas
+        x = self.GAP + col * (self.TILE_WIDTH + self.GAP)
+        y = self.GAP + row * (self.TILE_HEIGHT + self.GAP)
+        completed = note.status == Note.STATUS_COMPLETED
+        c.create_rectangle(x, y, x + self.TILE_WIDTH, y + self.TILE_HEIGHT,
+                           fill=note.color, outline="#d0d0d0", tags=self.TAG)
+        marker = self.STATUS_MARKER_COLORS.get(note.status, "#9E9E9E")
+        c.create_oval(x + self.TILE_WIDTH - 16, y + 8, x + self.TILE_WIDTH - 8, y + 16,
+                      fill=marker, outline="", tags=self.TAG)
+        c.create_text(x + 8, y + 6, anchor=tk.NW, text=self._truncate(note.title, self.TITLE_CHARS),
+                      font=("Segoe UI", 10, "bold overstrike" if completed else "bold"),
+                      fill="#666" if completed else "#000", tags=self.TAG)
+        c.create_text(x + 8, y + 28, anchor=tk.NW, width=self.TILE_WIDTH - 16,
+                      text=self._truncate(note.content, self.SNIPPET_CHARS),
+                      font=("Segoe UI", 9), fill="#444", tags=self.TAG)
+
+    @staticmethod
+    def _truncate(text: str, limit: int) -> str:
+        return text if len(text) <= limit else text[:limit - 1] + "…"
+
+    def note_at(self, x: float, y: float) -> Note | None:
+        """Hit-test canvas coordinates against the tile grid (O(1), no item lookup)."""
+        col, dx = divmod(x - self.GAP, self.TILE_WIDTH + self.GAP)
+        row, dy = divmod(y - self.GAP, self.TILE_HEIGHT + self.GAP)
+        cols = self._columns()
+        if col < 0 or row < 0 or col >= cols or dx > self.TILE_WIDTH or dy > self.TILE_HEIGHT:
+            return None
+        i = int(row) * cols + int(col)
+        notes = self.get_notes()
+        return notes[i] if i < len(notes) else None
+
+    def _on_click(self, event) -> None:
+        note = self.note_at(self._canvas.canvasx(event.x), self._canvas.canvasy(event.y))
+        if note is not None:
+            self.on_open(note)
+
+    def _on_wheel(self, event) -> None:
+        if event.num == 4 or event.delta > 0:
+            self._canvas.yview_scroll(-1, "units")
+        else:
+            self._canvas.yview_scroll(1, "units")
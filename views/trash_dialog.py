@@ -0,0 +1,76 @@
+"""
+TrashDialog - Lists deleted notes with restore and permanent delete (tkinter).
+"""
+
+import tkinter as tk
+from datetime import datetime
+from tkinter import messagebox
+
+
+class TrashDialog:
+    """Modal dialog: deleted notes, most recent first, with Restore / Delete forever / Empty trash."""
+
+    def __init__(self, parent, viewmodel):
+        self.viewmodel = viewmodel
+        self._notes = []
+        self._win = tk.Toplevel(parent)
+        self._win.title("Trash")
+        self._win.transient(parent)
+        self._win.grab_set()
+        self._win.geometry("420x360")
+        self._build_ui()
+        self._win.wait_window()
+
+    def _build_ui(self) -> None:
+        days = self.viewmodel.TRASH_KEEP_SECONDS // 86400
+        tk.Label(self._win, text=f"Deleted notes are removed for good after {days} days.",
+                 fg="#555", anchor=tk.W).pack(fill=tk.X, padx=8, pady=(8, 0))
+
+        buttons = tk.Frame(self._win, padx=8, pady=6)
+        buttons.pack(side=tk.BOTTOM, fill=tk.X)
+        self._restore_btn = tk.Button(buttons, text="Restore", state=tk.DISABLED, command=self._on_restore)
+        self._restore_btn.pack(side=tk.RIGHT, padx=4)
+        self._purge_btn = tk.Button(buttons, text="Delete forever", state=tk.DISABLED, command=self._on_purge)
+        self._purge_btn.pack(side=tk.RIGHT, padx=4)
+        tk.Button(buttons, text="Close", command=self._win.destroy).pack(side=tk.RIGHT, padx=4)
+        tk.Button(buttons, text="Empty trash", command=self._on_empty).pack(side=tk.LEFT, padx=4)
+
+        self._list = tk.Listbox(self._win, selectmode=tk.EXTENDED, exportselection=False, activestyle=tk.NONE)
+        self._list.pack(fill=tk.BOTH, expand=True, padx=8, pady=(4, 0))
+        self._list.bind("<<ListboxSelect>>", self._on_select)
+        self._fill()
+
+    def _fill(self) -> None:
+        self._notes = self.viewmodel.trash
+        self._list.delete(0, tk.END)
+        for note in self._notes:
+            deleted = datetime.fromtimestamp(note.deleted_at).strftime("%Y-%m-%d %H:%M")
+            self._list.insert(tk.END, f"{deleted}  {note.title or '(untitled)'}")
+        if not self._notes:
+            self._list.insert(tk.END, "The trash is empty.")
+        self._on_select()
+
+    def _selected(self) -> list:
+        return [self._notes[i] for i in self._list.curselection()] if self._notes else []
+
+    def _on_select(self, event=None) -> None:
+        state = tk.NORMAL if self._selected() else tk.DISABLED
+        self._restore_btn.configure(state=state)
+        self._purge_btn.configure(state=state)
+
+    def _on_restore(self) -> None:
+        self.viewmodel.restore_notes(self._selected())
+        self._fill()
+
+    def _on_purge(self) -> None:
+        notes = self._selected()
+        if notes and messagebox.askyesno("Delete forever", f"Permanently delete {len(notes)} note(s)?",
+                                         parent=self._win):
+            self.viewmodel.purge_notes(notes)
+            self._fill()
+
+    def _on_empty(self) -> None:
+        if self._notes and messagebox.askyesno("Empty trash", "Permanently delete all notes in the trash?",
+                                               parent=self._win):
+            self.viewmodel.purge_notes()
+            self._fill()
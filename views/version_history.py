@@ -0,0 +1,79 @@
+"""
+VersionHistoryDialog - Lists stored versions of a note with a preview and restore (tkinter).
+"""
+
+import tkinter as tk
+from datetime import datetime
+
+
+class VersionHistoryDialog:
+    """Modal dialog: versions newest first, preview of the selected one, Restore button."""
+
+    def __init__(self, parent, viewmodel, note):
+        self.restored = False
+        self.viewmodel = viewmodel
+        self.note = note
+        self._versions = viewmodel.note_versions(note)[::-1]  # Newest first
+        self._win = tk.Toplevel(parent)
+        self._win.title(f"History - {note.title or 'Note'}")
+        self._win.transient(parent)
+        self._win.grab_set()
+        self._win.geometry("560x360")
+        self._build_ui()
+        self._win.wait_window()
+
+    def _build_ui(self) -> None:
+        buttons = tk.Frame(self._win, padx=8, pady=6)
+        buttons.pack(side=tk.BOTTOM, fill=tk.X)
+        self._restore_btn = tk.Button(buttons, text="Restore this version", state=tk.DISABLED,
+                                      command=self._on_restore)
+        self._restore_btn.pack(side=tk.RIGHT, padx=4)
+        tk.Button(buttons, text="Close", command=self._win.destroy).pack(side=tk.RIGHT, padx=4)
+
+        self._list = tk.Listbox(self._win, width=24, exportselection=False, activestyle=tk.NONE)
+        self._list.pack(side=tk.LEFT, fill=tk.Y, padx=(8, 4), pady=(8, 0))
+        for i, (seq, ts) in enumerate(self._versions):
+            label = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+            self._list.insert(tk.END, f"{label}  (current)" if i == 0 else label)
+        self._list.bind("<<ListboxSelect>>", self._on_select)
+
+        self._preview = tk.Text(self._win, wrap=tk.WORD, font=("Segoe UI", 10), relief=tk.FLAT,
+                                bg="#fafafa", padx=6, pady=6)
+        self._preview.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(4, 8), pady=(8, 0))
+        if self._versions:
+            self._list.selection_set(0)
+            self._on_select()
+        else:
+            self._show("No earlier versions of this note are stored yet.")
+
+    def _show(self, text: str) -> None:
+        self._preview.configure(state=tk.NORMAL)
+        self._preview.delete("1.0", tk.END)
+        self._preview.insert("1.0", text)
+        self._preview.configure(state=tk.DISABLED)
+
+    def _selected_seq(self) -> int | None:
+        selection = self._list.curselection()
+        return self._versions[selection[0]][0] if selection else None
+
+    def _on_select(self, event=None) -> None:
+        seq = self._selected_seq()
+        version = self.viewmodel.note_version(self.note, seq) if seq is not None else None
+        if version is None:
+            self._show("")
+            self._restore_btn.configure(state=tk.DISABLED)
+            return
+        lines = [version.title or "(untitled)", ""]
+        if version.due_date:
+            lines.insert(1, f"Due: {version.due_date}")
+        lines.append(version.content)
+        lines.extend(f"[{'x' if t.checked else ' '}] {t.text}" for t in version.tasks)
+        self._show("\n".join(lines))
+        # The newest version is the note as it is now
+        self._restore_btn.configure(state=tk.NORMAL if self._list.curselection()[0] > 0 else tk.DISABLED)
+
+    def _on_restore(self) -> None:
+        seq = self._selected_seq()
+        if seq is not None and self.viewmodel.restore_note_version(self.note, seq):
+            self.restored = True
+        self._win.destroy()